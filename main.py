@@ -1,10 +1,10 @@
 """Entry point script for the Nexus application.
 
-Initiates the Textual application instance and executes the main event loop.
+Runs the application through nexus.app.main, like the `nexus` command, so
+a tool chosen with exit_on_launch replaces the process once the TUI exits.
 """
 
-from nexus.app import NexusApp
+from nexus.app import main
 
 if __name__ == "__main__":
-    app = NexusApp()
-    app.run()
+    main()
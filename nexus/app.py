@@ -3,15 +3,24 @@
 Configures the Textual application class, global bindings, and initial screen loading.
 """
 
+import threading
+from pathlib import Path
 from typing import Any, ClassVar, Callable
+from textual import work
 from textual.app import App
 from textual.binding import Binding
 from textual.theme import Theme, BUILTIN_THEMES
 from textual.command import Provider
 from textual.notifications import SeverityLevel
 from nexus.container import get_container
+from nexus.screens.project_picker import ProjectPicker
 from nexus.screens.tool_selector import ToolSelector
 from nexus.commands import ToolCommandProvider
+from nexus.registry import RegistryDiff
+from nexus.services.executor import Launch
+from nexus.services.jobs import Job
+from nexus.services.watcher import ConfigWatcher
+from nexus.widgets.tool_browser import ToolBrowser
 
 
 # Define Tokyo Night Themes using Textual's Theme system
@@ -61,9 +70,12 @@ TOKYO_NIGHT_LIGHT = Theme(
 )
 
 
-class NexusApp(App[None]):
+class NexusApp(App[Launch | None]):
     """The main Nexus application class.
 
+    The application returns the tool to launch in its place when a tool
+    with 'exit_on_launch' was chosen, and None otherwise.
+
     Attributes:
         container: The dependency injection container for application services.
     """
@@ -80,6 +92,17 @@ class NexusApp(App[None]):
         Binding("ctrl+q", "request_quit", "Quit", show=True, priority=True),
         Binding("ctrl+t", "theme", "Theme", show=True, priority=True),
         Binding("f1", "help", "Help", show=True, priority=True),
+        Binding("f2", "jobs", "Jobs", show=True, priority=True),
+        # A priority binding, so that it also works while typing in a search
+        # box. The key is taken from the 'fuzzy_search' keybinding.
+        Binding(
+            "ctrl+f",
+            "toggle_fuzzy",
+            "Fuzzy",
+            show=False,
+            priority=True,
+            id="fuzzy_search",
+        ),
         # Explicitly hide redundant defaults to ensure a singular footer.
         Binding("ctrl+c", "quit", "Quit", show=False),
         Binding("?", "help", "Help", show=False),
@@ -102,6 +125,8 @@ class NexusApp(App[None]):
             self.register_theme(theme)
 
         self.container = get_container()
+        # Serializes config reloads, so their diffs are applied in order.
+        self._reload_lock = threading.Lock()
         self._apply_bindings()
 
         # Set initial theme based on system preference
@@ -109,6 +134,101 @@ class NexusApp(App[None]):
         self.theme = dark if self.detect_system_dark() else light
 
         self.push_screen(ToolSelector())
+        self.container.jobs.subscribe(self._on_job_update)
+        self._start_config_watcher()
+        # Deferred until the first frame is drawn, so it never delays startup.
+        self.call_after_refresh(self._prewarm_projects)
+        self.call_after_refresh(self.prewarm_tool_search)
+
+    def on_unmount(self) -> None:
+        """Stops background services when the application shuts down."""
+        self._config_watcher.stop()
+        self.container.project_scan.stop()
+        self.container.git_info.shutdown()
+        self.container.jobs.unsubscribe(self._on_job_update)
+        self.container.jobs.cancel_all()
+
+    def _prewarm_projects(self) -> None:
+        """Scans the project roots in the background ahead of the picker."""
+        self.container.project_scan.start()
+
+    def _on_job_update(self, job: Job, lines: list[str]) -> None:
+        """Announces background jobs that finished."""
+        if job.finished is None:
+            return
+        if job.status == "succeeded":
+            self.notify(f"{job.label} finished", timeout=3.0)
+        elif job.status == "failed":
+            self.notify(
+                f"{job.label} failed (F2 shows its output)",
+                severity="error",
+                timeout=5.0,
+            )
+
+    @work(thread=True, exclusive=True, group="tool-search", exit_on_error=False)
+    def prewarm_tool_search(self) -> None:
+        """Prepares the current tool registry for searches and launches.
+
+        Builds the search index and compiles the tool commands in the
+        background, ahead of the first search or launch.
+        """
+        self.container.config_manager.get_registry().warm()
+
+    def _start_config_watcher(self) -> None:
+        """Starts watching the configuration files for live reloads."""
+        from nexus.config import CONFIG_PATHS, shard_dirs
+
+        def on_change(paths: set[Path]) -> None:
+            try:
+                self.call_from_thread(self.reload_config, paths)
+            except RuntimeError:
+                # The application has already shut down.
+                pass
+
+        self._config_watcher = ConfigWatcher(
+            CONFIG_PATHS, on_change, directories=shard_dirs()
+        )
+        self._config_watcher.start()
+
+    @work(thread=True, group="config", exit_on_error=False)
+    def reload_config(self, paths: set[Path] | None = None) -> None:
+        """Reloads changed configuration files and patches the open views.
+
+        Parsing and validation run in a worker thread, so neither the files
+        nor a shard load holding the configuration lock stall the UI. The
+        resulting diff is applied back on the event loop, in reload order.
+
+        Args:
+            paths: The configuration files that changed, or None for all.
+        """
+        config_manager = self.container.config_manager
+        with self._reload_lock:
+            errors_before = len(config_manager.config_errors)
+            diff = config_manager.reload(paths)
+            errors = config_manager.config_errors[errors_before:]
+            self.call_from_thread(
+                lambda: self.run_worker(
+                    self._apply_config_diff(diff, errors), group="config"
+                )
+            )
+
+    async def _apply_config_diff(self, diff: RegistryDiff, errors: list[str]) -> None:
+        """Reports configuration errors and patches the open tool browsers.
+
+        Args:
+            diff: The changes made by a reload.
+            errors: The configuration errors the reload produced.
+        """
+        for error in errors:
+            self.notify(error, title="Config Error", severity="error", timeout=5.0)
+
+        if not diff and not diff.categories_changed:
+            return
+
+        self.prewarm_tool_search()
+        for screen in self.screen_stack:
+            for browser in screen.query(ToolBrowser):
+                await browser.apply_registry_diff(diff)
 
     def _apply_bindings(self) -> None:
         """Applies configurable keybindings from the user settings."""
@@ -125,6 +245,12 @@ class NexusApp(App[None]):
         if "help" in bindings:
             self.bind(keys=bindings["help"], action="help", show=False)
 
+        if "jobs" in bindings:
+            self.bind(keys=bindings["jobs"], action="jobs", show=False)
+
+        if "fuzzy_search" in bindings:
+            self.update_keymap({"fuzzy_search": bindings["fuzzy_search"]})
+
         if "back" in bindings:
             # We bind back globally but hide it; screens will show it if they need it.
             self.bind(keys=bindings["back"], action="back", show=False)
@@ -204,6 +330,19 @@ class NexusApp(App[None]):
 
         self.push_screen(HelpScreen())
 
+    def action_toggle_fuzzy(self) -> None:
+        """Toggles fuzzy search on the screens with a search box."""
+        screen = self.screen
+        if isinstance(screen, (ToolSelector, ProjectPicker)):
+            screen.action_toggle_fuzzy()
+
+    def action_jobs(self) -> None:
+        """Opens the jobs panel of background tools."""
+        from nexus.screens.jobs import JobsScreen
+
+        if not isinstance(self.screen, JobsScreen):
+            self.push_screen(JobsScreen())
+
     async def action_back(self) -> None:
         """Navigates back to the previous screen.
 
@@ -261,7 +400,11 @@ def main() -> None:
 
     configure_logging()
     app = NexusApp()
-    app.run()
+    launch = app.run()
+    if launch is not None:
+        from nexus.services.executor import exec_tool
+
+        exec_tool(launch)
 
 
 if __name__ == "__main__":
@@ -4,29 +4,97 @@ Extends the Textual command palette with Nexus specific commands such as
 tool launching and navigation.
 """
 
+import asyncio
+import heapq
 from functools import partial
-from typing import AsyncIterator
+from typing import Any, AsyncIterator, NamedTuple
+from textual.cache import LRUCache
 from textual.command import Provider, Hit, DiscoveryHit
+from textual.fuzzy import Matcher
 from nexus.models import Tool
+from nexus.registry import ToolRegistry
+from nexus.services.ranking import subsequence_pattern
+
+# Maximum number of hits yielded for a palette search.
+MAX_HITS = 25
+
+# Number of queries whose scores are kept while the palette is open.
+QUERY_CACHE_SIZE = 128
+
+
+class _Corpus(NamedTuple):
+    """The tools searched by the palette, with lowercased search keys.
+
+    Attributes:
+        tools: The tools in configuration order.
+        keys: The lowercased label and description of every tool.
+    """
+
+    tools: tuple[Tool, ...]
+    keys: tuple[tuple[str, str], ...]
 
 
 class ToolCommandProvider(Provider):
     """A command provider for Nexus tools.
 
     Allows users to search for and launch any configured tool directly from
-    the command palette.
+    the command palette. The tools are snapshotted once when the palette
+    opens, and the scores of every query are kept until it closes.
     """
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initializes the provider.
+
+        Args:
+            *args: Positional arguments passed to Provider.
+            **kwargs: Keyword arguments passed to Provider.
+        """
+        super().__init__(*args, **kwargs)
+        self._corpus: _Corpus | None = None
+        self._scores: LRUCache[str, list[tuple[float, int]]] = LRUCache(
+            QUERY_CACHE_SIZE
+        )
+
+    async def startup(self) -> None:
+        """Loads every tool shard and snapshots the tools for searching.
+
+        A palette search spans every category, so pending shards are loaded
+        before the first keystroke.
+        """
+        from nexus.container import get_container
+
+        config_manager = get_container().config_manager
+        registry = config_manager.get_registry()
+        if registry.pending_categories:
+            await asyncio.to_thread(
+                config_manager.load_categories, registry.pending_categories
+            )
+            registry = config_manager.get_registry()
+        self._corpus = self._snapshot(registry)
+
+    def _get_corpus(self) -> _Corpus:
+        """Retrieves the snapshot of the tools, taken on first use."""
+        if self._corpus is None:
+            from nexus.container import get_container
+
+            registry = get_container().config_manager.get_registry()
+            self._corpus = self._snapshot(registry)
+        return self._corpus
+
+    @staticmethod
+    def _snapshot(registry: ToolRegistry) -> _Corpus:
+        """Builds the search corpus of a registry."""
+        tools = registry.tools
+        keys = tuple((t.label.lower(), t.description.lower()) for t in tools)
+        return _Corpus(tools, keys)
+
     async def discover(self) -> AsyncIterator[DiscoveryHit]:
         """Yields commands for all configured tools.
 
         Returns:
             An async iterator of DiscoveryHit objects.
         """
-        from nexus.container import get_container
-
-        tools = get_container().config_manager.get_tools()
-        for tool in tools:
+        for tool in self._get_corpus().tools:
             yield DiscoveryHit(
                 tool.label, partial(self._launch_tool, tool), help=tool.description
             )
@@ -34,26 +102,62 @@ class ToolCommandProvider(Provider):
     async def search(self, query: str) -> AsyncIterator[Hit]:
         """Searches for tools matching the user query.
 
+        Only the best MAX_HITS matches are yielded, best first.
+
         Args:
             query: The search string entered by the user.
 
         Returns:
             An async iterator of Hit objects.
         """
+        corpus = self._get_corpus()
         matcher = self.matcher(query)
-        from nexus.container import get_container
+        for score, position in self._score(query, matcher, corpus):
+            tool = corpus.tools[position]
+            yield Hit(
+                score,
+                matcher.highlight(tool.label),
+                partial(self._launch_tool, tool),
+                help=tool.description,
+            )
+
+    def _score(
+        self, query: str, matcher: Matcher, corpus: _Corpus
+    ) -> list[tuple[float, int]]:
+        """Scores the tools against a query.
+
+        Args:
+            query: The search string entered by the user.
+            matcher: The fuzzy matcher of the query.
+            corpus: The tools to score.
 
-        tools = get_container().config_manager.get_tools()
-        for tool in tools:
-            # Match against label and description for better results
-            score = max(matcher.match(tool.label), matcher.match(tool.description))
-            if score > 0:
-                yield Hit(
-                    score,
-                    matcher.highlight(tool.label),
-                    partial(self._launch_tool, tool),
-                    help=tool.description,
+        Returns:
+            The score and position of the best matching tools, best first.
+        """
+        scores = self._scores.get(query)
+        if scores is not None:
+            return scores
+
+        needle = query.lower()
+        scored: list[tuple[float, int]] = []
+        if needle:
+            pattern = subsequence_pattern(needle)
+            for position, (label, description) in enumerate(corpus.keys):
+                # Match against label and description for better results
+                tool = corpus.tools[position]
+                score = max(
+                    matcher.match(tool.label) if pattern.search(label) else 0.0,
+                    matcher.match(tool.description)
+                    if pattern.search(description)
+                    else 0.0,
                 )
+                if score > 0:
+                    scored.append((score, -position))
+
+        best = heapq.nlargest(MAX_HITS, scored)
+        scores = [(score, -neg) for score, neg in best]
+        self._scores[query] = scores
+        return scores
 
     def _launch_tool(self, tool: Tool) -> None:
         """Handles the execution flow for a selected tool.
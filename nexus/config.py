@@ -4,14 +4,23 @@ Handles loading tool definitions from TOML, determining terminal preferences,
 and defining visual assets like colors and icons.
 """
 
+import json
 import os
 import shutil
+import threading
+import time
 import tomllib
+from collections.abc import Iterable
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal, cast
 
 import platformdirs
+from nexus.logger import get_logger
 from nexus.models import Tool
+from nexus.registry import RegistryDiff, ToolRegistry
+
+log = get_logger(__name__)
 
 # Configuration paths in priority order (lowest to highest).
 CWD_NEXUS_CONFIG = Path.cwd() / "nexus" / "tools.local.toml"
@@ -30,6 +39,79 @@ CONFIG_PATHS = [
     CWD_CONFIG,
 ]
 
+# Drop-in directory of per-category tool shards next to each config file.
+SHARD_DIR_NAME = "tools.d"
+
+# Compiled snapshot of the merged and validated configuration.
+CONFIG_SNAPSHOT_PATH = (
+    Path(platformdirs.user_cache_dir("nexus")) / "config.snapshot.json"
+)
+
+# Bumped whenever the snapshot layout changes.
+SNAPSHOT_FORMAT = 6
+
+# Orders in which tools can be listed within a category.
+ToolSort = Literal["config", "frecency"]
+TOOL_SORTS: tuple[ToolSort, ...] = ("config", "frecency")
+
+
+def _source_key() -> list[Any]:
+    """Builds the cache key describing the current configuration sources.
+
+    The key records the path, size and modification time of every entry
+    in CONFIG_PATHS, together with the snapshot format and Tool schema, so
+    any edit, addition or removal of a source invalidates the snapshot.
+
+    Returns:
+        A JSON serializable list uniquely identifying the source state.
+    """
+    sources: list[Any] = []
+    for path in CONFIG_PATHS:
+        try:
+            st = path.stat()
+            sources.append([str(path), st.st_size, st.st_mtime_ns])
+        except OSError:
+            sources.append([str(path), None, None])
+    return [SNAPSHOT_FORMAT, sorted(Tool.model_fields), sources]
+
+
+def shard_dirs() -> list[Path]:
+    """Lists the tools.d directories next to each configuration file.
+
+    Returns:
+        The shard directories in priority order (lowest to highest).
+    """
+    return list(dict.fromkeys(path.parent / SHARD_DIR_NAME for path in CONFIG_PATHS))
+
+
+def read_shard_category(path: Path) -> str:
+    """Reads the category a shard declares without parsing its tools.
+
+    Only the preamble before the first table header is parsed. Shards that
+    do not declare a top-level `category` use their upper-cased file stem.
+
+    Args:
+        path: The shard file.
+
+    Returns:
+        The category identifier held by the shard.
+    """
+    lines = []
+    try:
+        with open(path, "rb") as f:
+            for line in f:
+                if line.lstrip().startswith(b"["):
+                    break
+                lines.append(line)
+        preamble = tomllib.loads(b"".join(lines).decode())
+    except (OSError, UnicodeDecodeError, tomllib.TOMLDecodeError):
+        preamble = {}
+
+    category = preamble.get("category")
+    if isinstance(category, str) and category:
+        return category
+    return path.stem.upper()
+
 
 class ConfigManager:
     """Manages application configuration loading and caching.
@@ -38,20 +120,322 @@ class ConfigManager:
     from various configuration sources.
     """
 
-    def __init__(self) -> None:
-        """Initializes the ConfigManager with an empty cache."""
+    def __init__(self, use_snapshot: bool = True) -> None:
+        """Initializes the ConfigManager with an empty cache.
+
+        Args:
+            use_snapshot: Whether to read and write the compiled snapshot
+                in the user cache directory.
+        """
+        self.use_snapshot = use_snapshot
         self._config_cache: dict[str, Any] | None = None
+        self._registry: ToolRegistry | None = None
+        self._registry_version = 0
+        self._source_key: list[Any] | None = None
+        self._snapshot_current = False
+        # Raw parsed data per source file, keyed by path string.
+        self._file_data: dict[str, dict[str, Any]] = {}
+        # Source files whose last read failed.
+        self._failed_sources: set[str] = set()
+        # Validated tools keyed by label, alongside the raw definition.
+        self._validated: dict[str, tuple[dict[str, Any], Tool]] = {}
+        # Shard files and their declared category, in priority order.
+        self._shards: list[tuple[Path, str]] | None = None
+        self._loaded_categories: set[str] = set()
+        # Shards are loaded from worker threads.
+        self._lock = threading.RLock()
         self.config_errors: list[str] = []
+        self.load_stats: dict[str, Any] = {}
+
+    def invalidate(self) -> None:
+        """Discards the cached configuration and tool registry.
+
+        The next read reloads every configuration source and publishes a
+        registry with a new version.
+        """
+        with self._lock:
+            self._config_cache = None
+            self._registry = None
+            self._file_data.clear()
+            self._failed_sources.clear()
+            self._shards = None
+            self._loaded_categories.clear()
+
+    def reload(self, paths: Iterable[Path] | None = None) -> RegistryDiff:
+        """Rereads changed configuration files and publishes a new registry.
+
+        Only the given files are parsed again and only tool definitions that
+        differ from the previous load are revalidated. Changes inside a
+        tools.d directory refresh the shard manifest; shards of categories
+        that are already loaded are parsed again.
+
+        Args:
+            paths: The source files that changed. Defaults to every entry in
+                CONFIG_PATHS and every loaded shard.
+
+        Returns:
+            The differences between the previous and the new registry.
+        """
+        with self._lock:
+            previous = self.get_registry()
+            started = time.perf_counter()
+            self._source_key = _source_key()
+
+            changed = list(CONFIG_PATHS) if paths is None else list(paths)
+            directories = set(shard_dirs())
+            changed_shards = {p for p in changed if p.parent in directories}
+            if paths is None:
+                changed_shards = {path for path, _ in self._shard_manifest()}
+
+            for path in changed:
+                if path not in changed_shards:
+                    self._read_source(path)
+
+            if paths is None or changed_shards:
+                self._refresh_shards(changed_shards)
+
+            self._config_cache = self._merge_sources()
+            self._snapshot_current = False
+            self._registry = self._build_registry()
+            self._record_load("reload", started)
+            return RegistryDiff.between(previous, self._registry)
+
+    def load_categories(self, categories: Iterable[str]) -> RegistryDiff:
+        """Parses the shards holding the given categories.
+
+        This is intended to run in a background worker; the new registry is
+        published once every requested shard has been parsed.
+
+        Args:
+            categories: The pending categories to load.
+
+        Returns:
+            The differences between the previous and the new registry.
+        """
+        with self._lock:
+            previous = self.get_registry()
+            wanted = set(categories) & previous.pending_categories
+            if not wanted:
+                return RegistryDiff()
+
+            started = time.perf_counter()
+            for path, category in self._shard_manifest():
+                if category in wanted:
+                    self._read_source(path)
+            self._loaded_categories |= wanted
+
+            self._config_cache = self._merge_sources()
+            self._registry = self._build_registry()
+            log.info(
+                "config_shards_loaded",
+                categories=sorted(wanted),
+                duration_ms=round((time.perf_counter() - started) * 1000, 3),
+            )
+            return RegistryDiff.between(previous, self._registry)
+
+    def _shard_manifest(self) -> list[tuple[Path, str]]:
+        """Lists every shard file with the category it declares.
+
+        The manifest only reads each shard's preamble, so the category list
+        can be rendered without parsing any shard tools.
+
+        Returns:
+            (path, category) pairs in priority order.
+        """
+        if self._shards is None:
+            shards: list[tuple[Path, str]] = []
+            for directory in shard_dirs():
+                try:
+                    files = sorted(directory.glob("*.toml"))
+                except OSError:
+                    continue
+                shards.extend((path, read_shard_category(path)) for path in files)
+            self._shards = shards
+        return self._shards
+
+    def _refresh_shards(self, changed: set[Path]) -> None:
+        """Rebuilds the shard manifest after files in tools.d changed.
+
+        Args:
+            changed: The shard files that were modified, added or removed.
+        """
+        self._shards = None
+        manifest = self._shard_manifest()
+        current = {path for path, _ in manifest}
+
+        for path_str in list(self._file_data):
+            path = Path(path_str)
+            if path.parent.name == SHARD_DIR_NAME and path not in current:
+                self._file_data.pop(path_str)
+
+        for path, category in manifest:
+            if category in self._loaded_categories and (
+                path in changed or str(path) not in self._file_data
+            ):
+                self._read_source(path)
+
+    def _loaded_shards(self) -> list[tuple[Path, str]]:
+        """Lists the shards whose category has been loaded.
+
+        Returns:
+            (path, category) pairs in priority order.
+        """
+        if not self._loaded_categories:
+            return []
+        return [
+            (path, category)
+            for path, category in self._shard_manifest()
+            if category in self._loaded_categories
+        ]
 
     def _load_config_data(self) -> dict[str, Any]:
         """Loads and merges configuration data from all identified sources.
 
+        A compiled snapshot is used when every source matches the key it
+        was written for; otherwise each file is parsed again.
+
         Returns:
             A dictionary containing the merged configuration data.
         """
         if self._config_cache is not None:
             return self._config_cache
 
+        started = time.perf_counter()
+        self._source_key = _source_key()
+
+        if self.use_snapshot:
+            snapshot_config = self._read_snapshot(self._source_key)
+            if snapshot_config is not None:
+                self._config_cache = snapshot_config
+                self._snapshot_current = True
+                self._record_load("snapshot", started)
+                return snapshot_config
+
+        for path in CONFIG_PATHS:
+            self._read_source(path)
+
+        self._config_cache = self._merge_sources()
+        self._snapshot_current = False
+        self._record_load("files", started)
+        return self._config_cache
+
+    def _record_load(self, source: str, started: float) -> None:
+        """Stores and logs how the configuration was loaded.
+
+        Args:
+            source: One of 'snapshot', 'files' or 'reload'.
+            started: The perf_counter value taken before loading.
+        """
+        duration_ms = (time.perf_counter() - started) * 1000
+        self.load_stats = {"source": source, "duration_ms": duration_ms}
+        log.info("config_loaded", source=source, duration_ms=round(duration_ms, 3))
+
+    def _report_error(self, path: Path, message: str) -> None:
+        """Records a configuration error for a source file.
+
+        Args:
+            path: The source file that failed to load.
+            message: The user facing error message.
+        """
+        self._failed_sources.add(str(path))
+        self.config_errors.append(message)
+
+    def _read_snapshot(self, key: list[Any]) -> dict[str, Any] | None:
+        """Loads the compiled snapshot if it matches the current sources.
+
+        On success the per-file data and prevalidated tools are populated
+        without parsing TOML or running validation.
+
+        Args:
+            key: The source key computed for the current configuration.
+
+        Returns:
+            The merged configuration data, or None when the snapshot is
+            missing, unreadable or stale.
+        """
+        try:
+            with open(CONFIG_SNAPSHOT_PATH, "r") as f:
+                snapshot = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            log.warning("config_snapshot_unreadable", error=str(e))
+            return None
+
+        if not isinstance(snapshot, dict) or snapshot.get("key") != key:
+            return None
+
+        self._file_data = snapshot["files"]
+        config = self._merge_sources()
+
+        # The tools were validated before the snapshot was written.
+        tools = snapshot["tools"]
+        self._validated = {
+            d["label"]: (d, Tool.model_construct(**tools[d["label"]]))
+            for d in config["tool"]
+            if d["label"] in tools
+        }
+        return config
+
+    def _write_snapshot(self, tools: list[Tool]) -> None:
+        """Persists the per-file data and validated tools atomically.
+
+        Args:
+            tools: The tools validated from the current sources.
+        """
+        if self._source_key is None:
+            return
+
+        sources = {str(path) for path in CONFIG_PATHS}
+        snapshot = {
+            "key": self._source_key,
+            "files": {k: v for k, v in self._file_data.items() if k in sources},
+            "tools": {t.label: t.model_dump() for t in tools},
+        }
+        try:
+            CONFIG_SNAPSHOT_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = CONFIG_SNAPSHOT_PATH.with_suffix(".tmp")
+            with open(tmp_file, "w") as f:
+                json.dump(snapshot, f)
+
+            tmp_file.replace(CONFIG_SNAPSHOT_PATH)
+        except (OSError, TypeError, ValueError) as e:
+            log.warning("config_snapshot_write_failed", error=str(e))
+
+    def _read_source(self, path: Path) -> None:
+        """Parses a single configuration file into the per-file cache.
+
+        A file that fails to parse keeps its previously loaded data so that
+        a half saved edit does not drop every tool it defines.
+
+        Args:
+            path: The configuration file to read.
+        """
+        key = str(path)
+        if not path.exists():
+            self._file_data.pop(key, None)
+            self._failed_sources.discard(key)
+            return
+
+        try:
+            with open(path, "rb") as f:
+                data = tomllib.load(f)
+        except (tomllib.TOMLDecodeError, PermissionError) as e:
+            self._report_error(path, f"Error in {path.name}: {e}")
+            return
+        except Exception as e:
+            self._report_error(path, f"Unexpected error reading {path.name}: {e}")
+            return
+
+        self._file_data[key] = data
+        self._failed_sources.discard(key)
+
+    def _merge_sources(self) -> dict[str, Any]:
+        """Merges the cached per-file data in priority order.
+
+        Returns:
+            A dictionary containing the merged configuration data.
+        """
         # Use a dict for tools to allow overrides by label
         merged_tools: dict[str, dict[str, Any]] = {}
         merged_data: dict[str, Any] = {
@@ -59,85 +443,271 @@ class ConfigManager:
             "keybindings": {},
             "light_theme": "tokyo-night-light",
             "dark_theme": "tokyo-night-dark",
+            "scan_max_depth": 1,
+            "scan_ignore": [],
+            "browse_ignore": [],
+            "tool_sort": "config",
+            "batch_concurrency": None,
+            "batch_timeout": None,
+            "exit_on_launch": False,
         }
 
-        def merge_from_file(path: Path) -> None:
-            if path.exists():
-                try:
-                    with open(path, "rb") as f:
-                        data = tomllib.load(f)
+        for path in CONFIG_PATHS:
+            data = self._file_data.get(str(path))
+            if data is None:
+                continue
 
-                        if "tool" in data and isinstance(data["tool"], list):
-                            for tool_def in data["tool"]:
-                                if isinstance(tool_def, dict) and "label" in tool_def:
-                                    merged_tools[tool_def["label"]] = tool_def
+            if "tool" in data and isinstance(data["tool"], list):
+                for tool_def in data["tool"]:
+                    if isinstance(tool_def, dict) and "label" in tool_def:
+                        merged_tools[tool_def["label"]] = tool_def
 
-                        if "project_root" in data and data["project_root"]:
-                            merged_data["project_root"] = data["project_root"]
+            if "project_root" in data and data["project_root"]:
+                merged_data["project_root"] = data["project_root"]
 
-                        if "light_theme" in data:
-                            merged_data["light_theme"] = data["light_theme"]
+            if "light_theme" in data:
+                merged_data["light_theme"] = data["light_theme"]
 
-                        if "dark_theme" in data:
-                            merged_data["dark_theme"] = data["dark_theme"]
+            if "dark_theme" in data:
+                merged_data["dark_theme"] = data["dark_theme"]
 
-                        if "keybindings" in data and isinstance(
-                            data["keybindings"], dict
-                        ):
-                            merged_data["keybindings"].update(data["keybindings"])
+            if "keybindings" in data and isinstance(data["keybindings"], dict):
+                merged_data["keybindings"].update(data["keybindings"])
 
-                except (tomllib.TOMLDecodeError, PermissionError) as e:
-                    self.config_errors.append(f"Error in {path.name}: {e}")
-                except Exception as e:
-                    self.config_errors.append(
-                        f"Unexpected error reading {path.name}: {e}"
-                    )
+            if isinstance(data.get("scan_max_depth"), int):
+                merged_data["scan_max_depth"] = data["scan_max_depth"]
 
-        for path in CONFIG_PATHS:
-            merge_from_file(path)
+            if isinstance(data.get("scan_ignore"), list):
+                merged_data["scan_ignore"] = data["scan_ignore"]
+
+            if isinstance(data.get("browse_ignore"), list):
+                merged_data["browse_ignore"] = data["browse_ignore"]
+
+            if data.get("tool_sort") in TOOL_SORTS:
+                merged_data["tool_sort"] = data["tool_sort"]
+
+            if isinstance(data.get("batch_concurrency"), int):
+                merged_data["batch_concurrency"] = data["batch_concurrency"]
+
+            if isinstance(data.get("batch_timeout"), (int, float)):
+                merged_data["batch_timeout"] = data["batch_timeout"]
+
+            if isinstance(data.get("exit_on_launch"), bool):
+                merged_data["exit_on_launch"] = data["exit_on_launch"]
+
+        # Loaded shards only contribute tools, defaulting to their category.
+        for path, category in self._loaded_shards():
+            data = self._file_data.get(str(path))
+            if data is None or not isinstance(data.get("tool"), list):
+                continue
+            for tool_def in data["tool"]:
+                if isinstance(tool_def, dict) and "label" in tool_def:
+                    merged_tools[tool_def["label"]] = {"category": category, **tool_def}
 
         merged_data["tool"] = list(merged_tools.values())
-        self._config_cache = merged_data
         return merged_data
 
-    def get_project_root(self) -> Path:
-        """Determines the project root directory based on configuration.
+    def get_project_roots(self) -> list[Path]:
+        """Determines the project root directories based on configuration.
+
+        NEXUS_PROJECT_ROOT may hold several directories separated by
+        os.pathsep, and 'project_root' may be a string or a list of strings.
 
         Returns:
-            The resolved project root path.
+            The resolved project root paths in configured order, without
+            duplicates.
         """
         env_root = os.environ.get("NEXUS_PROJECT_ROOT")
         if env_root:
-            return Path(env_root).expanduser()
+            entries = [entry for entry in env_root.split(os.pathsep) if entry]
+        else:
+            config = self._load_config_data()
+            config_root = config.get("project_root")
+            if isinstance(config_root, list):
+                entries = [str(entry) for entry in config_root if entry]
+            elif config_root:
+                entries = [str(config_root)]
+            else:
+                entries = []
+
+        roots = [Path(entry).expanduser() for entry in entries]
+        if not roots:
+            return [Path.home() / "Projects"]
+        return list(dict.fromkeys(roots))
+
+    def get_project_root(self) -> Path:
+        """Determines the primary project root directory.
+
+        New projects are created here and the filesystem browser starts here.
+
+        Returns:
+            The first configured project root path.
+        """
+        return self.get_project_roots()[0]
+
+    def get_scan_depth(self) -> int:
+        """Retrieves how many levels below the project root to scan.
 
+        Returns:
+            The maximum scan depth, at least 1.
+        """
         config = self._load_config_data()
-        if config_root := config.get("project_root"):
-            path_str = str(config_root)
-            if path_str.startswith("~"):
-                return Path(path_str).expanduser()
-            return Path(path_str)
+        return max(1, int(config.get("scan_max_depth", 1)))
 
-        return Path.home() / "Projects"
+    def get_scan_prune(self) -> frozenset[str]:
+        """Retrieves the directory names the project scanner skips.
 
-    def get_tools(self) -> list[Tool]:
-        """Retrieves the list of configured tools.
+        Returns:
+            The default heavy directories plus any configured 'scan_ignore'.
+        """
+        from nexus.services.scanner import DEFAULT_PRUNE
+
+        config = self._load_config_data()
+        extra = {str(name) for name in config.get("scan_ignore", [])}
+        return DEFAULT_PRUNE | extra
+
+    def get_browse_ignore(self) -> frozenset[str]:
+        """Retrieves the glob patterns hidden in the filesystem browser.
 
         Returns:
-            A list of validated Tool objects.
+            The default VCS and cache entries plus any configured
+            'browse_ignore'.
+        """
+        from nexus.services.dir_listing import DEFAULT_BROWSE_IGNORE
+
+        config = self._load_config_data()
+        extra = {str(pattern) for pattern in config.get("browse_ignore", [])}
+        return DEFAULT_BROWSE_IGNORE | extra
+
+    def get_tool_sort(self) -> ToolSort:
+        """Retrieves how tools are ordered within a category.
+
+        Returns:
+            'config' for the configuration order, or 'frecency' to list the
+            most frequently and recently launched tools first.
+        """
+        config = self._load_config_data()
+        sort = config.get("tool_sort", "config")
+        return cast(ToolSort, sort) if sort in TOOL_SORTS else "config"
+
+    def get_batch_concurrency(self) -> int:
+        """Retrieves how many projects a batch run processes at once.
+
+        Returns:
+            The configured 'batch_concurrency', at least 1.
+        """
+        from nexus.services.batch import DEFAULT_CONCURRENCY
+
+        config = self._load_config_data()
+        concurrency = config.get("batch_concurrency")
+        return max(1, int(concurrency or DEFAULT_CONCURRENCY))
+
+    def get_batch_timeout(self) -> float:
+        """Retrieves how long a batch run may spend on a single project.
+
+        Returns:
+            The configured 'batch_timeout' in seconds.
+        """
+        from nexus.services.batch import DEFAULT_TIMEOUT
+
+        config = self._load_config_data()
+        timeout = config.get("batch_timeout")
+        return float(timeout) if timeout and timeout > 0 else DEFAULT_TIMEOUT
+
+    def get_exit_on_launch(self) -> bool:
+        """Retrieves whether Nexus exits when it launches a tool.
+
+        Returns:
+            The configured 'exit_on_launch', used by tools that do not set
+            their own.
+        """
+        config = self._load_config_data()
+        return bool(config.get("exit_on_launch", False))
+
+    def get_registry(self) -> ToolRegistry:
+        """Retrieves the indexed snapshot of configured tools.
+
+        Tool definitions are validated once per configuration load and the
+        resulting registry is shared until the configuration changes. It is
+        safe to call from worker threads: the registry is built under the
+        same lock as reloads, so a reload can never be overwritten by a
+        registry built from the previous configuration.
+
+        Returns:
+            The current ToolRegistry snapshot.
+        """
+        registry = self._registry
+        if registry is not None:
+            return registry
+        with self._lock:
+            if self._registry is None:
+                self._registry = self._build_registry()
+            return self._registry
+
+    def _build_registry(self) -> ToolRegistry:
+        """Validates the merged tool definitions into a new registry.
+
+        Definitions identical to the previous load reuse their validated
+        Tool instead of being validated again. Callers must hold the lock.
+
+        Returns:
+            A ToolRegistry containing every valid tool definition.
         """
         from pydantic import ValidationError
 
-        tools = []
         config = self._load_config_data()
+        tools = []
+        validated: dict[str, tuple[dict[str, Any], Tool]] = {}
+        clean = not self._failed_sources
+
         for t in config.get("tool", []):
-            try:
-                tools.append(Tool(**t))
-            except ValidationError as e:
-                self.config_errors.append(f"Invalid tool definition (Validation): {e}")
-            except Exception as e:
-                self.config_errors.append(f"Invalid tool definition: {e}")
-                continue
-        return tools
+            cached = self._validated.get(t["label"])
+            if cached is not None and cached[0] == t:
+                tool = cached[1]
+            else:
+                try:
+                    tool = Tool(**t)
+                except ValidationError as e:
+                    self.config_errors.append(
+                        f"Invalid tool definition (Validation): {e}"
+                    )
+                    clean = False
+                    continue
+                except Exception as e:
+                    self.config_errors.append(f"Invalid tool definition: {e}")
+                    clean = False
+                    continue
+            validated[t["label"]] = (t, tool)
+            tools.append(tool)
+
+        self._validated = validated
+
+        # Only cache clean loads so that errors are reported on every start.
+        # Shards are loaded lazily and never part of the snapshot.
+        if (
+            self.use_snapshot
+            and clean
+            and not self._snapshot_current
+            and not self._loaded_categories
+        ):
+            self._write_snapshot(tools)
+            self._snapshot_current = True
+
+        pending = {category for _, category in self._shard_manifest()}
+        self._registry_version += 1
+        return ToolRegistry(
+            tools,
+            version=self._registry_version,
+            pending_categories=pending - self._loaded_categories,
+        )
+
+    def get_tools(self) -> list[Tool]:
+        """Retrieves the list of configured tools.
+
+        Returns:
+            A list of validated Tool objects.
+        """
+        return list(self.get_registry().tools)
 
     def get_keybindings(self) -> dict[str, str]:
         """Retrieves the keybinding configuration.
@@ -171,15 +741,44 @@ class ConfigManager:
         )
 
 
+def time_config_load(rounds: int = 5) -> dict[str, float]:
+    """Measures the cold and warm configuration load paths.
+
+    The cold path parses and validates every source file, while the warm
+    path reads the compiled snapshot written by a preceding cold load.
+
+    Args:
+        rounds: The number of loads to average for each path.
+
+    Returns:
+        A mapping of 'cold_ms' and 'warm_ms' to the mean load duration.
+    """
+    timings: dict[str, float] = {}
+    for name, use_snapshot in (("cold_ms", False), ("warm_ms", True)):
+        if use_snapshot:
+            # Make sure a snapshot for the current sources exists.
+            ConfigManager().get_registry()
+
+        total = 0.0
+        for _ in range(rounds):
+            started = time.perf_counter()
+            ConfigManager(use_snapshot=use_snapshot).get_registry()
+            total += time.perf_counter() - started
+        timings[name] = total / rounds * 1000
+    return timings
+
+
 # Visual constants.
 USE_NERD_FONTS = True
 
 
+@lru_cache(maxsize=1)
 def get_preferred_terminal() -> str | None:
     """Identifies the available terminal emulator based on priority.
 
     Consults the pyproject.toml configuration and falls back to a
-    standard priority list to find a supported terminal executable.
+    standard priority list to find a supported terminal executable. The
+    lookup runs once; call get_preferred_terminal.cache_clear() to redo it.
 
     Returns:
         The executable path for the preferred terminal, or None if not found.
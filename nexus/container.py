@@ -7,6 +7,9 @@ from typing import Any
 from nexus.state import get_state_manager, StateManager
 from nexus.config import ConfigManager
 from nexus.services import executor, scanner
+from nexus.services.git_info import GitInfoReader
+from nexus.services.jobs import JobManager
+from nexus.services.project_scan import ProjectScan
 
 
 class Container:
@@ -15,6 +18,9 @@ class Container:
     def __init__(self) -> None:
         """Initializes the service container."""
         self._config_manager = ConfigManager()
+        self._project_scan = ProjectScan()
+        self._git_info = GitInfoReader()
+        self._jobs = JobManager()
 
     @property
     def config_manager(self) -> ConfigManager:
@@ -43,6 +49,33 @@ class Container:
         """
         return scanner
 
+    @property
+    def git_info(self) -> GitInfoReader:
+        """Provides access to the git metadata service.
+
+        Returns:
+            The GitInfoReader service instance.
+        """
+        return self._git_info
+
+    @property
+    def project_scan(self) -> ProjectScan:
+        """Provides access to the shared background project scan.
+
+        Returns:
+            The ProjectScan service instance.
+        """
+        return self._project_scan
+
+    @property
+    def jobs(self) -> JobManager:
+        """Provides access to the background jobs of tools.
+
+        Returns:
+            The JobManager service instance.
+        """
+        return self._jobs
+
     @property
     def state_manager(self) -> StateManager:
         """Provides access to the application state manager.
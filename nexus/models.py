@@ -4,14 +4,21 @@ Defines the Pydantic models used for validation and typehinting of
 tools and projects within the application.
 """
 
+from functools import cached_property
 from pathlib import Path
+from typing import Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+from nexus.services.templates import CommandTemplate, compile_template
 
 
 class Tool(BaseModel):
     """Represents a command-line tool configuration.
 
+    Tools are immutable once validated so that a single instance can be shared
+    between the registry indexes, the screens and the command palette.
+
     Attributes:
         label: The display name of the tool.
         category: The category identifier (e.g. DEV, AI, MEDIA, UTIL).
@@ -19,14 +26,40 @@ class Tool(BaseModel):
         command: The shell command template to execute.
         requires_project: Indicates if the tool requires a project directory.
         supports_flags: Indicates if the tool accepts custom command-line flags.
+        mode: How the tool runs. "foreground" tools take over the terminal
+            until they exit; "background" tools run alongside the TUI and
+            stream their output into the jobs panel.
+        exit_on_launch: Whether Nexus exits and replaces itself with the
+            tool, or None to follow the global 'exit_on_launch' setting.
+        launch_in: Where a foreground tool runs: "current_terminal" suspends
+            Nexus while it runs, "new_terminal" opens it in a new window of
+            the preferred terminal emulator.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     label: str
     category: str
     description: str
     command: str
     requires_project: bool
     supports_flags: bool = False
+    mode: Literal["foreground", "background"] = "foreground"
+    exit_on_launch: bool | None = None
+    launch_in: Literal["current_terminal", "new_terminal"] = "current_terminal"
+
+    @cached_property
+    def template(self) -> CommandTemplate:
+        """The command compiled into arguments with placeholders."""
+        return compile_template(self.command)
+
+    def compile(self) -> CommandTemplate:
+        """Compiles the command now rather than at the first launch.
+
+        Returns:
+            The compiled command, also available as `template`.
+        """
+        return self.template
 
 
 class Project(BaseModel):
@@ -36,8 +69,11 @@ class Project(BaseModel):
         name: The name of the project folder.
         path: The absolute path to the project directory.
         is_git: True if the directory is a git repository.
+        root: The configured project root the directory was found under,
+            or None for projects that did not come from a scan.
     """
 
     name: str
     path: Path
     is_git: bool
+    root: Path | None = None
@@ -0,0 +1,220 @@
+"""Indexed registry of validated tools.
+
+Provides an immutable snapshot of the configured tools together with
+prebuilt lookup tables so that screens and the command palette can read
+from a single source without revalidating or regrouping on every call.
+"""
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from types import MappingProxyType
+
+from nexus.models import Tool
+from nexus.services.fuzzy import FuzzyIndex
+from nexus.services.tool_search import ToolSearchIndex
+
+# Pseudo category that represents every configured tool.
+ALL_CATEGORY = "ALL"
+
+
+class ToolRegistry:
+    """An immutable, indexed snapshot of the configured tools.
+
+    A new registry is built whenever the configuration changes. Consumers
+    can compare the version counter to detect that their derived data is
+    stale.
+
+    Attributes:
+        version: Monotonic counter identifying this snapshot.
+        pending_categories: Categories declared by shards that have not
+            been loaded yet.
+    """
+
+    def __init__(
+        self,
+        tools: Iterable[Tool] = (),
+        version: int = 0,
+        pending_categories: Iterable[str] = (),
+    ) -> None:
+        """Initializes the registry and builds its indexes.
+
+        Args:
+            tools: The validated tools in display order.
+            version: The version counter for this snapshot.
+            pending_categories: Categories whose tools are not loaded yet.
+        """
+        self.version = version
+        self.pending_categories = frozenset(pending_categories)
+        self._tools: tuple[Tool, ...] = tuple(tools)
+
+        by_category: dict[str, list[Tool]] = {}
+        by_label: dict[str, Tool] = {}
+        for tool in self._tools:
+            by_category.setdefault(tool.category, []).append(tool)
+            by_label[tool.label] = tool
+
+        self._by_category = MappingProxyType(
+            {category: tuple(items) for category, items in by_category.items()}
+        )
+        self._by_label = MappingProxyType(by_label)
+        self._categories = tuple(sorted(by_category.keys() | self.pending_categories))
+        self._search_index: ToolSearchIndex | None = None
+        self._fuzzy_index: FuzzyIndex[Tool] | None = None
+
+    @property
+    def tools(self) -> tuple[Tool, ...]:
+        """All tools in configuration merge order."""
+        return self._tools
+
+    @property
+    def categories(self) -> tuple[str, ...]:
+        """The sorted category identifiers, excluding the 'ALL' category.
+
+        Includes pending categories so they can be listed before loading.
+        """
+        return self._categories
+
+    @property
+    def search_index(self) -> ToolSearchIndex:
+        """The text search index of the tools, built on first use."""
+        if self._search_index is None:
+            self._search_index = ToolSearchIndex(self._tools)
+        return self._search_index
+
+    def warm(self) -> None:
+        """Builds the search index and compiles the command of every tool.
+
+        Both are otherwise built on first use, so calling this from a worker
+        thread keeps the cost away from the first search and launch.
+        """
+        if self._search_index is None:
+            self._search_index = ToolSearchIndex(self._tools)
+        for tool in self._tools:
+            tool.compile()
+
+    def search(self, category: str, query: str) -> list[Tool]:
+        """Finds the tools of a category whose label or description match.
+
+        Args:
+            category: The category identifier, or 'ALL' for every tool.
+            query: The text to look for, matched case-insensitively.
+
+        Returns:
+            The matching tools in configuration merge order.
+        """
+        if not query:
+            return list(self.by_category(category))
+        matches = self.search_index.search(query)
+        if category == ALL_CATEGORY:
+            return matches
+        return [tool for tool in matches if tool.category == category]
+
+    def fuzzy_search(self, category: str, query: str) -> list[Tool]:
+        """Finds the tools of a category whose label resembles a query.
+
+        Unlike search(), misspelled queries still match.
+
+        Args:
+            category: The category identifier, or 'ALL' for every tool.
+            query: The search text.
+
+        Returns:
+            The matching tools, best match first.
+        """
+        if self._fuzzy_index is None:
+            labels = (tool.label for tool in self._tools)
+            self._fuzzy_index = FuzzyIndex(self._tools, labels)
+        matches = self._fuzzy_index.search(query)
+        if category == ALL_CATEGORY:
+            return matches
+        return [tool for tool in matches if tool.category == category]
+
+    def pending_for(self, category: str) -> frozenset[str]:
+        """Determines which pending categories a view needs loaded.
+
+        Args:
+            category: The category identifier being displayed, or 'ALL',
+                which needs every pending category.
+
+        Returns:
+            The pending categories that must be loaded for the view.
+        """
+        if category == ALL_CATEGORY:
+            return self.pending_categories
+        return self.pending_categories & {category}
+
+    def by_category(self, category: str) -> tuple[Tool, ...]:
+        """Retrieves the tools belonging to a category.
+
+        Args:
+            category: The category identifier, or 'ALL' for every tool.
+
+        Returns:
+            A tuple of tools in configuration merge order.
+        """
+        if category == ALL_CATEGORY:
+            return self._tools
+        return self._by_category.get(category, ())
+
+    def get(self, label: str) -> Tool | None:
+        """Looks up a tool by its label.
+
+        Args:
+            label: The display label of the tool.
+
+        Returns:
+            The matching Tool, or None if no tool has that label.
+        """
+        return self._by_label.get(label)
+
+    def __len__(self) -> int:
+        return len(self._tools)
+
+    def __iter__(self) -> Iterator[Tool]:
+        return iter(self._tools)
+
+    def __contains__(self, label: object) -> bool:
+        return label in self._by_label
+
+
+@dataclass(frozen=True)
+class RegistryDiff:
+    """The differences between two registry snapshots.
+
+    Attributes:
+        added: Tools present only in the new registry.
+        removed: Tools present only in the old registry.
+        changed: New versions of tools whose definition changed.
+        categories_changed: True if the set of categories differs.
+    """
+
+    added: tuple[Tool, ...] = ()
+    removed: tuple[Tool, ...] = ()
+    changed: tuple[Tool, ...] = ()
+    categories_changed: bool = False
+
+    @classmethod
+    def between(cls, old: ToolRegistry, new: ToolRegistry) -> "RegistryDiff":
+        """Compares two registries by tool label.
+
+        Args:
+            old: The previous registry snapshot.
+            new: The current registry snapshot.
+
+        Returns:
+            A RegistryDiff describing how to move from old to new.
+        """
+        added = tuple(t for t in new if t.label not in old)
+        removed = tuple(t for t in old if t.label not in new)
+        changed = tuple(
+            t for t in new if (prev := old.get(t.label)) is not None and prev != t
+        )
+        return cls(
+            added=added,
+            removed=removed,
+            changed=changed,
+            categories_changed=old.categories != new.categories,
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
@@ -0,0 +1,264 @@
+"""Results of a batch run across several projects.
+
+Runs the batch and fills a table with every project's status, exit code,
+duration and last line of output as the jobs finish. The table can be sorted
+by any column, and the tail of the highlighted project's output is shown
+below it. Closing the screen stops the batch, so it asks first while
+projects are still running.
+"""
+
+from collections.abc import Callable
+from typing import Any, ClassVar
+
+from textual import on, work
+from textual.app import ComposeResult
+from textual.binding import Binding, BindingType
+from textual.screen import Screen
+from textual.widgets import DataTable, Footer, Header, Label, Log
+
+from nexus.screens.confirmation import Confirmation
+from nexus.services.batch import BatchRun
+from nexus.services.jobs import Job
+
+# Statuses in the order they are sorted, problems first.
+STATUS_ORDER = ("failed", "timeout", "cancelled", "running", "queued", "succeeded")
+
+COLUMNS = ("project", "status", "exit", "duration", "output")
+
+COLUMN_LABELS = {
+    "project": "Project",
+    "status": "Status",
+    "exit": "Exit",
+    "duration": "Duration",
+    "output": "Output",
+}
+
+
+def _last_line(job: Job) -> str:
+    """Retrieves the last non-empty line of a job's output."""
+    for line in reversed(job.output):
+        if line.strip():
+            return line.strip()
+    return ""
+
+
+SORT_KEYS: dict[str, Callable[[Job], Any]] = {
+    "project": lambda job: job.label.lower(),
+    "status": lambda job: STATUS_ORDER.index(job.status),
+    "exit": lambda job: (job.returncode is None, job.returncode or 0),
+    "duration": lambda job: 0.0 if job.status == "queued" else job.duration,
+    "output": _last_line,
+}
+
+
+def _cells(job: Job) -> tuple[str, ...]:
+    """Formats the table cells of a job."""
+    exit_code = "" if job.returncode is None else str(job.returncode)
+    duration = "" if job.status == "queued" else f"{job.duration:.1f}s"
+    return (job.label, job.status, exit_code, duration, _last_line(job))
+
+
+class BatchScreen(Screen[None]):
+    """Screen showing the progress and results of a batch run.
+
+    Attributes:
+        batch_run: The batch run being shown.
+    """
+
+    BINDINGS: ClassVar[list[BindingType]] = [
+        Binding("escape", "back", "Back"),
+        Binding("s", "cycle_sort", "Sort"),
+        Binding("r", "reverse_sort", "Reverse"),
+        Binding("x", "stop", "Stop"),
+    ]
+
+    def __init__(self, batch: BatchRun, **kwargs: Any) -> None:
+        """Initializes the BatchScreen.
+
+        Args:
+            batch: The batch run to start and show.
+            **kwargs: Additional keyword arguments passed to Screen.
+        """
+        super().__init__(**kwargs)
+        self.batch_run = batch
+        self._jobs = {str(job.id): job for job in batch.jobs}
+        self._sort_column: str | None = None
+        self._reverse = False
+
+    def compose(self) -> ComposeResult:
+        """Composes the screen layout.
+
+        Yields:
+            The widget tree for the screen.
+        """
+        count = len(self.batch_run.jobs)
+        yield Header()
+        yield Label(
+            f"{self.batch_run.label} on {count} project{'s' if count != 1 else ''}",
+            id="batch-header",
+        )
+        yield Label("", id="batch-status")
+        yield DataTable(id="batch-results", cursor_type="row", zebra_stripes=True)
+        yield Log(id="batch-output", max_lines=self.batch_run.max_lines)
+        yield Footer()
+
+    def on_mount(self) -> None:
+        """Lists the queued projects and starts the batch."""
+        table = self.query_one("#batch-results", DataTable)
+        for column in COLUMNS:
+            table.add_column(COLUMN_LABELS[column], key=column)
+        self._show_rows()
+        self._show_status()
+        self.set_interval(1.0, self._refresh_durations)
+        table.focus()
+        self.run_batch()
+
+    @work(exclusive=True, group="batch")
+    async def run_batch(self) -> None:
+        """Runs the batch and reports the outcome.
+
+        The batch is cancelled, and its processes killed, when the screen
+        is closed.
+        """
+        jobs = await self.batch_run.run(self._on_job_update)
+        failed = [job for job in jobs if job.status != "succeeded"]
+        self._show_status()
+        if failed:
+            self.app.notify(
+                f"{self.batch_run.label} failed in {len(failed)} of {len(jobs)} projects",
+                severity="error",
+                timeout=5.0,
+            )
+        else:
+            self.app.notify(f"{self.batch_run.label} succeeded in every project")
+
+    def _on_job_update(self, job: Job) -> None:
+        """Updates the row of a job that started or finished."""
+        if not self.is_attached:
+            return
+        if self._sort_column in (None, "project"):
+            self._update_row(job)
+        else:
+            self._show_rows()
+        self._show_status()
+        if self._highlighted_job() is job:
+            self._show_output(job)
+
+    def _update_row(self, job: Job) -> None:
+        """Rewrites the cells of a job's row in place."""
+        table = self.query_one("#batch-results", DataTable)
+        for column, value in zip(COLUMNS, _cells(job)):
+            table.update_cell(str(job.id), column, value)
+
+    def _show_rows(self) -> None:
+        """Lists every job in the current sort order, keeping the cursor."""
+        table = self.query_one("#batch-results", DataTable)
+        current = self._highlighted_job()
+        jobs = self.batch_run.jobs
+        if self._sort_column is not None:
+            jobs = sorted(jobs, key=SORT_KEYS[self._sort_column], reverse=self._reverse)
+        table.clear()
+        for job in jobs:
+            table.add_row(*_cells(job), key=str(job.id))
+        if current is not None:
+            table.move_cursor(row=table.get_row_index(str(current.id)))
+
+    def _show_status(self) -> None:
+        """Shows how many projects are done and how many failed."""
+        jobs = self.batch_run.jobs
+        failed = sum(job.status in ("failed", "timeout", "cancelled") for job in jobs)
+        running = sum(job.status == "running" for job in jobs)
+        status = f"{self.batch_run.done}/{len(jobs)} done"
+        if running:
+            status += f", {running} running"
+        if failed:
+            status += f", {failed} failed"
+        if self._sort_column is not None:
+            order = "descending" if self._reverse else "ascending"
+            status += f" - sorted by {COLUMN_LABELS[self._sort_column]} ({order})"
+        self.query_one("#batch-status", Label).update(status)
+
+    def _refresh_durations(self) -> None:
+        """Updates the durations of running jobs."""
+        table = self.query_one("#batch-results", DataTable)
+        for job in self.batch_run.jobs:
+            if job.status == "running":
+                table.update_cell(str(job.id), "duration", _cells(job)[3])
+
+    def _highlighted_job(self) -> Job | None:
+        """Retrieves the job of the row under the cursor."""
+        table = self.query_one("#batch-results", DataTable)
+        if not table.row_count:
+            return None
+        row_key, _ = table.coordinate_to_cell_key(table.cursor_coordinate)
+        return self._jobs.get(str(row_key.value))
+
+    def _show_output(self, job: Job) -> None:
+        """Shows the output tail of a job."""
+        log = self.query_one("#batch-output", Log)
+        log.clear()
+        log.write_lines(job.output)
+
+    @on(DataTable.RowHighlighted, "#batch-results")
+    def _on_row_highlighted(self) -> None:
+        """Shows the output of the highlighted project."""
+        job = self._highlighted_job()
+        if job is not None:
+            self._show_output(job)
+
+    @on(DataTable.HeaderSelected, "#batch-results")
+    def _on_header_selected(self, event: DataTable.HeaderSelected) -> None:
+        """Sorts by the clicked column, reversing the order on a second click."""
+        self.sort_by(str(event.column_key.value))
+
+    def sort_by(self, column: str, reverse: bool | None = None) -> None:
+        """Sorts the results by a column.
+
+        Args:
+            column: The key of the column.
+            reverse: Whether to sort in descending order. By default, sorting
+                by the current column again reverses the order.
+        """
+        if reverse is None:
+            reverse = column == self._sort_column and not self._reverse
+        self._sort_column = column
+        self._reverse = reverse
+        self._show_rows()
+        self._show_status()
+
+    def action_cycle_sort(self) -> None:
+        """Sorts by the next column."""
+        index = COLUMNS.index(self._sort_column) + 1 if self._sort_column else 0
+        self.sort_by(COLUMNS[index % len(COLUMNS)], reverse=False)
+
+    def action_reverse_sort(self) -> None:
+        """Reverses the sort order."""
+        self.sort_by(self._sort_column or COLUMNS[0], reverse=not self._reverse)
+
+    def action_back(self) -> None:
+        """Closes the screen, asking first while the batch is running."""
+        remaining = len(self.batch_run.jobs) - self.batch_run.done
+        if not remaining:
+            self.dismiss()
+            return
+
+        def close(stop: bool | None) -> None:
+            # Closing the screen cancels the batch worker.
+            if stop:
+                self.dismiss()
+
+        self.app.push_screen(
+            Confirmation(
+                f"Stop {self.batch_run.label}",
+                f"{remaining} project{'s' if remaining != 1 else ''} still "
+                "running or queued. Stop them and close?",
+                "Stop",
+            ),
+            callback=close,
+        )
+
+    def action_stop(self) -> None:
+        """Stops the batch, killing the running projects."""
+        if self.batch_run.done < len(self.batch_run.jobs):
+            self.workers.cancel_group(self, "batch")
+            self.app.notify(f"Stopped {self.batch_run.label}")
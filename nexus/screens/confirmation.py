@@ -0,0 +1,61 @@
+"""Modal screen for confirming an action.
+
+Provides a dialog that asks before an action that cannot be undone, such as
+stopping running tools.
+"""
+
+from typing import Any, ClassVar
+
+from textual import on
+from textual.app import ComposeResult
+from textual.binding import Binding, BindingType
+from textual.containers import Container, Horizontal
+from textual.screen import ModalScreen
+from textual.widgets import Button, Label
+
+
+class Confirmation(ModalScreen[bool]):
+    """A modal dialog asking to confirm an action.
+
+    Dismisses with True when the action is confirmed.
+    """
+
+    BINDINGS: ClassVar[list[BindingType]] = [
+        Binding("enter,y", "confirm", "Confirm"),
+        Binding("escape,n", "cancel", "Cancel"),
+    ]
+
+    def __init__(
+        self, title: str, message: str, confirm_label: str, **kwargs: Any
+    ) -> None:
+        """Initializes the Confirmation.
+
+        Args:
+            title: The title of the dialog.
+            message: The question to confirm.
+            confirm_label: The label of the confirm button.
+            **kwargs: Additional keyword arguments passed to ModalScreen.
+        """
+        super().__init__(**kwargs)
+        self.title_text = title
+        self.message = message
+        self.confirm_label = confirm_label
+
+    def compose(self) -> ComposeResult:
+        """Composes the visual layout of the confirmation modal."""
+        with Container(classes="modal-dialog"):
+            yield Label(self.title_text, classes="modal-title")
+            yield Label(self.message, id="confirmation-message")
+            with Horizontal(classes="modal-footer-actions"):
+                yield Button("Cancel", variant="default", id="btn-cancel")
+                yield Button(self.confirm_label, variant="error", id="btn-confirm")
+
+    @on(Button.Pressed, "#btn-confirm")
+    def action_confirm(self) -> None:
+        """Confirms the action."""
+        self.dismiss(True)
+
+    @on(Button.Pressed, "#btn-cancel")
+    def action_cancel(self) -> None:
+        """Cancels the action."""
+        self.dismiss(False)
@@ -45,6 +45,7 @@ class HelpScreen(ModalScreen[None]):
                     yield Markdown(
                         """
 - Type any character to start searching tools.
+- `Ctrl+F` : Toggle fuzzy search, which tolerates typos in tool and project names.
 - `Ctrl+P` : Open the global Command Palette.
                         """
                     )
@@ -55,6 +56,8 @@ class HelpScreen(ModalScreen[None]):
 - `Ctrl+T` : Open the Theme Picker
 - `Ctrl+Q` : Exit the application
 - `F1` : Display this help screen
+- `F2` : Show background jobs and their output
+- `Space` / `Ctrl+R` : Mark projects in the project picker and run a background tool across all of them
                         """
                     )
 
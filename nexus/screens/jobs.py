@@ -0,0 +1,148 @@
+"""Jobs panel for tools running in the background.
+
+Lists the background jobs with their status and streams the output of the
+highlighted job as it is printed.
+"""
+
+from typing import Any, ClassVar
+
+from textual import on
+from textual.app import ComposeResult
+from textual.binding import Binding, BindingType
+from textual.containers import Container, Horizontal
+from textual.screen import ModalScreen
+from textual.widgets import Footer, Header, Label, Log, OptionList
+from textual.widgets.option_list import Option, OptionDoesNotExist
+
+from nexus.services.jobs import Job, JobManager
+
+STATUS_ICONS = {
+    "queued": "·",
+    "running": "…",
+    "succeeded": "✓",
+    "failed": "✗",
+    "cancelled": "■",
+    "timeout": "⌛",
+}
+
+
+def _job_prompt(job: Job) -> str:
+    """Formats the list entry of a job."""
+    status: str = job.status
+    if job.returncode is not None and job.status == "failed":
+        status = f"exit {job.returncode}"
+    return f"{STATUS_ICONS[job.status]} {job.label} ({status}, {job.duration:.0f}s)"
+
+
+class JobsScreen(ModalScreen[None]):
+    """A modal screen showing background jobs and their output.
+
+    Attributes:
+        jobs: The manager whose jobs are shown.
+    """
+
+    BINDINGS: ClassVar[list[BindingType]] = [
+        Binding("escape", "dismiss", "Close"),
+        Binding("x", "cancel_job", "Stop Job"),
+    ]
+
+    def __init__(self, jobs: JobManager | None = None, **kwargs: Any) -> None:
+        """Initializes the JobsScreen.
+
+        Args:
+            jobs: The manager whose jobs are shown. Defaults to the
+                application's job manager.
+            **kwargs: Additional keyword arguments passed to ModalScreen.
+        """
+        super().__init__(**kwargs)
+        if jobs is None:
+            from nexus.container import get_container
+
+            jobs = get_container().jobs
+        self.jobs = jobs
+        self._shown: int | None = None
+
+    def compose(self) -> ComposeResult:
+        """Composes the layout of the jobs panel.
+
+        Returns:
+            A ComposeResult containing the visual widget tree.
+        """
+        yield Header()
+        with Container(classes="modal-dialog", id="jobs-dialog"):
+            yield Label("Background Jobs", classes="modal-title")
+            with Horizontal(id="jobs-body"):
+                yield OptionList(id="job-list")
+                yield Log(id="job-output", max_lines=self.jobs.max_lines)
+        yield Footer()
+
+    def on_mount(self) -> None:
+        """Lists the jobs and follows their updates.
+
+        The newest job is highlighted, so its output is shown first.
+        """
+        option_list = self.query_one("#job-list", OptionList)
+        option_list.add_options(
+            Option(_job_prompt(job), id=f"job-{job.id}") for job in self.jobs.jobs
+        )
+        if option_list.option_count:
+            option_list.highlighted = option_list.option_count - 1
+        else:
+            self.query_one("#job-output", Log).write_line("No background jobs.")
+        self.jobs.subscribe(self._on_job_update)
+        self.set_interval(1.0, self._refresh_running)
+        option_list.focus()
+
+    def on_unmount(self) -> None:
+        """Stops following job updates."""
+        self.jobs.unsubscribe(self._on_job_update)
+
+    def _on_job_update(self, job: Job, lines: list[str]) -> None:
+        """Adds new jobs, updates their status and appends their output."""
+        option_list = self.query_one("#job-list", OptionList)
+        option_id = f"job-{job.id}"
+        try:
+            option_list.get_option(option_id)
+        except OptionDoesNotExist:
+            if not option_list.option_count:
+                self.query_one("#job-output", Log).clear()
+            option_list.add_option(Option(_job_prompt(job), id=option_id))
+            if option_list.highlighted is None:
+                option_list.highlighted = 0
+        else:
+            if not lines:
+                option_list.replace_option_prompt(option_id, _job_prompt(job))
+        if lines and job.id == self._shown:
+            self.query_one("#job-output", Log).write_lines(lines)
+
+    def _refresh_running(self) -> None:
+        """Updates the durations of running jobs."""
+        option_list = self.query_one("#job-list", OptionList)
+        for job in self.jobs.running:
+            try:
+                option_list.replace_option_prompt(f"job-{job.id}", _job_prompt(job))
+            except OptionDoesNotExist:
+                pass
+
+    def _highlighted_job(self) -> Job | None:
+        """Retrieves the job highlighted in the list."""
+        option = self.query_one("#job-list", OptionList).highlighted_option
+        if option is None or option.id is None:
+            return None
+        return self.jobs.get(int(option.id.removeprefix("job-")))
+
+    @on(OptionList.OptionHighlighted, "#job-list")
+    def _on_job_highlighted(self) -> None:
+        """Shows the output of the highlighted job."""
+        job = self._highlighted_job()
+        log = self.query_one("#job-output", Log)
+        log.clear()
+        self._shown = job.id if job else None
+        if job is not None:
+            log.write_lines(job.output)
+
+    def action_cancel_job(self) -> None:
+        """Stops the highlighted job."""
+        job = self._highlighted_job()
+        if job is not None and self.jobs.cancel(job.id):
+            self.app.notify(f"Stopping {job.label}")
@@ -4,6 +4,7 @@ Allows users to browse potential project directories and choose one as the
 context for a tool execution. Also supports creating new projects.
 """
 
+import time
 from pathlib import Path
 from typing import Any
 
@@ -12,6 +13,8 @@ from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical
 from textual.screen import ModalScreen, Screen
+from textual.timer import Timer
+from textual.worker import get_current_worker
 from textual.widgets import (
     Button,
     DirectoryTree,
@@ -19,11 +22,25 @@ from textual.widgets import (
     Footer,
     Input,
     Label,
-    ListItem,
-    ListView,
 )
 
 from nexus.models import Project, Tool
+from nexus.services.dir_listing import DEFAULT_BROWSE_IGNORE
+from nexus.services.git_info import GitInfo, format_age
+from nexus.services.project_index import ProjectIndex
+from nexus.services.project_scan import ProjectScan, ScanUpdate
+from nexus.services.ranking import frecency_map
+from nexus.widgets.browse_tree import BrowseTree
+from nexus.widgets.project_list import ProjectList
+
+# Seconds the list must be still before git metadata is loaded for it.
+GIT_INFO_DELAY = 0.05
+
+# Seconds to wait for further keystrokes before filtering.
+FILTER_DELAY = 0.03
+
+# Maximum number of ranked results shown for a non-empty search.
+RESULT_LIMIT = 200
 
 
 class AdvancedBrowseModal(ModalScreen[Path | None]):
@@ -37,13 +54,16 @@ class AdvancedBrowseModal(ModalScreen[Path | None]):
         from nexus.app import NexusApp
 
         root = Path.home()
+        ignore = DEFAULT_BROWSE_IGNORE
         if isinstance(self.app, NexusApp):
-            root = self.app.container.config_manager.get_project_root()
+            config_manager = self.app.container.config_manager
+            root = config_manager.get_project_root()
+            ignore = config_manager.get_browse_ignore()
 
         yield Header()
         with Container(classes="modal-dialog"):
             yield Label("Advanced Project Browser", classes="modal-title")
-            yield DirectoryTree(root, id="advanced-directory-tree")
+            yield BrowseTree(root, ignore=ignore, id="advanced-directory-tree")
         yield Footer()
 
     @on(DirectoryTree.DirectorySelected)
@@ -64,6 +84,12 @@ class ProjectPicker(Screen[None]):
     Attributes:
         tool: The Tool model being launched.
         _filtered_projects: Cached list of matching projects.
+        _scan: The shared project scan whose index is ranked on every
+            keystroke.
+        _shown: Paths listed while a scan is running, so that streamed
+            projects are not listed twice.
+        _frecency: Launch frecency per project path, used to boost ranking.
+        _fuzzy: Whether the search tolerates typos in project names.
     """
 
     def __init__(self, tool: Tool, **kwargs: Any):
@@ -73,13 +99,28 @@ class ProjectPicker(Screen[None]):
             tool: The tool requiring a project context.
             **kwargs: Additional keyword arguments passed to Screen.
         """
+        from nexus.container import get_container
+
         super().__init__(**kwargs)
         self.tool = tool
         self._filtered_projects: list[Project | str] = []
+        # The shared scan, which the app usually started at launch.
+        self._scan: ProjectScan = get_container().project_scan
+        self._shown: set[Path] = set()
+        self._frecency: dict[Path, float] = {}
+        self._fuzzy = False
+        self._query = ""
+        self._filter_timer: Timer | None = None
+        self._show_roots = False
+        self._git_info: dict[Path, GitInfo] = {}
+        self._git_info_requested: set[Path] = set()
+        self._git_info_timer: Timer | None = None
 
     BINDINGS = [
         Binding("enter", "select", "Select"),
         Binding("ctrl+b", "browse", "Browse"),
+        Binding("ctrl+s", "cancel_scan", "Stop Scan"),
+        Binding("ctrl+r", "run_marked", "Run on Marked"),
         Binding("escape", "app.back", "Back", show=True),
     ]
 
@@ -94,8 +135,10 @@ class ProjectPicker(Screen[None]):
         yield Input(placeholder="Search or filter projects...", id="project-search")
 
         with Vertical(id="project-list-container"):
-            yield Label("Project History", classes="section-header")
-            yield ListView(id="project-list")
+            with Horizontal(id="project-list-header"):
+                yield Label("Project History", classes="section-header")
+                yield Label("", id="scan-status")
+            yield ProjectList(self._project_label, id="project-list")
             yield Label(
                 "No recent projects. Use 'Browse' to find one.",
                 id="projects-empty",
@@ -111,75 +154,291 @@ class ProjectPicker(Screen[None]):
         yield Footer()
 
     def on_mount(self) -> None:
-        """Initializes the project list on mount."""
-        self.refresh_projects()
+        """Attaches to the shared project scan and lists its index.
+
+        The app starts the scan at startup, so the index usually holds the
+        cached or finished result already. Otherwise the scan is started
+        here and its projects stream in.
+        """
+        from nexus.container import get_container
+
+        container = get_container()
+        project_list = self.query_one("#project-list", ProjectList)
+        self.watch(project_list, "scroll_y", self._schedule_git_info, init=False)
+
+        self._frecency = frecency_map(container.state_manager.get_history())
+        # Subscribed before listing, so no update can fall in between.
+        self._scan.subscribe(self._on_scan_update)
+        self._scan.start()
+        self._update_show_roots()
+        self._update_list(self._filtered(self._query))
+        self._show_scan_status()
         self.query_one("#project-search").focus()
 
-    @work(thread=True)
-    async def refresh_projects(self, filter_text: str = "") -> None:
-        """Asynchronously updates the project list.
+    def on_unmount(self) -> None:
+        """Detaches from the shared project scan."""
+        self._scan.unsubscribe(self._on_scan_update)
+
+    def _on_scan_update(self, update: ScanUpdate) -> None:
+        """Forwards an index change from the scan thread to the UI.
 
         Args:
-            filter_text: Optional query to filter projects.
+            update: The change to the index.
         """
-        from nexus.container import get_container
+        try:
+            self.app.call_from_thread(self._apply_scan_update, update)
+        except RuntimeError:
+            # The application has already shut down.
+            pass
 
-        root = get_container().config_manager.get_project_root()
-        projects = await get_container().scanner.scan_projects(root)
-        recents = get_container().state_manager.get_recents()
-
-        # Merge scanner results with recents
-        all_paths = set(p.path for p in projects)
-        for r in recents:
-            path_obj = Path(r)
-            if r not in all_paths and path_obj.exists():
-                projects.append(
-                    Project(name=path_obj.name, path=path_obj, is_git=False)
-                )
-
-        if filter_text:
-            projects = [
-                p
-                for p in projects
-                if filter_text.lower() in p.name.lower()
-                or filter_text.lower() in str(p.path).lower()
+    def _apply_scan_update(self, update: ScanUpdate) -> None:
+        """Shows an index change: new matches are appended to the list,
+        a replaced index is ranked again.
+
+        Args:
+            update: The change to the index.
+        """
+        if not self.is_attached:
+            return
+        self._update_show_roots()
+        if update.replaced:
+            self.filter_projects(self._query)
+        elif update.added:
+            new = [
+                project
+                for project in self._filtered(self._query, ProjectIndex(update.added))
+                if project.path not in self._shown
             ]
+            if new:
+                self._append_projects(new)
+        self._show_scan_status()
 
-        self.app.call_from_thread(self._update_list, projects)
+    def _update_show_roots(self) -> None:
+        """Follows the scan in labelling rows with their root.
+
+        The rendered rows are cached, so they are formatted again whenever
+        the labels appear or disappear.
+        """
+        show_roots = self._scan.show_roots
+        if show_roots != self._show_roots:
+            self._show_roots = show_roots
+            self.query_one("#project-list", ProjectList).redraw()
+
+    def action_cancel_scan(self) -> None:
+        """Stops the running scan and keeps the projects found so far."""
+        if self._scan.status != "scanning":
+            return
+        self._scan.stop()
+        self.filter_projects(self._query)
+        self._show_scan_status()
+
+    def action_toggle_fuzzy(self) -> None:
+        """Switches the project search between ranked and fuzzy matching."""
+        self._fuzzy = not self._fuzzy
+        search = self.query_one("#project-search", Input)
+        search.placeholder = (
+            "Fuzzy search projects..."
+            if self._fuzzy
+            else "Search or filter projects..."
+        )
+        self.app.notify(f"Fuzzy search {'on' if self._fuzzy else 'off'}", timeout=2.0)
+        self.filter_projects(self._query)
+
+    def _show_scan_status(self) -> None:
+        """Shows the scan progress next to the list header."""
+        found = self._scan.found
+        status = {
+            "scanning": f"Scanning... {found} found" if found else "Scanning...",
+            "stopped": f"Scan stopped - {found} found",
+            "finished": f"{found} found",
+        }.get(self._scan.status, "")
+        self.query_one("#scan-status", Label).update(status)
+
+    @work(thread=True, exclusive=True, group="project-filter")
+    def filter_projects(self, query: str) -> None:
+        """Ranks the project index and shows the best matches.
+
+        Runs against the in-memory index only, so its cost does not depend
+        on the filesystem. A newer query cancels an older one.
+
+        Args:
+            query: The search text.
+        """
+        worker = get_current_worker()
+        matches = self._filtered(query)
+        if not worker.is_cancelled:
+            self.app.call_from_thread(self._update_list, matches)
+
+    def _filtered(self, query: str, index: ProjectIndex | None = None) -> list[Project]:
+        """Ranks the project index by match quality and launch frecency.
+
+        Args:
+            query: The search text.
+            index: The projects to rank; the whole scan index by default.
+
+        Returns:
+            The matching projects in display order. An empty query lists
+            every project, frequently launched ones first.
+        """
+        if index is None:
+            index = self._scan.index
+        if self._fuzzy and query.strip():
+            return index.fuzzy(query, limit=RESULT_LIMIT)
+        limit = RESULT_LIMIT if query.strip() else None
+        return index.rank(query, self._frecency, limit=limit)
 
     def _update_list(self, projects: list[Project]) -> None:
-        """Updates the ListView with results.
+        """Replaces the listed projects with results.
 
         Args:
             projects: The list of project models to display.
         """
-        list_view = self.query_one("#project-list", ListView)
-        list_view.clear()
+        project_list = self.query_one("#project-list", ProjectList)
+        project_list.set_projects(projects)
+        scanning = self._scan.status == "scanning"
+        self._shown = {project.path for project in projects} if scanning else set()
 
         empty_label = self.query_one("#projects-empty", Label)
 
         if not projects:
             empty_label.remove_class("hidden")
-            list_view.display = False
+            project_list.display = False
         else:
             empty_label.add_class("hidden")
-            list_view.display = True
-            for project in sorted(projects, key=lambda p: p.name.lower()):
-                item = ListItem(Label(f" {project.name} [dim]({project.path})[/]"))
-                # Use a custom attribute to store the path string
-                setattr(item, "project_path", str(project.path))
-                list_view.append(item)
+            project_list.display = True
+            self._schedule_git_info()
+
+    def _append_projects(self, projects: list[Project]) -> None:
+        """Appends newly found projects while a scan is running.
+
+        Args:
+            projects: The project models to add.
+        """
+        project_list = self.query_one("#project-list", ProjectList)
+        self.query_one("#projects-empty", Label).add_class("hidden")
+        project_list.display = True
+        project_list.extend(projects)
+        self._shown.update(project.path for project in projects)
+        self._schedule_git_info()
+
+    def _schedule_git_info(self) -> None:
+        """Loads git metadata for the visible rows once scrolling settles."""
+        if self._git_info_timer is not None:
+            self._git_info_timer.stop()
+        self._git_info_timer = self.set_timer(
+            GIT_INFO_DELAY, self._load_visible_git_info
+        )
+
+    def _load_visible_git_info(self) -> None:
+        """Requests git metadata for visible rows that do not have it yet."""
+        self._git_info_timer = None
+        if not self.is_attached:
+            return
+        project_list = self.query_one("#project-list", ProjectList)
+        paths = [
+            project.path
+            for project in project_list.visible_projects
+            if project.path not in self._git_info_requested
+        ]
+        if paths:
+            self._git_info_requested.update(paths)
+            self.load_git_info(paths)
+
+    @work(thread=True, group="git-info")
+    def load_git_info(self, paths: list[Path]) -> None:
+        """Reads git metadata in the background and updates the rows.
+
+        Args:
+            paths: The project directories to read.
+        """
+        from nexus.container import get_container
+
+        results = get_container().git_info.load_git_info(paths)
+        if results:
+            self.app.call_from_thread(self._apply_git_info, results)
+
+    def _apply_git_info(self, results: dict[Path, GitInfo]) -> None:
+        """Redraws the rows whose git metadata arrived.
+
+        Args:
+            results: The git metadata per project path.
+        """
+        self._git_info.update(results)
+        self.query_one("#project-list", ProjectList).refresh_rows(results)
+
+    def _project_label(self, project: Project) -> str:
+        """Formats the list entry text for a project.
+
+        Args:
+            project: The project model to display.
+
+        Returns:
+            The markup for the entry, including git metadata once loaded.
+        """
+        text = f" {project.name} [dim]({project.path})[/]"
+        if self._show_roots and project.root is not None:
+            text += f" [$accent]{project.root.name or project.root}[/]"
+
+        info = self._git_info.get(project.path)
+        if info is None:
+            return text
+        if info.detached:
+            text += f"  [$warning]detached {(info.commit or '')[:7]}[/]"
+        else:
+            text += f"  [$success]{info.branch}[/]"
+        if info.last_commit is not None:
+            age = format_age(max(0.0, time.time() - info.last_commit))
+            text += f" [dim]{age}[/]"
+        if info.index_changed:
+            text += " [$warning]●[/]"
+        return text
 
     @on(Input.Changed, "#project-search")
     def on_search_changed(self, event: Input.Changed) -> None:
-        self.refresh_projects(event.value)
+        # Keystrokes typed in quick succession are filtered once.
+        self._query = event.value
+        if self._filter_timer is not None:
+            self._filter_timer.stop()
+        self._filter_timer = self.set_timer(
+            FILTER_DELAY, lambda: self.filter_projects(self._query)
+        )
 
-    @on(ListView.Selected, "#project-list")
-    def on_project_selected(self, event: ListView.Selected) -> None:
-        # Find the path from the item
-        path = getattr(event.item, "project_path", None)
-        if path:
-            self._handle_project_selection(path)
+    @on(ProjectList.Selected, "#project-list")
+    def on_project_selected(self, event: ProjectList.Selected) -> None:
+        self._handle_project_selection(event.project.path)
+
+    @on(ProjectList.MarksChanged, "#project-list")
+    def _on_marks_changed(self, event: ProjectList.MarksChanged) -> None:
+        """Shows how many projects are marked for a batch run."""
+        count = len(event.project_list.marked)
+        header = f"Launch {self.tool.label}"
+        if count:
+            header += f" on {count} marked project{'s' if count != 1 else ''}"
+        self.query_one("#project-picker-header", Label).update(header)
+
+    def action_run_marked(self) -> None:
+        """Runs the tool across every marked project in one batch."""
+        project_list = self.query_one("#project-list", ProjectList)
+        paths = project_list.marked
+        if not paths:
+            self.app.notify("Mark projects with Space first", severity="warning")
+            return
+        if self.tool.mode != "background":
+            self.app.notify(
+                f"{self.tool.label} is interactive; batch runs need a "
+                'tool with mode = "background"',
+                severity="warning",
+                timeout=4.0,
+            )
+            return
+
+        from nexus.screens.tool_selector import ToolSelector
+
+        for stack_screen in self.app.screen_stack:
+            if isinstance(stack_screen, ToolSelector):
+                self.app.pop_screen()
+                stack_screen.execute_batch(self.tool, paths)
+                break
 
     @on(Button.Pressed, "#btn-browse")
     def action_browse(self) -> None:
@@ -231,7 +490,6 @@ class ProjectPicker(Screen[None]):
 
     def action_select(self) -> None:
         """Selects the currently highlighted project."""
-        list_view = self.query_one("#project-list", ListView)
-        if list_view.has_focus and list_view.index is not None:
-            # We trigger the list view's internal selection mechanism
-            list_view.action_select_cursor()
+        project_list = self.query_one("#project-list", ProjectList)
+        if project_list.has_focus:
+            project_list.action_select()
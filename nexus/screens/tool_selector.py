@@ -84,6 +84,16 @@ class ToolSelector(Screen[None]):
             if tool:
                 self.launch_tool_flow(tool)
 
+    def action_toggle_fuzzy(self) -> None:
+        """Switches the tool search between substring and fuzzy matching."""
+        browser = self.query_one(ToolBrowser)
+        browser.fuzzy = not browser.fuzzy
+        search = self.query_one("#tool-search", Input)
+        search.placeholder = (
+            "Fuzzy search tools..." if browser.fuzzy else "Search tools..."
+        )
+        self.app.notify(f"Fuzzy search {'on' if browser.fuzzy else 'off'}", timeout=2.0)
+
     # --- Navigation delegation ---
 
     def action_cursor_down(self) -> None:
@@ -162,15 +172,102 @@ class ToolSelector(Screen[None]):
     def execute_tool_command(
         self, tool: Tool, project_path: Path | None = None, flags: str | None = None
     ) -> None:
-        """Executes the tool command within a suspended TUI context."""
-        with self.app.suspend():
-            from nexus.container import get_container
+        """Executes the tool command.
+
+        Foreground tools run within a suspended TUI context, in a new
+        terminal window, or replace Nexus entirely when 'exit_on_launch' is
+        set. Background tools are started as jobs and the TUI stays
+        responsive.
+        """
+        if tool.mode == "background":
+            self._start_job(tool, project_path, flags)
+            return
+
+        from nexus.container import get_container
 
-            success = get_container().executor.launch_tool(
-                tool.command, project_path=project_path, flags=flags
+        container = get_container()
+        if tool.launch_in == "new_terminal":
+            if container.executor.launch_in_terminal(
+                tool.template, project_path=project_path, flags=flags
+            ):
+                container.state_manager.add_tool_launch(tool.label)
+                self.app.notify(f"Opened {tool.label} in a new terminal")
+            else:
+                self.app.notify(
+                    f"Failed to open {tool.label} in a new terminal",
+                    severity="error",
+                )
+            return
+
+        exit_on_launch = tool.exit_on_launch
+        if exit_on_launch is None:
+            exit_on_launch = container.config_manager.get_exit_on_launch()
+        if exit_on_launch:
+            self._exit_and_launch(tool, project_path, flags)
+            return
+
+        with self.app.suspend():
+            success = container.executor.launch_tool(
+                tool.template, project_path=project_path, flags=flags
             )
 
-            if not success:
+            if success:
+                container.state_manager.add_tool_launch(tool.label)
+            else:
                 self.app.notify(f"Failed to launch {tool.label}", severity="error")
 
         self.app.refresh()
+
+    def execute_batch(self, tool: Tool, projects: list[Path]) -> None:
+        """Runs a background tool across several projects and shows the results.
+
+        Args:
+            tool: The tool to run.
+            projects: The project directories to run it in.
+        """
+        from nexus.container import get_container
+        from nexus.screens.batch import BatchScreen
+        from nexus.services.batch import BatchRun
+
+        container = get_container()
+        config_manager = container.config_manager
+        batch = BatchRun(
+            tool.label,
+            tool.template,
+            projects,
+            concurrency=config_manager.get_batch_concurrency(),
+            timeout=config_manager.get_batch_timeout(),
+        )
+        container.state_manager.add_tool_launch(tool.label)
+        self.app.push_screen(BatchScreen(batch))
+
+    def _exit_and_launch(
+        self, tool: Tool, project_path: Path | None, flags: str | None
+    ) -> None:
+        """Exits Nexus so that the tool replaces it once the TUI is torn down."""
+        from nexus.container import get_container
+
+        container = get_container()
+        launch = container.executor.build_command(tool.template, project_path, flags)
+        if not launch.argv:
+            self.app.notify(f"Failed to launch {tool.label}", severity="error")
+            return
+
+        container.state_manager.add_tool_launch(tool.label)
+        self.app.exit(launch)
+
+    def _start_job(
+        self, tool: Tool, project_path: Path | None, flags: str | None
+    ) -> None:
+        """Starts a background tool as a job."""
+        from nexus.container import get_container
+
+        container = get_container()
+        argv, cwd = container.executor.build_command(tool.template, project_path, flags)
+        if not argv:
+            self.app.notify(f"Failed to launch {tool.label}", severity="error")
+            return
+
+        container.jobs.start(tool.label, argv, cwd)
+        container.state_manager.add_tool_launch(tool.label)
+        self.app.notify(f"Started {tool.label} in the background", timeout=3.0)
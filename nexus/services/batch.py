@@ -0,0 +1,127 @@
+"""Batch runs of one tool across many projects.
+
+Every selected project gets its own job running the tool's command in the
+project directory. Jobs run in parallel up to a concurrency limit, each with
+its own timeout, and keep only the tail of their output.
+"""
+
+import asyncio
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from nexus.logger import get_logger
+from nexus.services.executor import build_command
+from nexus.services.jobs import Job, run_process
+from nexus.services.templates import CommandTemplate
+
+log = get_logger(__name__)
+
+# Default number of projects processed at the same time.
+DEFAULT_CONCURRENCY = 4
+
+# Default seconds a single project may run before it is killed.
+DEFAULT_TIMEOUT = 600.0
+
+# Lines of output kept per project.
+TAIL_LINES = 200
+
+
+class BatchRun:
+    """One tool command run across several projects.
+
+    Attributes:
+        label: The label of the tool being run.
+        projects: The project directories, in selection order.
+        jobs: The job of each project, in the same order.
+        concurrency: The maximum number of jobs running at once.
+        timeout: Seconds each job may run before it is killed.
+        max_lines: The number of output lines kept per job.
+    """
+
+    def __init__(
+        self,
+        label: str,
+        command: str | CommandTemplate,
+        projects: list[Path],
+        flags: str | None = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_lines: int = TAIL_LINES,
+    ) -> None:
+        """Prepares a queued job for every project.
+
+        Args:
+            label: The label of the tool being run.
+            command: The tool's command template, compiled or as configured.
+            projects: The project directories to run the command in.
+            flags: Optional additional command-line arguments.
+            concurrency: The maximum number of jobs running at once.
+            timeout: Seconds each job may run before it is killed.
+            max_lines: The number of output lines kept per job.
+        """
+        self.label = label
+        self.projects = projects
+        self.concurrency = max(1, concurrency)
+        self.timeout = timeout
+        self.max_lines = max_lines
+        self.jobs: list[Job] = []
+        for number, project in enumerate(projects, start=1):
+            argv, cwd = build_command(command, project, flags)
+            self.jobs.append(
+                Job(number, project.name, argv, cwd, max_lines, status="queued")
+            )
+
+    @property
+    def done(self) -> int:
+        """The number of finished jobs."""
+        return sum(not job.running for job in self.jobs)
+
+    async def run(self, on_update: Callable[[Job], None] | None = None) -> list[Job]:
+        """Runs every job and waits for all of them.
+
+        Cancelling the run kills the running processes and cancels the jobs
+        that have not started.
+
+        Args:
+            on_update: Called with a job when it starts and when it finishes.
+
+        Returns:
+            The finished jobs, in project order.
+        """
+        slots = asyncio.Semaphore(self.concurrency)
+
+        def report(job: Job) -> None:
+            if on_update is not None:
+                on_update(job)
+
+        async def run_job(job: Job) -> None:
+            try:
+                async with slots:
+                    job.status = "running"
+                    job.started = time.monotonic()
+                    report(job)
+                    returncode = await asyncio.wait_for(
+                        run_process(job, lambda lines: None), self.timeout
+                    )
+            except TimeoutError:
+                job.status = "timeout"
+                returncode = None
+            except asyncio.CancelledError:
+                job.status = "cancelled"
+                job.finish(None)
+                report(job)
+                raise
+            job.finish(returncode)
+            report(job)
+
+        started = time.monotonic()
+        await asyncio.gather(*(run_job(job) for job in self.jobs))
+        log.info(
+            "batch_finished",
+            tool=self.label,
+            projects=len(self.jobs),
+            failed=sum(job.status != "succeeded" for job in self.jobs),
+            duration=round(time.monotonic() - started, 2),
+        )
+        return self.jobs
@@ -0,0 +1,123 @@
+"""Service for listing directories in the filesystem browser.
+
+Listings are read with a single scandir pass, which reports whether each
+entry is a directory without an extra stat call, filtered by glob ignore
+patterns and sorted once. They are cached until the directory's
+modification time changes, so re-expanding a large directory is free.
+"""
+
+import os
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from fnmatch import translate
+from pathlib import Path
+from typing import NamedTuple
+
+# Entry names hidden in the filesystem browser unless configured otherwise.
+DEFAULT_BROWSE_IGNORE = frozenset(
+    {
+        ".DS_Store",
+        ".git",
+        ".hg",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".svn",
+        ".tox",
+        "__pycache__",
+    }
+)
+
+# Number of directory listings kept in memory.
+MAX_CACHED_LISTINGS = 256
+
+
+class Entry(NamedTuple):
+    """A directory entry.
+
+    Attributes:
+        name: The entry's file name.
+        is_dir: Whether the entry is a directory or a link to one.
+    """
+
+    name: str
+    is_dir: bool
+
+
+_CacheKey = tuple[Path, tuple[str, ...]]
+
+_cache: "OrderedDict[_CacheKey, tuple[int, list[Entry]]]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def ignore_pattern(patterns: Iterable[str]) -> re.Pattern[str] | None:
+    """Compiles glob patterns into one regex matching any of them.
+
+    Args:
+        patterns: Glob patterns of entry names.
+
+    Returns:
+        The regex, or None if there are no patterns.
+    """
+    patterns = sorted(patterns)
+    if not patterns:
+        return None
+    return re.compile("|".join(translate(pattern) for pattern in patterns))
+
+
+def _is_dir(entry: os.DirEntry[str]) -> bool:
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+def list_directory(path: Path, ignore: Iterable[str] = ()) -> list[Entry]:
+    """Lists a directory, directories first, each group sorted by name.
+
+    Args:
+        path: The directory to list.
+        ignore: Glob patterns of entry names to leave out.
+
+    Returns:
+        The visible entries, or an empty list if the directory cannot be
+        read. The list is shared with the cache and must not be modified.
+    """
+    patterns = tuple(sorted(ignore))
+    key = (path, patterns)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return []
+
+    with _lock:
+        cached = _cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            _cache.move_to_end(key)
+            return cached[1]
+
+    pattern = ignore_pattern(patterns)
+    try:
+        with os.scandir(path) as it:
+            entries = [
+                Entry(entry.name, _is_dir(entry))
+                for entry in it
+                if pattern is None or not pattern.match(entry.name)
+            ]
+    except OSError:
+        return []
+    entries.sort(key=lambda entry: (not entry.is_dir, entry.name.lower()))
+
+    with _lock:
+        _cache[key] = (mtime, entries)
+        _cache.move_to_end(key)
+        while len(_cache) > MAX_CACHED_LISTINGS:
+            _cache.popitem(last=False)
+    return entries
+
+
+def clear_cache() -> None:
+    """Drops every cached listing."""
+    with _lock:
+        _cache.clear()
@@ -5,13 +5,59 @@ terminal.
 """
 
 import os
-import shlex
 import subprocess
+import sys
 from pathlib import Path
+from typing import NamedTuple, NoReturn
+
+from nexus.services.templates import CommandTemplate, compile_template
+
+
+class Launch(NamedTuple):
+    """A rendered tool command, ready to run.
+
+    Attributes:
+        argv: The command and its arguments.
+        cwd: The working directory, or None to inherit the current one.
+    """
+
+    argv: list[str]
+    cwd: Path | None
+
+
+def build_command(
+    command: str | CommandTemplate,
+    project_path: Path | None = None,
+    flags: str | None = None,
+) -> Launch:
+    """Builds the argument vector and working directory of a tool command.
+
+    Fills in the command placeholders, appending the flags and project path
+    when the command has no placeholder for them.
+
+    Args:
+        command: The command template, compiled or as configured.
+        project_path: Optional working directory and project context.
+        flags: Optional additional command-line arguments.
+
+    Returns:
+        The command arguments and the working directory.
+    """
+    if isinstance(command, str):
+        command = compile_template(command)
+    cmd_parts = command.render(project_path, flags)
+
+    cwd = None
+    if project_path and project_path.exists():
+        cwd = project_path if project_path.is_dir() else project_path.parent
+
+    return Launch(cmd_parts, cwd)
 
 
 def launch_tool(
-    command: str, project_path: Path | None = None, flags: str | None = None
+    command: str | CommandTemplate,
+    project_path: Path | None = None,
+    flags: str | None = None,
 ) -> bool:
     """Launches a tool in the current terminal window.
 
@@ -19,7 +65,7 @@ def launch_tool(
     command placeholders and manages the working directory.
 
     Args:
-        command: The shell command to execute.
+        command: The command template to execute, compiled or as configured.
         project_path: Optional working directory and project context.
         flags: Optional additional command-line arguments.
 
@@ -27,36 +73,104 @@ def launch_tool(
         True if the process started and exited with return code 0, False
         otherwise.
     """
-    if not command:
+    cmd_parts, cwd = build_command(command, project_path, flags)
+    if not cmd_parts:
         return False
 
-    final_command = command
-    if flags:
-        if "{flags}" in final_command:
-            final_command = final_command.replace("{flags}", flags)
-        else:
-            final_command = f"{final_command} {flags}"
-    else:
-        final_command = final_command.replace("{flags}", "")
-
-    if project_path:
-        if "{project}" in final_command:
-            final_command = final_command.replace("{project}", str(project_path))
-        elif "{flags}" not in command:
-            final_command = f"{final_command} {project_path}"
-
-    is_windows = os.name == "nt"
     try:
-        cmd_parts = shlex.split(final_command, posix=not is_windows)
-    except ValueError:
-        cmd_parts = final_command.split()
+        result = subprocess.run(cmd_parts, cwd=cwd, check=False)
+        return result.returncode == 0
+    except (FileNotFoundError, OSError):
+        return False
+
+
+# Arguments that make a terminal emulator run a command, by executable name.
+# Terminals not listed take the command after -e.
+TERMINAL_COMMAND_ARGS: dict[str, list[str]] = {
+    "kitty": [],
+    "gnome-terminal": ["--"],
+    "wezterm": ["start", "--"],
+    "konsole": ["-e"],
+    "xterm": ["-e"],
+}
 
-    cwd = None
-    if project_path and project_path.exists():
-        cwd = project_path if project_path.is_dir() else project_path.parent
+
+def terminal_command(terminal: str, argv: list[str]) -> list[str]:
+    """Builds the command that opens a terminal emulator running a tool.
+
+    Args:
+        terminal: The path of the terminal executable.
+        argv: The tool command and its arguments.
+
+    Returns:
+        The terminal command line.
+    """
+    name = Path(terminal).stem
+    return [terminal, *TERMINAL_COMMAND_ARGS.get(name, ["-e"]), *argv]
+
+
+def launch_in_terminal(
+    command: str | CommandTemplate,
+    project_path: Path | None = None,
+    flags: str | None = None,
+) -> bool:
+    """Launches a tool in a new window of the preferred terminal emulator.
+
+    The terminal is started detached, in its own session, and the function
+    returns at once without waiting for the tool.
+
+    Args:
+        command: The command template to execute, compiled or as configured.
+        project_path: Optional working directory and project context.
+        flags: Optional additional command-line arguments.
+
+    Returns:
+        True if the terminal was started, False if the command is empty,
+        no terminal emulator was found or it could not be started.
+    """
+    from nexus.config import get_preferred_terminal
+
+    cmd_parts, cwd = build_command(command, project_path, flags)
+    terminal = get_preferred_terminal()
+    if not cmd_parts or terminal is None:
+        return False
 
     try:
-        result = subprocess.run(cmd_parts, cwd=cwd, check=False)
-        return result.returncode == 0
+        subprocess.Popen(
+            terminal_command(terminal, cmd_parts),
+            cwd=cwd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        return True
     except (FileNotFoundError, OSError):
         return False
+
+
+def exec_tool(launch: Launch) -> NoReturn:
+    """Replaces the current process with a tool.
+
+    Called after the TUI has shut down. The tool inherits the terminal and
+    the environment, with PWD pointing at its working directory. On Windows,
+    which cannot replace a process, the tool is run and its exit code is
+    returned to the shell instead.
+
+    Args:
+        launch: The rendered command and its working directory.
+    """
+    env = dict(os.environ)
+    if launch.cwd is not None:
+        os.chdir(launch.cwd)
+        env["PWD"] = str(launch.cwd)
+
+    sys.stdout.flush()
+    sys.stderr.flush()
+    try:
+        if os.name == "nt":
+            sys.exit(subprocess.run(launch.argv, env=env, check=False).returncode)
+        os.execvpe(launch.argv[0], launch.argv, env)
+    except OSError as e:
+        print(f"nexus: cannot launch {launch.argv[0]}: {e}", file=sys.stderr)
+        sys.exit(127)
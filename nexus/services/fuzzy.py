@@ -0,0 +1,83 @@
+"""Typo-tolerant search for tools and projects.
+
+Scores every key against the query in one batched thefuzz extraction, so
+that transposed or missing letters ("nivm", "dokcer") still find a match.
+Keys are normalized once when the index is built, and recent queries are
+cached, so repeated keystrokes and backspacing do not score the catalog
+again.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+
+from thefuzz import fuzz, process, utils
+
+# Lowest score (0-100) of a fuzzy match.
+FUZZY_CUTOFF = 60
+
+# Maximum number of fuzzy matches returned.
+FUZZY_LIMIT = 50
+
+# Number of queries whose results are kept per index.
+FUZZY_CACHE_SIZE = 64
+
+
+class FuzzyIndex[T]:
+    """Items with precomputed keys for fuzzy matching.
+
+    An index is built for one snapshot of its items, such as a registry
+    version, so cached results are never stale.
+    """
+
+    def __init__(self, items: Iterable[T], keys: Iterable[str]) -> None:
+        """Builds the index.
+
+        Args:
+            items: The searchable items, in display order.
+            keys: The text matched against the query, one per item.
+        """
+        self._items: Sequence[T] = tuple(items)
+        self._keys = {
+            position: utils.full_process(key) for position, key in enumerate(keys)
+        }
+        self._cache: OrderedDict[tuple[str, int], list[T]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def search(self, query: str, limit: int = FUZZY_LIMIT) -> list[T]:
+        """Finds the items whose key resembles the query.
+
+        Args:
+            query: The search text.
+            limit: The maximum number of results.
+
+        Returns:
+            The matching items, best match first. Items with the same score
+            keep their display order.
+        """
+        query = utils.full_process(query)
+        if not query:
+            return []
+
+        key = (query, limit)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+
+        matches = process.extractBests(
+            query,
+            self._keys,
+            scorer=fuzz.WRatio,
+            score_cutoff=FUZZY_CUTOFF,
+            limit=limit,
+        )
+        matches.sort(key=lambda match: (-match[1], match[2]))
+        results = [self._items[position] for _, _, position in matches]
+
+        with self._lock:
+            self._cache[key] = results
+            while len(self._cache) > FUZZY_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return results
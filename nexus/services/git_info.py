@@ -0,0 +1,305 @@
+"""Service for reading git metadata without spawning git.
+
+Reads HEAD, loose refs, packed-refs and loose commit objects straight from
+the repository directory. Results are cached per project and revalidated
+by the modification times of the files they were read from, so refreshing
+the metadata of an unchanged repository costs a handful of stat calls.
+"""
+
+import os
+import threading
+import zlib
+from collections import OrderedDict
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+# Upper bound for the number of repositories read concurrently.
+GIT_INFO_WORKERS = 4
+
+# Number of projects whose metadata is kept; the least recently used go first.
+GIT_INFO_CACHE_SIZE = 1024
+
+# Bytes of a loose commit object to inflate; the committer line is in the
+# header, well before the commit message.
+_COMMIT_HEADER_BYTES = 4096
+
+
+@dataclass(frozen=True)
+class GitInfo:
+    """Repository state of a project.
+
+    Attributes:
+        branch: The checked out branch, or None when HEAD is detached.
+        commit: The commit HEAD points at, or None for an unborn branch.
+        last_commit: Unix time of the HEAD commit. Taken from the commit
+            object when it is stored loose, otherwise approximated by the
+            modification time of the branch ref. None if neither is known.
+        index_changed: True if the index was written after HEAD last moved,
+            which usually means changes were staged since the last commit.
+    """
+
+    branch: str | None
+    commit: str | None
+    last_commit: float | None
+    index_changed: bool
+
+    @property
+    def detached(self) -> bool:
+        """True if HEAD points at a commit rather than a branch."""
+        return self.branch is None
+
+
+def format_age(seconds: float) -> str:
+    """Formats a duration as a compact age such as '5m' or '3d'.
+
+    Args:
+        seconds: The elapsed time in seconds.
+
+    Returns:
+        The age in the largest whole unit.
+    """
+    for unit, size in (("y", 31_536_000), ("w", 604_800), ("d", 86_400)):
+        if seconds >= size:
+            return f"{int(seconds // size)}{unit}"
+    if seconds >= 3600:
+        return f"{int(seconds // 3600)}h"
+    if seconds >= 60:
+        return f"{int(seconds // 60)}m"
+    return "now"
+
+
+def _mtime(path: Path) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _read_text(path: Path) -> str | None:
+    try:
+        return path.read_text(errors="replace").strip()
+    except OSError:
+        return None
+
+
+def _git_dirs(project: Path) -> tuple[Path, Path] | None:
+    """Locates the git directory and the common directory of a project.
+
+    Handles regular repositories as well as worktrees and submodules,
+    where .git is a file pointing at the real git directory.
+
+    Returns:
+        The (git_dir, common_dir) pair, or None if the project has no git
+        directory.
+    """
+    dot_git = project / ".git"
+    if dot_git.is_dir():
+        git_dir = dot_git
+    else:
+        pointer = _read_text(dot_git)
+        if not pointer or not pointer.startswith("gitdir:"):
+            return None
+        git_dir = project / pointer.removeprefix("gitdir:").strip()
+
+    common = _read_text(git_dir / "commondir")
+    common_dir = git_dir / common if common else git_dir
+    return git_dir, common_dir
+
+
+def find_git_root(path: Path) -> Path | None:
+    """Finds the working tree root of the repository containing a path.
+
+    Args:
+        path: A file or directory inside the repository.
+
+    Returns:
+        The closest directory at or above the path that contains a .git
+        directory or file, or None if the path is not inside a repository.
+    """
+    directory = path if path.is_dir() else path.parent
+    for candidate in (directory, *directory.parents):
+        if (candidate / ".git").exists():
+            return candidate
+    return None
+
+
+def _packed_ref(common_dir: Path, ref: str) -> str | None:
+    try:
+        with open(common_dir / "packed-refs", "r", errors="replace") as f:
+            for line in f:
+                if line.startswith(("#", "^")):
+                    continue
+                sha, _, name = line.rstrip("\n").partition(" ")
+                if name == ref:
+                    return sha
+    except OSError:
+        pass
+    return None
+
+
+def _commit_time(common_dir: Path, sha: str) -> float | None:
+    """Reads the committer time from a loose commit object.
+
+    Returns:
+        The commit time, or None if the object is packed or unreadable.
+    """
+    path = common_dir / "objects" / sha[:2] / sha[2:]
+    try:
+        with open(path, "rb") as f:
+            data = zlib.decompressobj().decompress(f.read(), _COMMIT_HEADER_BYTES)
+    except (OSError, zlib.error):
+        return None
+
+    for line in data.split(b"\n"):
+        if line.startswith(b"committer "):
+            try:
+                return float(line.rsplit(b" ", 2)[-2])
+            except (IndexError, ValueError):
+                return None
+        if not line:
+            break
+    return None
+
+
+def _read(project: Path) -> tuple[GitInfo | None, tuple[Path, ...]]:
+    """Reads the git metadata of a project.
+
+    Returns:
+        The GitInfo, or None if the project is not a readable repository,
+        and the files whose modification times validate the result.
+    """
+    dirs = _git_dirs(project)
+    if dirs is None:
+        return None, (project / ".git",)
+    git_dir, common_dir = dirs
+
+    head_file = git_dir / "HEAD"
+    index_file = git_dir / "index"
+    packed_file = common_dir / "packed-refs"
+    files: tuple[Path, ...] = (project / ".git", head_file, index_file, packed_file)
+
+    head = _read_text(head_file)
+    if head is None:
+        return None, files
+
+    branch = None
+    ref_file = None
+    if head.startswith("ref:"):
+        ref = head.removeprefix("ref:").strip()
+        branch = ref.removeprefix("refs/heads/")
+        ref_file = common_dir / ref
+        files += (ref_file,)
+        commit = _read_text(ref_file) or _packed_ref(common_dir, ref)
+    else:
+        commit = head or None
+
+    ref_mtime = _mtime(ref_file) if ref_file is not None else None
+    last_commit = _commit_time(common_dir, commit) if commit else None
+    if last_commit is None and ref_mtime is not None:
+        last_commit = ref_mtime / 1e9
+
+    moved = ref_mtime if ref_mtime is not None else _mtime(head_file)
+    index_mtime = _mtime(index_file)
+    index_changed = (
+        index_mtime is not None and moved is not None and index_mtime > moved
+    )
+    return GitInfo(branch, commit, last_commit, index_changed), files
+
+
+def _signature(files: tuple[Path, ...]) -> tuple[int | None, ...]:
+    return tuple(_mtime(path) for path in files)
+
+
+# A result with the files and the signature that validate it.
+_CacheEntry = tuple[tuple[Path, ...], tuple[int | None, ...], GitInfo | None]
+
+
+class GitInfoReader:
+    """Reads git metadata of projects and caches the most recent results.
+
+    The cache is a bounded LRU keyed by project directory. The thread pool
+    that reads several repositories at once is created on first use and
+    released by shutdown().
+    """
+
+    def __init__(
+        self, max_entries: int = GIT_INFO_CACHE_SIZE, workers: int = GIT_INFO_WORKERS
+    ) -> None:
+        """Initializes a reader with an empty cache.
+
+        Args:
+            max_entries: The number of projects whose result is kept.
+            workers: The maximum number of repositories read concurrently.
+        """
+        self.max_entries = max_entries
+        self.workers = workers
+        self._cache: OrderedDict[Path, _CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._pool: ThreadPoolExecutor | None = None
+
+    def get_git_info(self, project: Path) -> GitInfo | None:
+        """Retrieves the git metadata of a project, reusing the cached result.
+
+        A cached result is reused while the modification times of the files
+        it was read from are unchanged.
+
+        Args:
+            project: The project directory.
+
+        Returns:
+            The GitInfo, or None if the project is not a git repository.
+        """
+        with self._lock:
+            entry = self._cache.get(project)
+            if entry is not None:
+                self._cache.move_to_end(project)
+        if entry is not None:
+            files, signature, info = entry
+            if _signature(files) == signature:
+                return info
+
+        info, files = _read(project)
+        with self._lock:
+            self._cache[project] = (files, _signature(files), info)
+            self._cache.move_to_end(project)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return info
+
+    def load_git_info(self, projects: Iterable[Path]) -> dict[Path, GitInfo]:
+        """Retrieves the git metadata of several projects in the pool.
+
+        Blocks until every project has been read, so call it from a worker.
+
+        Args:
+            projects: The project directories.
+
+        Returns:
+            The GitInfo of every project that is a git repository.
+        """
+        projects = list(projects)
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="nexus-git"
+                )
+            pool = self._pool
+        results = dict(zip(projects, pool.map(self.get_git_info, projects)))
+        return {path: info for path, info in results.items() if info is not None}
+
+    def clear_cache(self) -> None:
+        """Drops every cached result."""
+        with self._lock:
+            self._cache.clear()
+
+    def shutdown(self) -> None:
+        """Stops the thread pool without waiting for reads in progress.
+
+        A later load_git_info() starts a new pool.
+        """
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,325 @@
+"""Background jobs for tools that run alongside the TUI.
+
+Tools with `mode = "background"` are not given the terminal. Their command
+runs as an asyncio subprocess on the application's event loop, and its
+combined output is kept in a bounded ring buffer per job, so several tools
+can run at once while Nexus stays responsive.
+"""
+
+import asyncio
+import codecs
+import itertools
+import time
+from collections import deque
+from collections.abc import Callable
+from pathlib import Path
+from typing import Literal
+
+from nexus.logger import get_logger
+
+log = get_logger(__name__)
+
+# Lines of output kept per job; older lines are dropped.
+OUTPUT_LINES = 2000
+
+# Finished jobs kept for inspection; older ones are forgotten.
+MAX_FINISHED_JOBS = 20
+
+# Bytes read from a job's output at a time.
+READ_CHUNK = 65536
+
+JobStatus = Literal["queued", "running", "succeeded", "failed", "cancelled", "timeout"]
+
+
+class Job:
+    """A tool command running in the background.
+
+    Attributes:
+        id: The sequential job number.
+        label: The label of the tool that started the job.
+        argv: The command and its arguments.
+        cwd: The working directory, or None for the current one.
+        output: The most recent lines of combined stdout and stderr.
+        status: The state of the job.
+        returncode: The exit code once the process has exited.
+        started: The monotonic time the job started.
+        finished: The monotonic time the job finished, or None while running.
+    """
+
+    def __init__(
+        self,
+        id: int,
+        label: str,
+        argv: list[str],
+        cwd: Path | None = None,
+        max_lines: int = OUTPUT_LINES,
+        status: JobStatus = "running",
+    ) -> None:
+        """Initializes a job.
+
+        Args:
+            id: The sequential job number.
+            label: The label of the tool that started the job.
+            argv: The command and its arguments.
+            cwd: The working directory, or None for the current one.
+            max_lines: The number of output lines kept.
+            status: "running" for a job started right away, or "queued" for
+                one waiting for a free slot.
+        """
+        self.id = id
+        self.label = label
+        self.argv = argv
+        self.cwd = cwd
+        self.output: deque[str] = deque(maxlen=max_lines)
+        self.status: JobStatus = status
+        self.returncode: int | None = None
+        self.started = time.monotonic()
+        self.finished: float | None = None
+        self._process: asyncio.subprocess.Process | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._partial = ""
+
+    @property
+    def running(self) -> bool:
+        """Whether the job is waiting to run or has not finished yet."""
+        return self.status in ("queued", "running")
+
+    @property
+    def duration(self) -> float:
+        """Seconds the job has been running, or ran for."""
+        end = self.finished if self.finished is not None else time.monotonic()
+        return end - self.started
+
+    def _feed(self, text: str) -> list[str]:
+        """Appends decoded output and returns the lines it completed."""
+        lines = (self._partial + text).splitlines(keepends=True)
+        self._partial = ""
+        if lines and not lines[-1].endswith(("\n", "\r")):
+            self._partial = lines.pop()
+        complete = [line.rstrip("\r\n") for line in lines]
+        self.output.extend(complete)
+        return complete
+
+    def finish(self, returncode: int | None) -> None:
+        """Records the end of the job.
+
+        A cancelled or timed out job keeps its status; otherwise the exit
+        code decides whether it succeeded.
+
+        Args:
+            returncode: The exit code, or None if the process did not exit
+                on its own.
+        """
+        self.returncode = returncode
+        self.finished = time.monotonic()
+        if self.status not in ("cancelled", "timeout"):
+            self.status = "succeeded" if returncode == 0 else "failed"
+
+    def _flush(self) -> list[str]:
+        """Appends the unterminated last line of output, if any."""
+        if not self._partial:
+            return []
+        line, self._partial = self._partial, ""
+        self.output.append(line)
+        return [line]
+
+
+async def run_process(job: Job, on_output: Callable[[list[str]], None]) -> int | None:
+    """Spawns the process of a job and streams its output until it exits.
+
+    A process that cannot be started reports the error as its only output.
+    Output is decoded as UTF-8 incrementally, so a character split across
+    two reads is kept intact. If the coroutine is cancelled, the process is
+    killed.
+
+    Args:
+        job: The job to run. Its output buffer receives every line.
+        on_output: Called with the lines completed by each chunk of output.
+
+    Returns:
+        The exit code, or None if the process could not be started.
+    """
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *job.argv,
+            cwd=job.cwd,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+    except (OSError, ValueError) as e:
+        log.warning("job_start_failed", job=job.id, argv=job.argv, error=str(e))
+        job.output.append(str(e))
+        on_output([str(e)])
+        return None
+
+    job._process = process
+    if job.status == "cancelled":
+        process.terminate()
+
+    assert process.stdout is not None
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    try:
+        while chunk := await process.stdout.read(READ_CHUNK):
+            lines = job._feed(decoder.decode(chunk))
+            if lines:
+                on_output(lines)
+        lines = job._feed(decoder.decode(b"", final=True)) + job._flush()
+        if lines:
+            on_output(lines)
+        return await process.wait()
+    except asyncio.CancelledError:
+        if process.returncode is None:
+            process.kill()
+        raise
+
+
+class JobManager:
+    """Starts background jobs and reports their output.
+
+    Jobs run on the event loop that calls start(). Listeners are called on
+    that loop with the job and the lines it printed, and with no lines when
+    it starts or finishes.
+    """
+
+    def __init__(self, max_lines: int = OUTPUT_LINES) -> None:
+        """Initializes a manager without jobs.
+
+        Args:
+            max_lines: The number of output lines kept per job.
+        """
+        self.max_lines = max_lines
+        self._jobs: dict[int, Job] = {}
+        self._ids = itertools.count(1)
+        self._listeners: list[Callable[[Job, list[str]], None]] = []
+
+    @property
+    def jobs(self) -> list[Job]:
+        """The running and recently finished jobs, oldest first."""
+        return list(self._jobs.values())
+
+    @property
+    def running(self) -> list[Job]:
+        """The jobs that have not finished yet."""
+        return [job for job in self._jobs.values() if job.running]
+
+    def get(self, job_id: int) -> Job | None:
+        """Retrieves a job by its number."""
+        return self._jobs.get(job_id)
+
+    def subscribe(self, listener: Callable[[Job, list[str]], None]) -> None:
+        """Registers a callback for job output and status changes.
+
+        Args:
+            listener: Called on the event loop with the job and its new lines.
+        """
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[Job, list[str]], None]) -> None:
+        """Removes a callback registered with subscribe().
+
+        Args:
+            listener: The callback to remove.
+        """
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def start(self, label: str, argv: list[str], cwd: Path | None = None) -> Job:
+        """Starts a command in the background.
+
+        Must be called from a running event loop, which the job then runs on.
+
+        Args:
+            label: The label of the tool that started the job.
+            argv: The command and its arguments.
+            cwd: The working directory, or None for the current one.
+
+        Returns:
+            The running job.
+        """
+        job = Job(next(self._ids), label, argv, cwd, self.max_lines)
+        self._jobs[job.id] = job
+        self._prune()
+        job._task = asyncio.get_running_loop().create_task(
+            self._run(job), name=f"nexus-job-{job.id}"
+        )
+        job._task.add_done_callback(lambda task: self._on_task_done(job, task))
+        self._notify(job, [])
+        return job
+
+    def cancel(self, job_id: int) -> bool:
+        """Terminates a running job.
+
+        Args:
+            job_id: The number of the job.
+
+        Returns:
+            True if the job was running.
+        """
+        job = self._jobs.get(job_id)
+        if job is None or not job.running:
+            return False
+        job.status = "cancelled"
+        if job._process is None:
+            # The process is still being spawned.
+            if job._task is not None:
+                job._task.cancel()
+        elif job._process.returncode is None:
+            try:
+                job._process.terminate()
+            except ProcessLookupError:
+                pass
+        return True
+
+    def cancel_all(self) -> None:
+        """Terminates every running job."""
+        for job in self.running:
+            self.cancel(job.id)
+
+    async def wait(self, job_id: int) -> Job | None:
+        """Waits for a job to finish.
+
+        Args:
+            job_id: The number of the job.
+
+        Returns:
+            The finished job, or None if there is no such job.
+        """
+        job = self._jobs.get(job_id)
+        if job is not None and job._task is not None:
+            try:
+                await asyncio.shield(job._task)
+            except asyncio.CancelledError:
+                # Only a cancelled job ends here; a cancelled wait propagates.
+                if not job._task.cancelled():
+                    raise
+        return job
+
+    async def _run(self, job: Job) -> None:
+        """Runs the process of a job and reports its output."""
+        returncode = await run_process(job, lambda lines: self._notify(job, lines))
+        self._finish(job, returncode)
+
+    def _on_task_done(self, job: Job, task: asyncio.Task[None]) -> None:
+        """Records a job whose task was cancelled, even before it started."""
+        if task.cancelled() and job.finished is None:
+            if job.status != "timeout":
+                job.status = "cancelled"
+            self._finish(job, None)
+
+    def _finish(self, job: Job, returncode: int | None) -> None:
+        """Records the end of a job and reports it."""
+        job.finish(returncode)
+        log.info("job_finished", job=job.id, status=job.status, code=returncode)
+        self._notify(job, [])
+
+    def _prune(self) -> None:
+        """Forgets the oldest finished jobs beyond MAX_FINISHED_JOBS."""
+        finished = [job for job in self._jobs.values() if not job.running]
+        for job in finished[: max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self._jobs[job.id]
+
+    def _notify(self, job: Job, lines: list[str]) -> None:
+        """Calls every listener with a job update."""
+        for listener in list(self._listeners):
+            listener(job, lines)
@@ -0,0 +1,202 @@
+"""In-memory index of discovered projects.
+
+Holds the projects found by the scanner together with precomputed match
+keys, so that the picker can rank them on every keystroke without touching
+the filesystem.
+"""
+
+import threading
+from collections.abc import Iterable, Iterator, Mapping
+from pathlib import Path
+from typing import NamedTuple
+
+from nexus.models import Project
+from nexus.services.fuzzy import FUZZY_LIMIT, FuzzyIndex
+from nexus.services.ranking import MatchKey, SearchCorpus, match_key, rank
+from nexus.services.refine import RefinementCache
+
+
+class _Snapshot(NamedTuple):
+    projects: tuple[Project, ...]
+    keys: tuple[MatchKey, ...]
+    positions: dict[Path, int]
+
+
+class ProjectIndex:
+    """A deduplicated, searchable set of projects.
+
+    The scanner thread adds projects while the UI ranks them, so every
+    method is safe to call from any thread. Added projects are appended in
+    place, so a scan streaming in many batches costs time linear in the
+    number of projects. Ranking works on an immutable snapshot, taken when
+    the projects are next read, and never blocks on a running scan.
+
+    Attributes:
+        version: Incremented whenever the indexed projects change.
+    """
+
+    def __init__(self, projects: Iterable[Project] = ()) -> None:
+        """Initializes the index.
+
+        Args:
+            projects: The initial projects. Later duplicates of a path are
+                ignored.
+        """
+        self._lock = threading.Lock()
+        self._projects: list[Project] = []
+        self._keys: list[MatchKey] = []
+        self._positions: dict[Path, int] = {}
+        self._snapshot: _Snapshot | None = None
+        self._corpus: tuple[_Snapshot, SearchCorpus] | None = None
+        self._fuzzy: tuple[_Snapshot, FuzzyIndex[Project]] | None = None
+        self._refinements: RefinementCache[list[int]] = RefinementCache()
+        self.version = 0
+        self.add(projects)
+
+    def add(self, projects: Iterable[Project]) -> list[Project]:
+        """Adds projects whose path is not indexed yet.
+
+        Args:
+            projects: The projects to add.
+
+        Returns:
+            The projects that were actually added.
+        """
+        with self._lock:
+            added: list[Project] = []
+            for project in projects:
+                if project.path not in self._positions:
+                    self._positions[project.path] = len(self._projects)
+                    self._projects.append(project)
+                    self._keys.append(match_key(project.name, project.path))
+                    added.append(project)
+            if added:
+                self._snapshot = None
+                self.version += 1
+        return added
+
+    def replace(self, projects: Iterable[Project]) -> None:
+        """Replaces the indexed projects, for example after a full scan.
+
+        Args:
+            projects: The new projects. Later duplicates of a path are
+                ignored.
+        """
+        unique: dict[Path, Project] = {}
+        for project in projects:
+            unique.setdefault(project.path, project)
+        keys = [match_key(p.name, p.path) for p in unique.values()]
+        positions = {path: i for i, path in enumerate(unique)}
+        with self._lock:
+            self._projects = list(unique.values())
+            self._keys = keys
+            self._positions = positions
+            self._snapshot = None
+            self.version += 1
+
+    def rank(
+        self,
+        query: str,
+        frecency: Mapping[Path, float] | None = None,
+        limit: int | None = None,
+    ) -> list[Project]:
+        """Finds the projects matching a query, best first.
+
+        Args:
+            query: The search text. Matching ignores case and accepts
+                subsequences of the name or trailing path segments.
+            frecency: Launch frecency per project path, used as a boost.
+            limit: The maximum number of results, or None for every match.
+
+        Returns:
+            The matching projects; every project for an empty query, ordered
+            by frecency.
+        """
+        with self._lock:
+            snapshot, version = self._current(), self.version
+        needle = query.strip().lower()
+        cached = self._refinements.lookup(needle, version) if needle else None
+
+        if cached is None:
+            boosts = {
+                snapshot.positions[path]: value
+                for path, value in (frecency or {}).items()
+                if path in snapshot.positions
+            }
+            ranked = rank(
+                snapshot.projects, self._search_corpus(snapshot), query, boosts, limit
+            )
+        else:
+            # Only the matches of a query this one extends can match. They
+            # keep the index order, so ties are still broken the same way.
+            positions = cached.matches
+            index = {position: i for i, position in enumerate(positions)}
+            boosts = {
+                index[position]: value
+                for path, value in (frecency or {}).items()
+                if (position := snapshot.positions.get(path)) in index
+            }
+            ranked = rank(
+                [snapshot.projects[i] for i in positions],
+                SearchCorpus([snapshot.keys[i] for i in positions]),
+                query,
+                boosts,
+                limit,
+            )
+
+        if needle and (limit is None or len(ranked) < limit):
+            # Fewer results than the limit means every match is known.
+            matches = sorted(snapshot.positions[project.path] for project in ranked)
+            self._refinements.push(needle, matches, version)
+        return ranked
+
+    def fuzzy(self, query: str, limit: int = FUZZY_LIMIT) -> list[Project]:
+        """Finds the projects whose name resembles a query, typos included.
+
+        Args:
+            query: The search text.
+            limit: The maximum number of results.
+
+        Returns:
+            The matching projects, best first.
+        """
+        with self._lock:
+            snapshot = self._current()
+        cached = self._fuzzy
+        if cached is None or cached[0] is not snapshot:
+            names = (project.name for project in snapshot.projects)
+            cached = (snapshot, FuzzyIndex(snapshot.projects, names))
+            self._fuzzy = cached
+        return cached[1].search(query, limit)
+
+    def _current(self) -> _Snapshot:
+        """Returns the snapshot of the indexed projects. Callers must hold the lock."""
+        if self._snapshot is None:
+            self._snapshot = _Snapshot(
+                tuple(self._projects), tuple(self._keys), dict(self._positions)
+            )
+        return self._snapshot
+
+    def _search_corpus(self, snapshot: _Snapshot) -> SearchCorpus:
+        """Returns the search corpus of a snapshot, built on first use.
+
+        Building it lazily keeps add() cheap while a scan streams batches in.
+        """
+        cached = self._corpus
+        if cached is not None and cached[0] is snapshot:
+            return cached[1]
+        corpus = SearchCorpus(snapshot.keys)
+        self._corpus = (snapshot, corpus)
+        return corpus
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._projects)
+
+    def __iter__(self) -> Iterator[Project]:
+        with self._lock:
+            return iter(self._current().projects)
+
+    def __contains__(self, path: object) -> bool:
+        with self._lock:
+            return path in self._positions
@@ -0,0 +1,218 @@
+"""Application-wide project scan.
+
+Owns the project index shared by every project picker. The app starts the
+scan in the background right after startup, so that a picker opened later
+attaches to the cached or in-progress result instead of scanning itself.
+"""
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from contextlib import aclosing
+from pathlib import Path
+from typing import Literal, NamedTuple
+
+from nexus.logger import get_logger
+from nexus.models import Project
+from nexus.services.project_index import ProjectIndex
+
+log = get_logger(__name__)
+
+# Seconds a finished scan is reused before opening a picker rescans.
+RESCAN_INTERVAL = 30.0
+
+ScanStatus = Literal["idle", "scanning", "stopped", "finished"]
+
+
+class ScanUpdate(NamedTuple):
+    """A change to the project index, reported to scan listeners.
+
+    Attributes:
+        added: Projects that were added to the index.
+        replaced: Whether the whole index was replaced.
+    """
+
+    added: list[Project]
+    replaced: bool
+
+
+def _by_name(projects: list[Project]) -> list[Project]:
+    """Sorts projects by name, the order of equally ranked results."""
+    return sorted(projects, key=lambda p: p.name.lower())
+
+
+class ProjectScan:
+    """A background scan of the project roots into a shared index.
+
+    Listeners are called on the scan thread, after the index has changed.
+
+    Attributes:
+        index: Every known project: the cached and recent projects first,
+            replaced by the full result once a scan finishes.
+        status: The state of the latest scan.
+        found: The number of projects found by the latest scan so far.
+        show_roots: Whether more than one project root is scanned.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an idle scan with an empty index."""
+        self.index = ProjectIndex()
+        self.status: ScanStatus = "idle"
+        self.found = 0
+        self.show_roots = False
+        self._lock = threading.Lock()
+        self._listeners: list[Callable[[ScanUpdate], None]] = []
+        self._stop = threading.Event()
+        self._seeded = False
+        self._finished_at = 0.0
+
+    def start(self) -> bool:
+        """Starts a scan in a background thread unless the index is current.
+
+        Nothing is started while a scan is running or shortly after one
+        finished.
+
+        Returns:
+            True if a new scan was started.
+        """
+        with self._lock:
+            if self.status == "scanning":
+                return False
+            recent = time.monotonic() - self._finished_at < RESCAN_INTERVAL
+            if self.status == "finished" and recent:
+                return False
+            self.status = "scanning"
+            self.found = 0
+            self._stop = threading.Event()
+            stop = self._stop
+
+        threading.Thread(
+            target=asyncio.run,
+            args=(self._run(stop),),
+            name="nexus-project-scan",
+            daemon=True,
+        ).start()
+        return True
+
+    def stop(self) -> None:
+        """Stops the running scan and keeps what has been indexed so far.
+
+        No update is reported; the caller renders the index itself.
+        """
+        with self._lock:
+            if self.status != "scanning":
+                return
+            self._stop.set()
+            self.status = "stopped"
+
+    def subscribe(self, listener: Callable[[ScanUpdate], None]) -> None:
+        """Registers a callback for index changes.
+
+        Args:
+            listener: Called on the scan thread with every ScanUpdate.
+        """
+        with self._lock:
+            self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[ScanUpdate], None]) -> None:
+        """Removes a callback registered with subscribe().
+
+        Args:
+            listener: The callback to remove.
+        """
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def _notify(self, update: ScanUpdate, stop: threading.Event) -> bool:
+        """Reports an update unless the scan has been stopped.
+
+        Returns:
+            False if the scan was stopped and should end.
+        """
+        with self._lock:
+            if stop.is_set():
+                return False
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener(update)
+        return True
+
+    async def _run(self, stop: threading.Event) -> None:
+        """Scans the project roots, reporting progress to the listeners."""
+        try:
+            await self._scan(stop)
+        except (OSError, RuntimeError) as e:
+            log.error("project_scan_failed", error=str(e))
+            with self._lock:
+                if not stop.is_set():
+                    self.status = "stopped"
+
+    async def _scan(self, stop: threading.Event) -> None:
+        from nexus.container import get_container
+
+        container = get_container()
+        config_manager = container.config_manager
+        roots = config_manager.get_project_roots()
+        max_depth = config_manager.get_scan_depth()
+        prune = config_manager.get_scan_prune()
+        self.show_roots = len(roots) > 1
+
+        recents = _recent_projects()
+        if not self._seeded:
+            # The scan cache makes the list usable before the walk starts.
+            cached: list[Project] = []
+            for root in roots:
+                cached.extend(
+                    container.scanner.load_cached_projects(
+                        root, max_depth=max_depth, prune=prune, roots=roots
+                    )
+                    or []
+                )
+            self.index.replace(_by_name([*cached, *recents]))
+            self._seeded = True
+            if not self._notify(ScanUpdate([], replaced=True), stop):
+                return
+        else:
+            self.index.add(recents)
+
+        projects: list[Project] = []
+        async with aclosing(
+            container.scanner.iter_roots(
+                roots, max_depth=max_depth, prune=prune, use_cache=True
+            )
+        ) as batches:
+            async for batch in batches:
+                # Closing the generator on the way out ends the walk.
+                if stop.is_set():
+                    return
+                projects.extend(batch)
+                self.found = len(projects)
+                update = ScanUpdate(self.index.add(batch), replaced=False)
+                if not self._notify(update, stop):
+                    return
+
+        with self._lock:
+            if stop.is_set():
+                return
+            self.index.replace(_by_name([*projects, *recents]))
+            self.status = "finished"
+            self._finished_at = time.monotonic()
+        self._notify(ScanUpdate([], replaced=True), stop)
+
+
+def _recent_projects() -> list[Project]:
+    """Builds projects for the recently used paths that still exist.
+
+    Returns:
+        The recent projects, most recent first.
+    """
+    from nexus.container import get_container
+
+    recents = get_container().state_manager.get_recents()
+    return [
+        Project(name=path.name, path=path, is_git=False)
+        for path in map(Path, recents)
+        if path.exists()
+    ]
@@ -0,0 +1,379 @@
+"""Ranking of search results by fuzzy match quality and frecency.
+
+Match keys are computed once per item and joined into a SearchCorpus, so
+that ranking a query scans every candidate with C-level regex operations and
+only scores the matches in Python. The best results are selected with a
+bounded heap instead of sorting every match.
+"""
+
+import heapq
+import math
+import re
+import time
+from collections.abc import Iterable, Mapping, Sequence
+from collections.abc import Set as AbstractSet
+from itertools import islice
+from pathlib import Path
+from typing import NamedTuple
+
+# Launches lose half of their weight after this many seconds.
+FRECENCY_HALF_LIFE = 7 * 86_400
+
+# Score added per unit of log frecency. Large enough to reorder matches of
+# similar quality, small enough that a much better match still wins.
+FRECENCY_WEIGHT = 60.0
+
+# Number of trailing path segments searched by subsequence matching. Leading
+# segments such as the home directory are shared by every project and would
+# only add noise.
+TAIL_SEGMENTS = 3
+
+
+class MatchKey(NamedTuple):
+    """Precomputed, lowercased search keys of an item.
+
+    Attributes:
+        name: The display name.
+        path: The full path.
+        tail: The last few path segments, used for subsequence matching.
+    """
+
+    name: str
+    path: str
+    tail: str
+
+
+def match_key(name: str, path: Path | str) -> MatchKey:
+    """Builds the search keys for an item.
+
+    Args:
+        name: The display name.
+        path: The filesystem path of the item.
+
+    Returns:
+        The lowercased MatchKey.
+    """
+    path_key = str(path).lower()
+    tail = "/".join(path_key.replace("\\", "/").split("/")[-TAIL_SEGMENTS:])
+    return MatchKey(name.lower(), path_key, tail)
+
+
+def frecency(count: int, last_used: float, now: float | None = None) -> float:
+    """Combines how often and how recently an item was used.
+
+    Args:
+        count: The number of uses.
+        last_used: Unix time of the last use.
+        now: The current Unix time. Defaults to time.time().
+
+    Returns:
+        The use count decayed by the age of the last use.
+    """
+    age = max(0.0, (time.time() if now is None else now) - last_used)
+    return count * math.exp2(-age / FRECENCY_HALF_LIFE)
+
+
+def subsequence_pattern(query: str, separator: str = "") -> re.Pattern[str]:
+    """Compiles a pattern matching the query characters in order.
+
+    Each character is matched at its first occurrence after the previous
+    one, with possessive gaps, so a failing candidate costs linear time
+    instead of backtracking.
+
+    Args:
+        query: The lowercased query.
+        separator: Characters the match may not cross, if any.
+    """
+    first, *rest = map(re.escape, query)
+    excluded = "".join(map(re.escape, separator))
+    return re.compile(first + "".join(f"[^{c}{excluded}]*+{c}" for c in rest))
+
+
+def _substring_score(position: int, length: int, query_length: int) -> float:
+    if position == 0:
+        if length == query_length:
+            return 1000.0
+        return max(800.0, 900.0 - length)
+    return max(600.0, 700.0 - length - min(position, 99) / 100)
+
+
+def _path_score(tail_length: int) -> float:
+    return max(400.0, 500.0 - tail_length)
+
+
+def _subsequence_score(end: int) -> float:
+    return max(300.0, 400.0 - end)
+
+
+# Best possible score of the path substring, name subsequence and tail
+# subsequence tiers. A subsequence that is not a substring spans at least
+# two characters.
+_PATH_BEST = 500.0
+_NAME_SUBSEQUENCE_BEST = 398.0
+_TAIL_SUBSEQUENCE_BEST = 198.0
+
+
+def score(query: str, key: MatchKey, pattern: re.Pattern[str] | None = None) -> float:
+    """Scores how well an item matches a query.
+
+    Matches are tiered: an exact or prefix match on the name beats a
+    substring of the name, which beats a substring of the path, which beats
+    a subsequence of the name and finally a subsequence of the trailing path
+    segments. Within a tier, shorter names, earlier and tighter matches win.
+    The tiers' score ranges do not overlap.
+
+    Args:
+        query: The lowercased query.
+        key: The item's MatchKey.
+        pattern: The query's subsequence pattern, if already compiled.
+
+    Returns:
+        The score, or 0.0 if the item does not match at all.
+    """
+    name = key.name
+    position = name.find(query)
+    if position >= 0:
+        return _substring_score(position, len(name), len(query))
+    if query in key.path:
+        return _path_score(len(key.tail))
+
+    pattern = pattern or subsequence_pattern(query)
+    match = pattern.search(name)
+    if match is not None:
+        return _subsequence_score(match.end())
+    match = pattern.search(key.tail)
+    if match is not None:
+        return max(1.0, 200.0 - (match.end() - match.start()))
+    return 0.0
+
+
+# Matches the rest of a corpus line after a match, capturing the remaining
+# text and the item position.
+_LINE_END = r"([^\n]*)\x00(\d+)"
+
+
+class _Column:
+    """One key field of every item, bucketed by length.
+
+    Every bucket joins its values into one string of lines of the form
+    "\\n<value>\\x00<position>", so that a single findall() finds the
+    matching items of the whole bucket.
+
+    Attributes:
+        buckets: The value length and joined lines of every bucket, shortest
+            first.
+    """
+
+    def __init__(self, values: Sequence[str], lengths: Sequence[int]) -> None:
+        """Buckets the values.
+
+        Args:
+            values: The value of every item.
+            lengths: The length every item is bucketed by.
+        """
+        grouped: dict[int, list[str]] = {}
+        for i, value in enumerate(values):
+            line = "\n" + value.replace("\n", " ").replace("\x00", " ")
+            grouped.setdefault(lengths[i], []).append(f"{line}\x00{i}")
+        self.buckets = [(n, "".join(grouped[n])) for n in sorted(grouped)]
+
+
+class SearchCorpus:
+    """The match keys of many items, prepared for fast scanning.
+
+    A query is matched against a whole bucket of items by one C-level regex
+    scan, and Python code only runs for the items that match. Buckets are
+    ordered by length, which lets a scan for the best few results stop once
+    no remaining bucket can outscore them.
+
+    Attributes:
+        keys: The MatchKey of every item.
+    """
+
+    def __init__(self, keys: Iterable[MatchKey]) -> None:
+        """Builds the corpus.
+
+        Args:
+            keys: The MatchKey of every item, in item order.
+        """
+        self.keys = tuple(keys)
+        names = [k.name for k in self.keys]
+        tails = [k.tail for k in self.keys]
+        tail_lengths = list(map(len, tails))
+        self._names = _Column(names, list(map(len, names)))
+        self._paths = _Column([k.path for k in self.keys], tail_lengths)
+        self._tails = _Column(tails, tail_lengths)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def match(
+        self,
+        query: str,
+        skip: AbstractSet[int] = frozenset(),
+        enough: int | None = None,
+    ) -> dict[int, float]:
+        """Scores the items that match a query.
+
+        Produces the same scores as score(), tier by tier.
+
+        Args:
+            query: The lowercased, non-empty query.
+            skip: Positions of items to leave out.
+            enough: The number of results wanted. Once that many matches
+                score higher than any remaining item could, the remaining
+                items are left out.
+
+        Returns:
+            The score of every reported match, by position.
+        """
+        query = query.replace("\n", " ").replace("\x00", " ")
+        size = len(query)
+        scores: dict[int, float] = {}
+        # Min-heap of the `enough` best scores so far.
+        best: list[float] = []
+
+        def keep(i: int, value: float) -> None:
+            if i in scores or i in skip:
+                return
+            scores[i] = value
+            if enough is None:
+                return
+            if len(best) < enough:
+                heapq.heappush(best, value)
+            elif value > best[0]:
+                heapq.heapreplace(best, value)
+
+        def beaten(bound: float) -> bool:
+            return enough is not None and len(best) >= enough and best[0] > bound
+
+        literal = re.escape(query)
+        prefix = re.compile("\n" + literal + _LINE_END)
+        for length, text in self._names.buckets:
+            value = _substring_score(0, length, size)
+            if beaten(value):
+                break
+            for _rest, i in prefix.findall(text):
+                keep(int(i), value)
+
+        substring = re.compile(literal + _LINE_END)
+        for length, text in self._names.buckets:
+            if beaten(_substring_score(1, length, size)):
+                break
+            for rest, i in substring.findall(text):
+                position = length - size - len(rest)
+                keep(int(i), _substring_score(position, length, size))
+        if beaten(_PATH_BEST):
+            return scores
+
+        for length, text in self._paths.buckets:
+            value = _path_score(length)
+            if beaten(value):
+                break
+            for _rest, i in substring.findall(text):
+                keep(int(i), value)
+        if beaten(_NAME_SUBSEQUENCE_BEST):
+            return scores
+
+        chain = subsequence_pattern(query, "\n\x00").pattern
+        subsequence = re.compile(chain + _LINE_END)
+        for length, text in self._names.buckets:
+            for rest, i in subsequence.findall(text):
+                keep(int(i), _subsequence_score(length - len(rest)))
+        if beaten(_TAIL_SUBSEQUENCE_BEST):
+            return scores
+
+        spanned = re.compile(f"({chain})" + _LINE_END)
+        for _length, text in self._tails.buckets:
+            for matched, _rest, i in spanned.findall(text):
+                keep(int(i), max(1.0, 200.0 - len(matched)))
+        return scores
+
+
+def rank[T](
+    items: Sequence[T],
+    corpus: SearchCorpus,
+    query: str,
+    boosts: Mapping[int, float] | None = None,
+    limit: int | None = None,
+) -> list[T]:
+    """Ranks items by match score plus a frecency boost.
+
+    Args:
+        items: The candidates.
+        corpus: The match keys of the candidates, in the same order.
+        query: The search text. An empty query ranks by boost alone.
+        boosts: The frecency of the candidates that have one, by position.
+        limit: The maximum number of results, or None for every match.
+
+    Returns:
+        The matching items, best first. Ties keep their original order.
+    """
+    needle = query.strip().lower()
+    boosts = boosts or {}
+    count = len(items) if limit is None else min(limit, len(items))
+
+    scores: dict[int, float] = {}
+    if not needle:
+        boosted = {i: FRECENCY_WEIGHT * math.log1p(v) for i, v in boosts.items()}
+        best = sorted(boosted, key=lambda i: (-boosted[i], i))[:count]
+        rest = (i for i in range(len(items)) if i not in boosted)
+        best.extend(islice(rest, count - len(best)))
+        return [items[i] for i in best]
+
+    # Boosted items are scored one by one and left out of the corpus scan,
+    # whose early exit only holds for unboosted scores.
+    pattern = subsequence_pattern(needle)
+    for i, value in boosts.items():
+        base = score(needle, corpus.keys[i], pattern)
+        if base > 0.0:
+            scores[i] = base + FRECENCY_WEIGHT * math.log1p(value)
+    scores.update(corpus.match(needle, skip=boosts.keys(), enough=limit))
+
+    ranked = ((value, -i) for i, value in scores.items())
+    if limit is None or limit >= len(scores):
+        ordered = sorted(ranked, reverse=True)
+    else:
+        ordered = heapq.nlargest(limit, ranked)
+    return [items[-neg] for _value, neg in ordered]
+
+
+def frecency_map(
+    history: Mapping[str, tuple[int, float]], now: float | None = None
+) -> dict[Path, float]:
+    """Computes the frecency of every path in a launch history.
+
+    Args:
+        history: Launch count and last launch time per path.
+        now: The current Unix time. Defaults to time.time().
+
+    Returns:
+        The frecency per path.
+    """
+    now = time.time() if now is None else now
+    return {
+        Path(path): frecency(count, last_used, now)
+        for path, (count, last_used) in history.items()
+    }
+
+
+def frecency_ranks(
+    history: Mapping[str, tuple[int, float]], now: float | None = None
+) -> dict[str, int]:
+    """Orders the keys of a launch history by frecency.
+
+    Args:
+        history: Launch count and last launch time per key.
+        now: The current Unix time. Defaults to time.time().
+
+    Returns:
+        The position of every key, 0 for the highest frecency. Keys with
+        equal frecency keep the more recently launched one first.
+    """
+    now = time.time() if now is None else now
+    scores = {
+        key: frecency(count, last_used, now)
+        for key, (count, last_used) in history.items()
+    }
+    ordered = sorted(scores, key=lambda key: (-scores[key], -history[key][1]))
+    return {key: position for position, key in enumerate(ordered)}
@@ -0,0 +1,86 @@
+"""Result cache for searches that narrow as the user types.
+
+Every character typed extends the query, and the matches of the longer query
+are a subset of the matches of the shorter one. The cache keeps a stack of
+the recent queries, each extending the one below, together with their
+complete match sets. A new query is matched against the results of the
+longest cached query it extends instead of the whole dataset, and deleting
+characters pops back to a cached query without searching again.
+"""
+
+import threading
+from typing import NamedTuple
+
+# Maximum number of queries kept on the stack.
+REFINE_DEPTH = 16
+
+
+class Refinement[T](NamedTuple):
+    """A cached query and its complete match set.
+
+    Attributes:
+        query: The normalized query.
+        matches: Every match of the query.
+    """
+
+    query: str
+    matches: T
+
+
+class RefinementCache[T]:
+    """A stack of queries, each extending the query below it."""
+
+    def __init__(self, depth: int = REFINE_DEPTH) -> None:
+        """Initializes an empty cache.
+
+        Args:
+            depth: The maximum number of queries kept.
+        """
+        self.depth = depth
+        self._stack: list[Refinement[T]] = []
+        self._version = 0
+        self._lock = threading.Lock()
+
+    def lookup(self, query: str, version: int = 0) -> Refinement[T] | None:
+        """Finds the longest cached query that the query extends.
+
+        Queries that the new one does not extend are dropped, so typing
+        a different query starts over.
+
+        Args:
+            query: The normalized query.
+            version: The version of the searched data. A different version
+                than the cached one clears the cache.
+
+        Returns:
+            The cached query, which is equal to or a prefix of the query, and
+            its matches, or None if no cached query helps.
+        """
+        with self._lock:
+            if version != self._version:
+                self._stack.clear()
+                self._version = version
+            stack = self._stack
+            while stack and not query.startswith(stack[-1].query):
+                stack.pop()
+            return stack[-1] if stack else None
+
+    def push(self, query: str, matches: T, version: int = 0) -> None:
+        """Caches the complete match set of a query.
+
+        Args:
+            query: The normalized query.
+            matches: Every match of the query.
+            version: The version of the searched data.
+        """
+        with self._lock:
+            if version != self._version:
+                self._stack.clear()
+                self._version = version
+            stack = self._stack
+            while stack and not query.startswith(stack[-1].query):
+                stack.pop()
+            if stack and stack[-1].query == query:
+                stack.pop()
+            stack.append(Refinement(query, matches))
+            del stack[: -self.depth]
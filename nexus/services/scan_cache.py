@@ -0,0 +1,162 @@
+"""Persistent cache of directory listings for the project scanner.
+
+Stores, per project root, the listing of every directory the scanner
+visited together with that directory's modification time. A rescan only
+lists directories whose mtime changed and reuses the cached listing for the
+rest, which keeps rescans cheap on slow or network filesystems. The last
+scan result is stored as well so it can be displayed before any IO.
+"""
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import platformdirs
+
+from nexus.logger import get_logger
+from nexus.models import Project
+
+log = get_logger(__name__)
+
+# Directory holding one cache file per project root.
+SCAN_CACHE_DIR = Path(platformdirs.user_cache_dir("nexus")) / "projects"
+
+# Bumped whenever the cache layout changes.
+SCAN_CACHE_FORMAT = 2
+
+
+class DirListing(NamedTuple):
+    """The parts of a directory listing the scanner needs.
+
+    Attributes:
+        markers: Names of project markers present in the directory.
+        subdirs: (name, is_symlink) pairs for every child directory.
+    """
+
+    markers: tuple[str, ...]
+    subdirs: tuple[tuple[str, bool], ...]
+
+
+class ScanCache:
+    """Directory listings of a single project root, keyed by mtime.
+
+    Lookups and stores are safe to call from the scanner's worker threads.
+    """
+
+    def __init__(self, root: Path, cache_dir: Path | None = None) -> None:
+        """Initializes the cache and loads it from disk.
+
+        Args:
+            root: The project root whose listings are cached.
+            cache_dir: Directory for the cache file. Defaults to SCAN_CACHE_DIR.
+        """
+        digest = hashlib.sha1(str(root).encode()).hexdigest()[:16]
+        self.path = (cache_dir or SCAN_CACHE_DIR) / f"{digest}.json"
+        self.root = str(root)
+        self._lock = threading.Lock()
+        self._dirs: dict[str, list[Any]] = {}
+        self._results: dict[str, list[dict[str, Any]]] = {}
+        self._visited: set[str] = set()
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    def _load(self) -> None:
+        """Loads the cache file, discarding it if it is unreadable."""
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            log.warning("scan_cache_unreadable", error=str(e))
+            return
+
+        if data.get("format") != SCAN_CACHE_FORMAT or data.get("root") != self.root:
+            return
+        self._dirs = data.get("dirs", {})
+        self._results = data.get("results", {})
+
+    def lookup(self, directory: str, mtime_ns: int) -> DirListing | None:
+        """Returns the cached listing if the directory is unchanged.
+
+        Args:
+            directory: The directory path.
+            mtime_ns: The directory's current modification time.
+
+        Returns:
+            The cached DirListing, or None if it is missing or stale.
+        """
+        with self._lock:
+            self._visited.add(directory)
+            entry = self._dirs.get(directory)
+            if entry is None or entry[0] != mtime_ns:
+                self.misses += 1
+                return None
+            self.hits += 1
+        markers, subdirs = entry[1], entry[2]
+        return DirListing(tuple(markers), tuple((n, s) for n, s in subdirs))
+
+    def store(self, directory: str, mtime_ns: int, listing: DirListing) -> None:
+        """Records a fresh listing.
+
+        Args:
+            directory: The directory path.
+            mtime_ns: The modification time observed before listing.
+            listing: The listing to cache.
+        """
+        with self._lock:
+            self._visited.add(directory)
+            self._dirs[directory] = [
+                mtime_ns,
+                list(listing.markers),
+                [list(s) for s in listing.subdirs],
+            ]
+
+    def cached_projects(self, key: str) -> list[Project] | None:
+        """Returns the result of the last scan with the same settings.
+
+        Args:
+            key: Identifies the scan settings (depth and prune rules).
+
+        Returns:
+            The previously found projects, or None if there is no result.
+        """
+        results = self._results.get(key)
+        if results is None:
+            return None
+        return [Project.model_validate(p) for p in results]
+
+    def save(self, key: str, projects: list[Project]) -> None:
+        """Persists the listings visited in this scan and its result.
+
+        Listings of directories that were not visited are dropped so the
+        cache does not grow with deleted or pruned directories.
+
+        Args:
+            key: Identifies the scan settings (depth and prune rules).
+            projects: The projects found by the scan.
+        """
+        with self._lock:
+            dirs = {d: self._dirs[d] for d in self._visited if d in self._dirs}
+            self._visited = set()
+        self._dirs = dirs
+        self._results[key] = [p.model_dump(mode="json") for p in projects]
+
+        data = {
+            "format": SCAN_CACHE_FORMAT,
+            "root": self.root,
+            "dirs": self._dirs,
+            "results": self._results,
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.path.with_suffix(".tmp")
+            with open(tmp_file, "w") as f:
+                json.dump(data, f)
+
+            tmp_file.replace(self.path)
+        except (OSError, TypeError, ValueError) as e:
+            log.warning("scan_cache_write_failed", error=str(e))
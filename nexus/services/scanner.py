@@ -1,45 +1,519 @@
 """Service for scanning the filesystem.
 
 Provides asynchronous methods to discover projects and git repositories
-within the configured project root.
+within the configured project roots.
 """
 
 import asyncio
+import os
+import threading
+from collections.abc import AsyncGenerator, Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import aclosing
 from pathlib import Path
+from typing import Any
 
+from nexus.logger import get_logger
 from nexus.models import Project
+from nexus.services.scan_cache import DirListing, ScanCache
 
+log = get_logger(__name__)
 
-async def scan_projects(root_path: Path) -> list[Project]:
-    """Scans the root path for project directories asynchronously.
+# Directory names that are never listed as projects or descended into.
+DEFAULT_PRUNE = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".svn",
+        ".tox",
+        ".venv",
+        "__pycache__",
+        "node_modules",
+        "target",
+        "venv",
+    }
+)
+
+# Entries whose presence marks a directory as a project root.
+PROJECT_MARKERS = frozenset(
+    {
+        ".git",
+        ".hg",
+        "Cargo.toml",
+        "go.mod",
+        "package.json",
+        "pyproject.toml",
+        "setup.py",
+    }
+)
+
+# Upper bound for the number of directories listed concurrently.
+MAX_SCAN_WORKERS = 8
+
+# Number of leaf directories probed per task.
+LEAF_CHUNK = 64
+
+# Seconds after which the scan of a single project root is abandoned.
+ROOT_SCAN_TIMEOUT = 10.0
+
+# Seconds between checks whether a walk waiting on its tasks was cancelled.
+CANCEL_POLL_INTERVAL = 0.1
+
+
+def _is_git(path: str) -> bool:
+    """Checks for a .git entry with a single stat call."""
+    return os.path.lexists(os.path.join(path, ".git"))
+
+
+class _Walker:
+    """Walks a directory tree breadth first over a bounded thread pool.
+
+    Every task lists a single directory with os.scandir and relies on the
+    DirEntry type information instead of stat calls. A directory becomes a
+    project when it contains a project marker, when it has no subdirectories
+    left to descend into, or when it sits at the maximum depth. Each visit
+    submits its subdirectories as new tasks, so results can be reported
+    while deeper levels are still being listed. With a ScanCache,
+    directories whose mtime is unchanged are not listed again.
+
+    Every task checks the cancel flag before touching the filesystem, so an
+    abandoned walk stops at its next directory. A listing already blocked
+    in a system call cannot be interrupted and keeps its pool thread until
+    the call returns, but the walk itself no longer waits for it.
+    """
+
+    def __init__(
+        self,
+        max_depth: int,
+        prune: frozenset[str],
+        workers: int,
+        cache: ScanCache | None = None,
+    ) -> None:
+        self.max_depth = max(1, max_depth)
+        self.prune = prune
+        self.workers = workers
+        self.cache = cache
+        self._pool: ThreadPoolExecutor | None = None
+        self._futures: set[Future[list[Project]]] = set()
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+        self._root: Path | None = None
+
+    def _list(self, path: str) -> DirListing:
+        """Lists a directory into the parts the walker needs.
+
+        Raises:
+            OSError: If the directory cannot be read.
+        """
+        markers = []
+        subdirs = []
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.name in PROJECT_MARKERS:
+                    markers.append(entry.name)
+                try:
+                    if entry.is_dir():
+                        subdirs.append((entry.name, entry.is_symlink()))
+                except OSError:
+                    continue
+        return DirListing(tuple(markers), tuple(subdirs))
+
+    def _listing(self, path: str) -> DirListing:
+        """Returns the listing of a directory, from the cache if unchanged.
+
+        Raises:
+            OSError: If the directory cannot be read.
+        """
+        if self.cache is None:
+            return self._list(path)
+
+        # The mtime is taken before listing so a concurrent change is seen
+        # as stale on the next scan rather than cached as current.
+        mtime_ns = os.stat(path).st_mtime_ns
+        listing = self.cache.lookup(path, mtime_ns)
+        if listing is None:
+            listing = self._list(path)
+            self.cache.store(path, mtime_ns, listing)
+        return listing
+
+    def visit(self, path: str, depth: int) -> list[Project]:
+        """Lists one directory and classifies it.
+
+        Subdirectories still to be visited or probed are submitted as new
+        tasks.
+
+        Args:
+            path: The directory to list.
+            depth: Its depth below the scan root (0 for the root itself).
+
+        Returns:
+            The projects found directly by this visit.
+        """
+        if self._cancelled.is_set():
+            return []
+        try:
+            listing = self._listing(path)
+        except OSError:
+            if depth == 0:
+                return []
+            # Unreadable directories are still offered as projects.
+            return [self._project(path, is_git=False)]
+
+        if depth > 0 and listing.markers:
+            return [self._project(path, is_git=".git" in listing.markers)]
+
+        subdirs = [s for s in listing.subdirs if s[0] not in self.prune]
+        if depth > 0 and not subdirs:
+            return [self._project(path, is_git=False)]
+
+        leaves = []
+        pending = []
+        for name, is_symlink in subdirs:
+            child = os.path.join(path, name)
+            child_depth = depth + 1
+            if child_depth >= self.max_depth or is_symlink:
+                leaves.append(child)
+            else:
+                pending.append((child, child_depth))
+
+        # Large directories are probed in chunks so results stream early.
+        for start in range(0, len(leaves), LEAF_CHUNK):
+            self._submit(self.probe, leaves[start : start + LEAF_CHUNK])
+        for child, child_depth in pending:
+            self._submit(self.visit, child, child_depth)
+        return []
+
+    def probe(self, paths: list[str]) -> list[Project]:
+        """Turns leaf directories into projects.
+
+        Args:
+            paths: Directories at the maximum depth or behind symlinks.
+
+        Returns:
+            One project per path, up to the point the walk was cancelled.
+        """
+        projects = []
+        for path in paths:
+            if self._cancelled.is_set():
+                break
+            projects.append(self._project(path, is_git=_is_git(path)))
+        return projects
+
+    def _project(self, path: str, is_git: bool) -> Project:
+        p = Path(path)
+        return Project(name=p.name, path=p, is_git=is_git, root=self._root)
+
+    def _submit(self, fn: Callable[..., list[Project]], *args: Any) -> None:
+        """Queues a task unless the walk was cancelled."""
+        with self._lock:
+            if self._pool is None or self._cancelled.is_set():
+                return
+            self._futures.add(self._pool.submit(fn, *args))
+
+    def cancel(self) -> None:
+        """Stops the walk.
+
+        Queued tasks are dropped and running ones return before their next
+        directory. A listing blocked in a system call still finishes in the
+        background.
+        """
+        self._cancelled.set()
+
+    def walk(
+        self,
+        root: str,
+        on_found: Callable[[list[Project]], None] | None = None,
+    ) -> list[Project]:
+        """Walks the tree below root.
+
+        Args:
+            root: The scan root.
+            on_found: Called from the walking thread with every non-empty
+                batch of projects as soon as it is found.
+
+        Returns:
+            Every project found, in no particular order.
+        """
+        projects: list[Project] = []
+        self._root = Path(root)
+        pool = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="nexus-scan"
+        )
+        self._pool = pool
+        try:
+            self._submit(self.visit, root, 0)
+            while not self._cancelled.is_set():
+                with self._lock:
+                    futures, self._futures = self._futures, set()
+                if not futures:
+                    break
+                # Wakes up periodically, so a cancel is noticed even while
+                # every task is stuck on an unresponsive directory.
+                done, remaining = wait(
+                    futures, timeout=CANCEL_POLL_INTERVAL, return_when=FIRST_COMPLETED
+                )
+                with self._lock:
+                    self._futures |= remaining
+                for future in done:
+                    found = future.result()
+                    if found:
+                        projects.extend(found)
+                        if on_found is not None:
+                            on_found(found)
+        finally:
+            with self._lock:
+                self._pool = None
+                self._futures.clear()
+            # A cancelled walk does not wait for listings blocked in a
+            # system call; their threads exit once the call returns.
+            pool.shutdown(wait=not self._cancelled.is_set(), cancel_futures=True)
+        return projects
+
+
+def _cache_key(max_depth: int, prune: frozenset[str]) -> str:
+    """Identifies the scan settings a cached result was produced with."""
+    return f"{max(1, max_depth)}|{','.join(sorted(prune))}"
+
+
+def _claim_for_nested_roots(
+    projects: list[Project], root: Path, roots: Iterable[Path]
+) -> list[Project]:
+    """Hands the projects of a root that lie in nested roots over to them.
 
-    Identifies directories and verifies the existence of a .git folder to
-    detect version controlled repositories. IO operations are executed in
-    a background thread to prevent blocking the application event loop.
+    Projects inside a nested root are left out, since the scan of that root
+    reports them, and a nested root that is a project itself is credited to
+    itself.
 
     Args:
-        root_path: The root directory to scan for subdirectories.
+        projects: The projects found below the root.
+        root: The root that was scanned.
+        roots: Every configured root.
 
     Returns:
-        A list of Project objects representing the identified directories.
-        The list is sorted alphabetically by directory name.
+        The projects the root owns.
+    """
+    nested = [r for r in roots if r != root and r.is_relative_to(root)]
+    if not nested:
+        return projects
+    owned = []
+    for project in projects:
+        path = project.path
+        if any(path != r and path.is_relative_to(r) for r in nested):
+            continue
+        if path in nested:
+            project = project.model_copy(update={"root": path})
+        owned.append(project)
+    return owned
+
+
+def load_cached_projects(
+    root_path: Path,
+    max_depth: int = 1,
+    prune: Iterable[str] = DEFAULT_PRUNE,
+    roots: Iterable[Path] = (),
+) -> list[Project] | None:
+    """Returns the result of the last cached scan without touching the tree.
+
+    Reads a single cache file, so it is cheap enough to call before the
+    first frame to show projects while a full scan reconciles them.
+
+    Args:
+        root_path: The root directory that was scanned.
+        max_depth: The depth the scan used.
+        prune: The prune rules the scan used.
+        roots: Every configured root. Projects in roots nested in root_path
+            are attributed as iter_roots does.
+
+    Returns:
+        The sorted projects of the last scan, or None if nothing is cached.
+    """
+    cache = ScanCache(root_path)
+    projects = cache.cached_projects(_cache_key(max_depth, frozenset(prune)))
+    if projects is None:
+        return None
+    return _claim_for_nested_roots(projects, root_path, roots)
+
+
+def _sort_key(project: Project) -> tuple[str, str]:
+    return project.name.lower(), str(project.path)
+
+
+async def iter_projects(
+    root_path: Path,
+    max_depth: int = 1,
+    prune: Iterable[str] = DEFAULT_PRUNE,
+    workers: int = MAX_SCAN_WORKERS,
+    use_cache: bool = False,
+) -> AsyncGenerator[list[Project], None]:
+    """Scans the root path and yields projects as soon as they are found.
+
+    Accepts the same arguments as scan_projects. Batches arrive in no
+    particular order; every batch holds whatever was found since the
+    previous one was consumed. Closing the generator early (for example with
+    contextlib.aclosing) stops the walk, and a partial walk never updates
+    the ScanCache.
+
+    Args:
+        root_path: The root directory to scan for subdirectories.
+        max_depth: How many levels below the root to search.
+        prune: Directory names that are never listed or descended into.
+        workers: The maximum number of directories listed concurrently.
+        use_cache: Whether to reuse and update the persistent ScanCache.
+
+    Yields:
+        Non-empty lists of Project objects.
     """
     if not root_path.exists():
-        return []
+        return
 
-    projects = []
+    prune = frozenset(prune)
+    cache = ScanCache(root_path) if use_cache else None
     loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[list[Project] | None] = asyncio.Queue()
+
+    def on_found(found: list[Project]) -> None:
+        loop.call_soon_threadsafe(queue.put_nowait, found)
 
-    def get_dirs() -> list[Path]:
+    walker = _Walker(max_depth, prune, workers, cache)
+    walk = loop.run_in_executor(None, walker.walk, str(root_path), on_found)
+    # Scheduled after every on_found call, so it always arrives last.
+    walk.add_done_callback(lambda _: queue.put_nowait(None))
+
+    try:
+        finished = False
+        while not finished:
+            batch: list[Project] = []
+            item = await queue.get()
+            while True:
+                if item is None:
+                    finished = True
+                    break
+                batch.extend(item)
+                if queue.empty():
+                    break
+                item = queue.get_nowait()
+            if batch:
+                yield batch
+
+        projects = await walk
+    finally:
+        walker.cancel()
+
+    if cache is not None:
+        projects.sort(key=_sort_key)
+        await loop.run_in_executor(
+            None, cache.save, _cache_key(max_depth, prune), projects
+        )
+        log.debug("scan_cache_used", hits=cache.hits, misses=cache.misses)
+
+
+async def iter_roots(
+    roots: Iterable[Path],
+    max_depth: int = 1,
+    prune: Iterable[str] = DEFAULT_PRUNE,
+    workers: int = MAX_SCAN_WORKERS,
+    use_cache: bool = False,
+    timeout: float = ROOT_SCAN_TIMEOUT,
+) -> AsyncGenerator[list[Project], None]:
+    """Scans several project roots concurrently and merges their results.
+
+    Every root is scanned with iter_projects in its own task. A root that
+    does not finish within the timeout is abandoned, keeping whatever it
+    found until then, so a slow mount cannot hold back the other roots.
+    The timeout does not interrupt a directory listing blocked in a system
+    call (for example on a hung network mount): the abandoned walk stops
+    queuing work and returns, while the blocked call keeps its scan thread
+    until it returns.
+    Projects in a root nested in another root, and the nested root itself,
+    are attributed to the nested root, and projects are yielded once even
+    if several roots find them.
+
+    Args:
+        roots: The root directories to scan.
+        max_depth: How many levels below each root to search.
+        prune: Directory names that are never listed or descended into.
+        workers: The maximum number of directories listed concurrently per
+            root.
+        use_cache: Whether to reuse and update the persistent ScanCache.
+        timeout: Seconds after which the scan of a single root is abandoned.
+
+    Yields:
+        Non-empty lists of Project objects without duplicates.
+    """
+    prune = frozenset(prune)
+    roots = list(dict.fromkeys(roots))
+    queue: asyncio.Queue[list[Project] | None] = asyncio.Queue()
+
+    async def scan_root(root: Path) -> None:
         try:
-            return [d for d in root_path.iterdir() if d.is_dir()]
-        except PermissionError:
-            return []
+            async with asyncio.timeout(timeout):
+                async with aclosing(
+                    iter_projects(root, max_depth, prune, workers, use_cache)
+                ) as batches:
+                    async for batch in batches:
+                        queue.put_nowait(_claim_for_nested_roots(batch, root, roots))
+        except TimeoutError:
+            log.warning("project_root_timeout", root=str(root), timeout=timeout)
+        except (OSError, RuntimeError) as e:
+            log.error("project_root_scan_failed", root=str(root), error=str(e))
+        finally:
+            queue.put_nowait(None)
+
+    tasks = [asyncio.create_task(scan_root(root)) for root in roots]
+    seen: set[Path] = set()
+    remaining = len(tasks)
+    try:
+        while remaining:
+            item = await queue.get()
+            if item is None:
+                remaining -= 1
+                continue
+            batch = [p for p in item if p.path not in seen]
+            seen.update(p.path for p in batch)
+            if batch:
+                yield batch
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
 
-    dirs = await loop.run_in_executor(None, get_dirs)
+async def scan_projects(
+    root_path: Path,
+    max_depth: int = 1,
+    prune: Iterable[str] = DEFAULT_PRUNE,
+    workers: int = MAX_SCAN_WORKERS,
+    use_cache: bool = False,
+) -> list[Project]:
+    """Scans the root path for project directories asynchronously.
 
-    for d in sorted(dirs, key=lambda x: x.name.lower()):
-        is_git = (d / ".git").exists()
-        projects.append(Project(name=d.name, path=d, is_git=is_git))
+    Walks up to max_depth levels below the root, listing subtrees in
+    parallel. Descent stops at detected project roots (directories with a
+    marker such as .git or pyproject.toml) and heavy directories named in
+    prune are skipped entirely. IO operations are executed in background
+    threads to prevent blocking the application event loop. Use
+    iter_projects to receive results while the scan is still running.
 
-    return projects
+    Args:
+        root_path: The root directory to scan for subdirectories.
+        max_depth: How many levels below the root to search. The default of
+            1 lists the direct children only.
+        prune: Directory names that are never listed or descended into.
+        workers: The maximum number of directories listed concurrently.
+        use_cache: Whether to reuse and update the persistent ScanCache, so
+            that only directories with a changed mtime are listed again.
+
+    Returns:
+        A list of Project objects representing the identified directories.
+        The list is sorted alphabetically by directory name.
+    """
+    projects = [
+        project
+        async for batch in iter_projects(
+            root_path, max_depth, prune, workers, use_cache
+        )
+        for project in batch
+    ]
+    return sorted(projects, key=_sort_key)
@@ -0,0 +1,229 @@
+"""Compiled command templates.
+
+A tool's command is split into arguments once, with its placeholders kept as
+markers inside the arguments. Launching only fills in the markers, so no
+command is parsed again and substituted values are never split or scanned
+for placeholders: a project path with spaces stays a single argument, and
+flags containing `{project}` are passed on verbatim.
+
+Supported placeholders:
+
+- `{project}`: The selected project or file.
+- `{project_name}`: The name of the selected project or file.
+- `{dir}`: The selected directory, or the directory of the selected file.
+- `{file}`: The selected file, if a file was selected.
+- `{git_root}`: The root of the repository containing the selection.
+- `{flags}`: The flags entered at launch. As a whole argument it expands to
+  every flag; inside an argument it inserts the text as typed.
+- `{env:NAME}`: The value of the environment variable NAME.
+
+An argument that consists of a single placeholder without a value is left
+out; inside a larger argument such a placeholder is replaced by nothing.
+Text in braces that is not a placeholder, such as awk programs, is kept.
+
+The script of a shell command, such as `sh -c 'cd {project} && make'`, is
+parsed again by the shell, so values substituted into it are shell-quoted
+and a path with spaces or `;` stays a single word. Only `{flags}` is
+inserted as typed there.
+"""
+
+import os
+import re
+import shlex
+from collections.abc import Mapping
+from functools import lru_cache
+from pathlib import Path
+from typing import NamedTuple
+
+from nexus.services.git_info import find_git_root
+
+PLACEHOLDER = re.compile(
+    r"\{(project|project_name|dir|file|git_root|flags|env:[A-Za-z_][A-Za-z0-9_]*)\}"
+)
+
+# Placeholders describing the selected project.
+PATH_PLACEHOLDERS = frozenset({"project", "project_name", "dir", "file", "git_root"})
+
+# Number of distinct commands whose compiled template is kept.
+TEMPLATE_CACHE_SIZE = 4096
+
+# Shells whose -c argument is a script that is parsed again.
+SHELLS = frozenset({"sh", "bash", "dash", "zsh", "ksh", "mksh", "fish"})
+
+
+def split_args(text: str) -> list[str]:
+    """Splits a command line into arguments.
+
+    Uses POSIX shell quoting except on Windows. Text with unbalanced quotes
+    is split on whitespace instead.
+
+    Args:
+        text: The command line.
+
+    Returns:
+        The arguments.
+    """
+    try:
+        return shlex.split(text, posix=os.name != "nt")
+    except ValueError:
+        return text.split()
+
+
+class CommandTemplate(NamedTuple):
+    """A command split into arguments, with placeholders to fill in.
+
+    Attributes:
+        args: Every argument as alternating literal text and placeholder
+            names, starting and ending with literal text.
+        placeholders: The names of the placeholders used anywhere.
+        scripts: The indexes of the arguments that a shell runs as a
+            script, whose values are shell-quoted.
+    """
+
+    args: tuple[tuple[str, ...], ...]
+    placeholders: frozenset[str]
+    scripts: frozenset[int] = frozenset()
+
+    def render(
+        self,
+        project_path: Path | None = None,
+        flags: str | None = None,
+        env: Mapping[str, str] | None = None,
+    ) -> list[str]:
+        """Fills in the placeholders.
+
+        For commands without placeholders, the flags and then the project
+        path are appended. The project path is only appended when the
+        command has no `{flags}` placeholder either.
+
+        Args:
+            project_path: The selected project or file.
+            flags: The flags entered at launch.
+            env: The environment to read `{env:NAME}` from. Defaults to
+                os.environ.
+
+        Returns:
+            The command arguments.
+        """
+        values = _Values(project_path, flags, os.environ if env is None else env)
+        argv: list[str] = []
+        for index, parts in enumerate(self.args):
+            if len(parts) == 1:
+                argv.append(parts[0])
+            elif index in self.scripts:
+                argv.append(
+                    "".join(
+                        part if i % 2 == 0 else values.get_quoted(part)
+                        for i, part in enumerate(parts)
+                    )
+                )
+            elif len(parts) == 3 and not parts[0] and not parts[2]:
+                # The argument is a single placeholder.
+                if parts[1] == "flags":
+                    argv.extend(values.flag_args())
+                else:
+                    value = values.get(parts[1])
+                    if value is not None:
+                        argv.append(value)
+            else:
+                argv.append(
+                    "".join(
+                        part if i % 2 == 0 else values.get(part) or ""
+                        for i, part in enumerate(parts)
+                    )
+                )
+
+        if flags and "flags" not in self.placeholders:
+            argv.extend(values.flag_args())
+        if (
+            project_path
+            and "flags" not in self.placeholders
+            and not self.placeholders & PATH_PLACEHOLDERS
+        ):
+            argv.append(str(project_path))
+        return argv
+
+
+class _Values:
+    """The placeholder values of one launch, computed on first use."""
+
+    def __init__(
+        self, project_path: Path | None, flags: str | None, env: Mapping[str, str]
+    ) -> None:
+        self.project_path = project_path
+        self.flags = flags
+        self.env = env
+        self._cache: dict[str, str | None] = {}
+
+    def flag_args(self) -> list[str]:
+        """Splits the flags into arguments."""
+        return split_args(self.flags) if self.flags else []
+
+    def get(self, name: str) -> str | None:
+        """Retrieves the value of a placeholder, or None if it has none."""
+        if name not in self._cache:
+            self._cache[name] = self._compute(name)
+        return self._cache[name]
+
+    def get_quoted(self, name: str) -> str:
+        """Retrieves the value of a placeholder as a shell word.
+
+        Flags are shell text already and are inserted as typed.
+        """
+        value = self.get(name)
+        if value is None:
+            return ""
+        return value if name == "flags" else shlex.quote(value)
+
+    def _compute(self, name: str) -> str | None:
+        if name == "flags":
+            return self.flags or None
+        if name.startswith("env:"):
+            return self.env.get(name.removeprefix("env:"))
+
+        path = self.project_path
+        if path is None:
+            return None
+        if name == "project":
+            return str(path)
+        if name == "project_name":
+            return path.name
+        is_file = path.is_file()
+        if name == "file":
+            return str(path) if is_file else None
+        if name == "dir":
+            return str(path.parent if is_file else path)
+        root = find_git_root(path)
+        return str(root) if root is not None else None
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def compile_template(command: str) -> CommandTemplate:
+    """Splits a command into arguments and locates its placeholders.
+
+    Compiled templates are cached per command, so tools sharing a command
+    and later launches of the same tool do not parse it again. The argument
+    after a `-c` option of a shell is marked as a script.
+
+    Args:
+        command: The command with placeholders.
+
+    Returns:
+        The compiled template.
+    """
+    words = split_args(command)
+    args = tuple(tuple(PLACEHOLDER.split(arg)) for arg in words)
+    placeholders = frozenset(name for parts in args for name in parts[1::2])
+    return CommandTemplate(args, placeholders, _shell_scripts(words))
+
+
+def _shell_scripts(words: list[str]) -> frozenset[int]:
+    """Finds the script argument of a shell command, such as `sh -c '...'`."""
+    if not words or os.path.basename(words[0]) not in SHELLS:
+        return frozenset()
+    for index, word in enumerate(words[1:], start=1):
+        if word == "--" or not word.startswith("-"):
+            break
+        if not word.startswith("--") and "c" in word[1:]:
+            return frozenset({index + 1})
+    return frozenset()
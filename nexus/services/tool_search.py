@@ -0,0 +1,98 @@
+"""Substring search index for configured tools.
+
+The toolbox filter matches the query anywhere in a tool's label or
+description. The index lowercases both once and keeps a posting list of
+tool positions for every trigram, so that a query narrows the candidates
+with a few set intersections and the substring test only runs on tools
+that contain all of its trigrams. While typing, each query only checks the
+matches of the previous one.
+"""
+
+from collections.abc import Iterable
+
+from nexus.models import Tool
+from nexus.services.refine import RefinementCache
+
+# Length of the substrings indexed in the posting lists.
+GRAM = 3
+
+
+def _grams(text: str) -> set[str]:
+    """Collects the distinct trigrams of a string."""
+    return {text[i : i + GRAM] for i in range(len(text) - GRAM + 1)}
+
+
+class ToolSearchIndex:
+    """A trigram index over the labels and descriptions of tools.
+
+    The index is immutable; a new one is built for every registry.
+    """
+
+    def __init__(self, tools: Iterable[Tool]) -> None:
+        """Builds the index.
+
+        Args:
+            tools: The tools to index, in display order.
+        """
+        self._tools: tuple[Tool, ...] = tuple(tools)
+        # Label and description are kept apart so that a query never
+        # matches across the boundary between them.
+        self._keys = tuple(
+            (tool.label.lower(), tool.description.lower()) for tool in self._tools
+        )
+
+        postings: dict[str, list[int]] = {}
+        for position, (label, description) in enumerate(self._keys):
+            for gram in _grams(label) | _grams(description):
+                ids = postings.get(gram)
+                if ids is None:
+                    postings[gram] = [position]
+                else:
+                    ids.append(position)
+        self._postings = {gram: frozenset(ids) for gram, ids in postings.items()}
+        self._refinements: RefinementCache[list[int]] = RefinementCache()
+
+    def __len__(self) -> int:
+        return len(self._tools)
+
+    def search(self, query: str) -> list[Tool]:
+        """Finds the tools whose label or description contains the query.
+
+        A query that extends a recent one only checks that query's matches.
+
+        Args:
+            query: The text to look for, matched case-insensitively.
+
+        Returns:
+            The matching tools in display order. Every tool if the query is
+            empty.
+        """
+        query = query.lower()
+        if not query:
+            return list(self._tools)
+
+        cached = self._refinements.lookup(query)
+        if cached is not None and cached.query == query:
+            matches = cached.matches
+        else:
+            candidates = self._candidates(query) if cached is None else cached.matches
+            keys = self._keys
+            matches = [
+                i for i in candidates if query in keys[i][0] or query in keys[i][1]
+            ]
+            self._refinements.push(query, matches)
+        return [self._tools[i] for i in matches]
+
+    def _candidates(self, query: str) -> Iterable[int]:
+        """Selects the positions of the tools containing every trigram of a
+        query, in display order."""
+        if len(query) < GRAM:
+            return range(len(self._keys))
+        postings = []
+        for gram in _grams(query):
+            ids = self._postings.get(gram)
+            if ids is None:
+                return ()
+            postings.append(ids)
+        postings.sort(key=len)
+        return sorted(postings[0].intersection(*postings[1:]))
@@ -0,0 +1,287 @@
+"""Service for watching configuration files for changes.
+
+Uses inotify on Linux and falls back to polling modification times on other
+platforms. Changes are reported from a background thread, batched per
+settle interval so that editors writing a file in several steps trigger a
+single reload.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+from nexus.logger import get_logger
+
+log = get_logger(__name__)
+
+# inotify event masks from <sys/inotify.h>.
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+WATCH_MASK = (
+    IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+)
+
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def _signature(path: Path) -> tuple[int, int] | None:
+    """Returns the size and modification time of a file.
+
+    Args:
+        path: The file to inspect.
+
+    Returns:
+        A (size, mtime_ns) tuple, or None if the file does not exist.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def _list_toml(directory: Path) -> list[Path]:
+    """Lists the TOML files in a directory.
+
+    Args:
+        directory: The directory to list.
+
+    Returns:
+        The TOML files, or an empty list if the directory is unreadable.
+    """
+    try:
+        return list(directory.glob("*.toml"))
+    except OSError:
+        return []
+
+
+class _PollingBackend:
+    """Detects changes by comparing file signatures on every poll."""
+
+    def __init__(self, paths: Iterable[Path], directories: Iterable[Path]) -> None:
+        self._paths = list(paths)
+        self._directories = list(directories)
+        self._signatures = {path: _signature(path) for path in self._candidates()}
+
+    def _candidates(self) -> list[Path]:
+        candidates = list(self._paths)
+        for directory in self._directories:
+            candidates.extend(_list_toml(directory))
+        return candidates
+
+    def fileno(self) -> int | None:
+        return None
+
+    def poll(self) -> set[Path]:
+        changed = set()
+        candidates = self._candidates()
+        for path in candidates:
+            current = _signature(path)
+            if current != self._signatures.get(path):
+                self._signatures[path] = current
+                changed.add(path)
+
+        # Files in watched directories that disappeared.
+        for path in self._signatures.keys() - set(candidates):
+            del self._signatures[path]
+            changed.add(path)
+        return changed
+
+    def close(self) -> None:
+        pass
+
+
+class _InotifyBackend:
+    """Detects changes through inotify watches on the parent directories.
+
+    Directories are watched rather than files so that atomic saves, which
+    replace the file with a new inode, are still observed. Parent
+    directories that do not exist yet are picked up once they appear.
+    """
+
+    def __init__(
+        self, paths: Iterable[Path], directories: Iterable[Path], libc: ctypes.CDLL
+    ) -> None:
+        self._libc = libc
+        self._fd: int = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        # Target file names per directory; None matches every TOML file.
+        self._targets: dict[Path, set[str] | None] = {}
+        for directory in directories:
+            self._targets[directory] = None
+        for path in paths:
+            names = self._targets.setdefault(path.parent, set())
+            if names is not None:
+                names.add(path.name)
+        self._watches: dict[int, Path] = {}
+        self._add_missing_watches()
+
+    def _add_missing_watches(self) -> set[Path]:
+        """Adds watches for target directories that are not watched yet.
+
+        Returns:
+            The target files inside directories that were newly watched.
+        """
+        appeared: set[Path] = set()
+        watched = set(self._watches.values())
+        for directory, names in self._targets.items():
+            if directory in watched or not directory.is_dir():
+                continue
+            wd = self._libc.inotify_add_watch(
+                self._fd, os.fsencode(directory), WATCH_MASK
+            )
+            if wd >= 0:
+                self._watches[wd] = directory
+                if names is None:
+                    appeared.update(_list_toml(directory))
+                else:
+                    appeared.update(directory / name for name in names)
+        return appeared
+
+    def fileno(self) -> int | None:
+        return self._fd
+
+    def poll(self) -> set[Path]:
+        changed = set()
+        while True:
+            try:
+                buffer = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(buffer):
+                wd, _mask, _cookie, length = _EVENT_HEADER.unpack_from(buffer, offset)
+                offset += _EVENT_HEADER.size
+                raw_name = buffer[offset : offset + length].rstrip(b"\0")
+                offset += length
+
+                directory = self._watches.get(wd)
+                if directory is None:
+                    continue
+                name = os.fsdecode(raw_name)
+                names = self._targets[directory]
+                matches = name.endswith(".toml") if names is None else name in names
+                if matches:
+                    changed.add(directory / name)
+
+        # Existing files in newly created directories count as changes.
+        changed.update(p for p in self._add_missing_watches() if p.exists())
+        return changed
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+def _load_inotify() -> ctypes.CDLL | None:
+    """Loads libc if it exposes the inotify API.
+
+    Returns:
+        The libc handle, or None when inotify is unavailable.
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    except OSError:
+        return None
+    if not hasattr(libc, "inotify_init1"):
+        return None
+    return libc
+
+
+class ConfigWatcher:
+    """Watches a set of files and reports which of them changed.
+
+    Attributes:
+        backend_name: Either 'inotify' or 'polling'.
+    """
+
+    def __init__(
+        self,
+        paths: Iterable[Path],
+        on_change: Callable[[set[Path]], None],
+        directories: Iterable[Path] = (),
+        interval: float = 1.0,
+        settle: float = 0.1,
+    ) -> None:
+        """Initializes the watcher.
+
+        Args:
+            paths: The files to watch. They do not need to exist yet.
+            on_change: Called from the watcher thread with the changed paths.
+            directories: Directories whose TOML files are all watched,
+                including files created later.
+            interval: Seconds between polls when inotify is unavailable, and
+                between checks for newly created directories otherwise.
+            settle: Seconds to wait after a change for related writes.
+        """
+        self._paths = list(dict.fromkeys(paths))
+        self._directories = list(dict.fromkeys(directories))
+        self._on_change = on_change
+        self._interval = interval
+        self._settle = settle
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._backend: _InotifyBackend | _PollingBackend
+
+        libc = _load_inotify()
+        try:
+            if libc is None:
+                raise OSError("inotify unavailable")
+            self._backend = _InotifyBackend(self._paths, self._directories, libc)
+            self.backend_name = "inotify"
+        except OSError:
+            self._backend = _PollingBackend(self._paths, self._directories)
+            self.backend_name = "polling"
+
+    def start(self) -> None:
+        """Starts watching in a daemon thread."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="nexus-config-watcher", daemon=True
+        )
+        self._thread.start()
+        log.info("config_watcher_started", backend=self.backend_name)
+
+    def stop(self) -> None:
+        """Stops watching. The thread exits within one interval."""
+        self._stop.set()
+
+    def _wait(self, timeout: float) -> None:
+        """Blocks until the backend has events or the timeout expires."""
+        fd = self._backend.fileno()
+        if fd is None:
+            self._stop.wait(timeout)
+        else:
+            select.select([fd], [], [], timeout)
+
+    def _run(self) -> None:
+        try:
+            while not self._stop.is_set():
+                self._wait(self._interval)
+                changed = self._backend.poll()
+                if not changed:
+                    continue
+
+                # Collect the remaining writes of the same save.
+                self._stop.wait(self._settle)
+                changed |= self._backend.poll()
+                if not self._stop.is_set():
+                    self._on_change(changed)
+        except (OSError, RuntimeError) as e:
+            log.error("config_watcher_failed", error=str(e))
+        finally:
+            self._backend.close()
@@ -1,9 +1,11 @@
 """State management for the Nexus application.
 
-Handles persistence of user data including recent projects.
+Handles persistence of user data including recent projects and the launch
+history of projects and tools.
 """
 
 import json
+import time
 from pathlib import Path
 from typing import Any, cast
 
@@ -15,11 +17,17 @@ log = get_logger(__name__)
 # File path for the persistent application state.
 STATE_FILE = Path(platformdirs.user_data_dir("nexus", roaming=True)) / "state.json"
 
+# Maximum number of project paths or tools kept in a launch history.
+MAX_HISTORY = 500
+
 
 class StateManager:
     """Manages the lifecycle and persistence of application state.
 
     Attributes:
+        tool_history_version: Incremented whenever a tool launch is recorded,
+            so that orderings derived from the tool history can be reused
+            until it changes.
         _state: A dictionary containing the current application state.
     """
 
@@ -27,7 +35,10 @@ class StateManager:
         """Initializes the StateManager and loads the state from disk."""
         self._state: dict[str, Any] = {
             "recents": [],
+            "history": {},
+            "tool_history": {},
         }
+        self.tool_history_version = 0
         self._load()
 
     def _load(self) -> None:
@@ -71,6 +82,8 @@ class StateManager:
     def add_recent(self, path: str) -> None:
         """Adds a project path to the list of recently accessed projects.
 
+        Also counts the launch in the project history used for ranking.
+
         Args:
             path: The absolute path of the project to add.
         """
@@ -79,8 +92,58 @@ class StateManager:
             recents.remove(path)
         recents.insert(0, path)
         self._state["recents"] = recents[:10]
+
+        _count_launch(self._state.setdefault("history", {}), path)
+        self._save()
+
+    def get_history(self) -> dict[str, tuple[int, float]]:
+        """Retrieves the launch history of projects.
+
+        Returns:
+            The launch count and the Unix time of the last launch for every
+            project path, least recently launched first.
+        """
+        return _read_history(self._state.get("history", {}))
+
+    def add_tool_launch(self, label: str) -> None:
+        """Counts a launch of a tool in the tool history.
+
+        Args:
+            label: The label of the launched tool.
+        """
+        _count_launch(self._state.setdefault("tool_history", {}), label)
+        self.tool_history_version += 1
         self._save()
 
+    def get_tool_history(self) -> dict[str, tuple[int, float]]:
+        """Retrieves the launch history of tools.
+
+        Returns:
+            The launch count and the Unix time of the last launch for every
+            tool label, least recently launched first.
+        """
+        return _read_history(self._state.get("tool_history", {}))
+
+
+def _count_launch(history: dict[str, list[Any]], key: str) -> None:
+    """Records a launch in a history of launch counts and times.
+
+    Args:
+        history: The launch count and last launch time per key, in launch
+            order.
+        key: The launched project path or tool label.
+    """
+    count, _last = history.pop(key, (0, 0.0))
+    history[key] = [count + 1, time.time()]
+    if len(history) > MAX_HISTORY:
+        # Entries are kept in launch order, so the first is the stalest.
+        del history[next(iter(history))]
+
+
+def _read_history(history: dict[str, Any]) -> dict[str, tuple[int, float]]:
+    """Converts a stored launch history to typed tuples."""
+    return {key: (int(count), float(last)) for key, (count, last) in history.items()}
+
 
 _state_manager = StateManager()
 
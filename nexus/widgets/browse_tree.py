@@ -0,0 +1,222 @@
+"""Filesystem tree for the advanced project browser.
+
+A tree of directory entries that lists directories in a worker thread through
+the cached listing service and adds very large directories to the tree one
+page at a time, so neither listing nor mounting thousands of nodes blocks the
+UI. It is built on the public Tree API instead of DirectoryTree, whose
+loading cannot be changed without overriding its internals, and posts the
+same selection messages as a DirectoryTree.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, ClassVar
+
+from rich.style import Style
+from rich.text import Text
+from textual import on, work
+from textual.widgets import DirectoryTree, Tree
+from textual.widgets.directory_tree import DirEntry
+from textual.widgets.tree import TreeNode
+
+from nexus.services.dir_listing import (
+    DEFAULT_BROWSE_IGNORE,
+    ignore_pattern,
+    list_directory,
+)
+
+# Number of entries added to the tree at a time.
+PAGE_SIZE = 500
+
+
+@dataclass
+class _MoreEntries(DirEntry):
+    """Data of the placeholder node standing in for unlisted entries.
+
+    Attributes:
+        entries: Every entry of the directory, with whether it is one.
+        start: The index of the first entry not in the tree yet.
+    """
+
+    entries: list[tuple[Path, bool]] = field(default_factory=list)
+    start: int = 0
+
+
+class BrowseTree(Tree[DirEntry]):
+    """A directory tree with background listing, ignore patterns and paging.
+
+    Selecting a directory or a file posts DirectoryTree.DirectorySelected or
+    DirectoryTree.FileSelected, like a DirectoryTree would.
+
+    Attributes:
+        path: The directory at the root of the tree.
+        ignore: Glob patterns of entry names that are not shown.
+        page_size: The number of entries added to the tree at a time.
+    """
+
+    ICON_FILE = DirectoryTree.ICON_FILE
+
+    COMPONENT_CLASSES: ClassVar[set[str]] = {
+        "browse-tree--folder",
+        "browse-tree--hidden",
+    }
+
+    DEFAULT_CSS = """
+    BrowseTree > .browse-tree--folder {
+        text-style: bold;
+    }
+    BrowseTree > .browse-tree--hidden {
+        text-style: dim;
+    }
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        ignore: Iterable[str] = DEFAULT_BROWSE_IGNORE,
+        page_size: int = PAGE_SIZE,
+        **kwargs: Any,
+    ) -> None:
+        """Initializes the tree.
+
+        Args:
+            path: The directory at the root of the tree.
+            ignore: Glob patterns of entry names to hide.
+            page_size: The number of entries added to the tree at a time.
+            **kwargs: Additional keyword arguments passed to Tree.
+        """
+        self.path = Path(path)
+        self.ignore = frozenset(ignore)
+        self.page_size = max(1, page_size)
+        self._ignored = ignore_pattern(self.ignore)
+        super().__init__(str(self.path), data=DirEntry(self.path), **kwargs)
+
+    def on_mount(self) -> None:
+        """Lists the root directory."""
+        self.root.expand()
+
+    def filter_paths(self, paths: Iterable[Path]) -> Iterable[Path]:
+        """Filters the entries of a directory before they are added to the tree.
+
+        Leaves out entries whose name matches an ignore pattern. As with
+        DirectoryTree.filter_paths, subclasses may override it; it is called
+        from a worker thread.
+
+        Args:
+            paths: The entries of a directory, directories first.
+
+        Returns:
+            The entries to show, in the same order.
+        """
+        ignored = self._ignored
+        if ignored is None:
+            return paths
+        return (path for path in paths if not ignored.match(path.name))
+
+    def render_label(
+        self, node: TreeNode[DirEntry], base_style: Style, style: Style
+    ) -> Text:
+        """Renders a node's label with an icon, folders in bold.
+
+        Args:
+            node: The node to render.
+            base_style: The base style of the widget.
+            style: The additional style for the label.
+
+        Returns:
+            The rendered label.
+        """
+        label = super().render_label(node, base_style, style)
+        if not self.is_mounted:
+            return label
+        if node.allow_expand:
+            label.stylize_before(
+                self.get_component_rich_style("browse-tree--folder", partial=True)
+            )
+        elif not isinstance(node.data, _MoreEntries):
+            label = Text.assemble((self.ICON_FILE, base_style), label)
+        if str(node.label).startswith("."):
+            label.stylize_before(
+                self.get_component_rich_style("browse-tree--hidden", partial=True)
+            )
+        return label
+
+    @on(Tree.NodeExpanded)
+    def _on_node_expanded(self, event: Tree.NodeExpanded[DirEntry]) -> None:
+        """Lists a directory the first time it is expanded."""
+        event.stop()
+        entry = event.node.data
+        if entry is not None and not entry.loaded:
+            entry.loaded = True
+            self._load_directory(event.node)
+
+    @work(thread=True, exit_on_error=False)
+    def _load_directory(self, node: TreeNode[DirEntry]) -> None:
+        """Lists the directory of a node in a worker thread.
+
+        Args:
+            node: The node to load the directory contents for.
+        """
+        assert node.data is not None
+        location = node.data.path.expanduser().resolve()
+        is_dir = {
+            location / entry.name: entry.is_dir for entry in list_directory(location)
+        }
+        entries = [(path, is_dir[path]) for path in self.filter_paths(is_dir)]
+        self.app.call_from_thread(self._populate_node, node, entries)
+
+    def _populate_node(
+        self, node: TreeNode[DirEntry], entries: list[tuple[Path, bool]]
+    ) -> None:
+        """Shows the first page of a directory's entries.
+
+        Args:
+            node: The directory node to populate.
+            entries: Every entry of the directory, with whether it is one.
+        """
+        cursor = self.cursor_node
+        node.remove_children()
+        self._add_page(node, entries, 0)
+        if cursor is not None:
+            # Keeps the cursor on its node when rows are added above it.
+            self.move_cursor(cursor, animate=False)
+
+    def _add_page(
+        self, node: TreeNode[DirEntry], entries: list[tuple[Path, bool]], start: int
+    ) -> None:
+        """Adds one page of entries, followed by a placeholder for the rest.
+
+        Args:
+            node: The directory node to add to.
+            entries: Every entry of the directory, with whether it is one.
+            start: The index of the first entry to add.
+        """
+        end = start + self.page_size
+        for path, is_dir in entries[start:end]:
+            node.add(path.name, data=DirEntry(path), allow_expand=is_dir)
+        remaining = len(entries) - end
+        if remaining > 0 and node.data is not None:
+            node.add_leaf(
+                f"… {remaining:,} more",
+                data=_MoreEntries(node.data.path, entries=entries, start=end),
+            )
+
+    @on(Tree.NodeSelected)
+    def _on_node_selected(self, event: Tree.NodeSelected[DirEntry]) -> None:
+        """Reports the selected path, or shows the next page of entries."""
+        event.stop()
+        node = event.node
+        data = node.data
+        if data is None:
+            return
+        if isinstance(data, _MoreEntries):
+            parent = node.parent
+            node.remove()
+            if parent is not None:
+                self._add_page(parent, data.entries, data.start)
+        elif node.allow_expand:
+            self.post_message(DirectoryTree.DirectorySelected(node, data.path))
+        else:
+            self.post_message(DirectoryTree.FileSelected(node, data.path))
@@ -0,0 +1,302 @@
+"""Virtualized list of projects for the project picker.
+
+Renders rows through the line API, so only the rows on screen are ever
+formatted and the list can hold any number of projects without mounting a
+widget per row.
+"""
+
+from collections.abc import Callable, Collection, Iterable
+from pathlib import Path
+from typing import ClassVar
+
+from textual import events
+from textual.binding import Binding, BindingType
+from textual.cache import LRUCache
+from textual.content import Content
+from textual.geometry import Region, Size
+from textual.message import Message
+from textual.reactive import reactive
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+from textual.visual import Visual
+
+from nexus.models import Project
+
+
+class ProjectList(ScrollView, can_focus=True):
+    """A scrollable, single-line-per-row list of projects.
+
+    Projects can be marked for a batch run. Marks are kept by path, so they
+    survive filtering the list.
+
+    Attributes:
+        highlighted: The index of the highlighted row, if any.
+    """
+
+    BINDINGS: ClassVar[list[BindingType]] = [
+        Binding("enter", "select", "Select", show=False),
+        Binding("up", "cursor_up", "Up", show=False),
+        Binding("down", "cursor_down", "Down", show=False),
+        Binding("pageup", "page_up", "Page Up", show=False),
+        Binding("pagedown", "page_down", "Page Down", show=False),
+        Binding("home", "first", "First", show=False),
+        Binding("end", "last", "Last", show=False),
+        Binding("space", "toggle_mark", "Mark", show=True),
+        Binding("ctrl+a", "mark_all", "Mark All", show=False),
+    ]
+
+    COMPONENT_CLASSES: ClassVar[set[str]] = {
+        "project-list--row",
+        "project-list--row-highlighted",
+    }
+
+    DEFAULT_CSS = """
+    ProjectList {
+        height: 1fr;
+        text-wrap: nowrap;
+        text-overflow: ellipsis;
+    }
+    """
+
+    highlighted: reactive[int | None] = reactive(None)
+
+    class Selected(Message):
+        """Posted when a project is chosen with enter or a click.
+
+        Attributes:
+            project_list: The list the project was selected in.
+            project: The selected project.
+        """
+
+        def __init__(self, project_list: "ProjectList", project: Project) -> None:
+            super().__init__()
+            self.project_list = project_list
+            self.project = project
+
+        @property
+        def control(self) -> "ProjectList":
+            """The list the project was selected in."""
+            return self.project_list
+
+    class MarksChanged(Message):
+        """Posted when projects are marked or unmarked.
+
+        Attributes:
+            project_list: The list whose marks changed.
+        """
+
+        def __init__(self, project_list: "ProjectList") -> None:
+            super().__init__()
+            self.project_list = project_list
+
+        @property
+        def control(self) -> "ProjectList":
+            """The list whose marks changed."""
+            return self.project_list
+
+    def __init__(
+        self,
+        format_row: Callable[[Project], str],
+        *,
+        name: str | None = None,
+        id: str | None = None,
+        classes: str | None = None,
+    ) -> None:
+        """Initializes the list.
+
+        Args:
+            format_row: Builds the markup of a project's row. Called only for
+                rows that are drawn, and again after refresh_rows().
+            name: The name of the widget.
+            id: The ID of the widget in the DOM.
+            classes: The CSS classes of the widget.
+        """
+        super().__init__(name=name, id=id, classes=classes)
+        self._format_row = format_row
+        self._projects: list[Project] = []
+        self._marked: dict[Path, None] = {}
+        self._row_cache: LRUCache[tuple[int, bool, bool, int], Strip] = LRUCache(1024)
+
+    @property
+    def projects(self) -> list[Project]:
+        """The listed projects, in display order."""
+        return self._projects
+
+    @property
+    def highlighted_project(self) -> Project | None:
+        """The project under the cursor, if any."""
+        if self.highlighted is None:
+            return None
+        return self._projects[self.highlighted]
+
+    @property
+    def marked(self) -> list[Path]:
+        """The paths of the marked projects, in the order they were marked."""
+        return list(self._marked)
+
+    @property
+    def visible_projects(self) -> list[Project]:
+        """The projects whose rows are currently on screen."""
+        first = self.scroll_offset.y
+        return self._projects[first : first + self.scrollable_content_region.height]
+
+    def set_projects(self, projects: Iterable[Project]) -> None:
+        """Replaces the listed projects in one batch.
+
+        Args:
+            projects: The projects to show, in display order.
+        """
+        self._projects = list(projects)
+        self._row_cache.clear()
+        self.highlighted = None
+        self.scroll_to(y=0, animate=False, immediate=True)
+        self._update_size()
+
+    def extend(self, projects: Iterable[Project]) -> None:
+        """Appends projects below the current rows.
+
+        Args:
+            projects: The projects to add.
+        """
+        self._projects.extend(projects)
+        self._update_size()
+
+    def refresh_rows(self, paths: Collection[Path]) -> None:
+        """Redraws the rows of projects whose details changed.
+
+        Args:
+            paths: The paths of the changed projects.
+        """
+        self._row_cache.clear()
+        first = self.scroll_offset.y
+        for offset, project in enumerate(self.visible_projects):
+            if project.path in paths:
+                self.refresh_line(first + offset)
+
+    def redraw(self) -> None:
+        """Formats every row again, for example after the row format changed."""
+        self._row_cache.clear()
+        self.refresh()
+
+    def clear_marks(self) -> None:
+        """Unmarks every project."""
+        if self._marked:
+            self._marked.clear()
+            self._row_cache.clear()
+            self.refresh()
+            self.post_message(self.MarksChanged(self))
+
+    def _update_size(self) -> None:
+        # Rows are cropped to the width, so only the height scrolls.
+        self.virtual_size = Size(0, len(self._projects))
+        self.refresh()
+
+    def notify_style_update(self) -> None:
+        super().notify_style_update()
+        self._row_cache.clear()
+
+    def render_line(self, y: int) -> Strip:
+        """Renders one visible row.
+
+        Args:
+            y: The line on screen.
+
+        Returns:
+            The rendered row.
+        """
+        index = self.scroll_offset.y + y
+        width = self.scrollable_content_region.width
+        if index >= len(self._projects):
+            style = self.get_visual_style("project-list--row")
+            return Strip.blank(width, style.rich_style)
+
+        project = self._projects[index]
+        highlighted = index == self.highlighted
+        marked = project.path in self._marked
+        key = (index, highlighted, marked, width)
+        strip = self._row_cache.get(key)
+        if strip is None:
+            components = ["project-list--row"]
+            if highlighted:
+                components.append("project-list--row-highlighted")
+            style = self.get_visual_style(*components)
+            markup = self._format_row(project)
+            if self._marked:
+                # A mark column is only shown while projects are marked.
+                markup = ("[$success]✓[/]" if marked else " ") + markup
+            content = Content.from_markup(markup)
+            strips = Visual.to_strips(self, content, width, 1, style, pad=True)
+            strip = strips[0] if strips else Strip.blank(width, style.rich_style)
+            self._row_cache[key] = strip
+        return strip
+
+    def watch_highlighted(self, old: int | None, new: int | None) -> None:
+        for index in (old, new):
+            if index is not None:
+                self.refresh_line(index)
+        if new is not None:
+            self.scroll_to_region(Region(0, new, 1, 1), animate=False, immediate=True)
+
+    def _move(self, index: int) -> None:
+        if self._projects:
+            self.highlighted = max(0, min(index, len(self._projects) - 1))
+
+    def action_cursor_up(self) -> None:
+        self._move(0 if self.highlighted is None else self.highlighted - 1)
+
+    def action_cursor_down(self) -> None:
+        self._move(0 if self.highlighted is None else self.highlighted + 1)
+
+    def action_page_up(self) -> None:
+        page = max(1, self.scrollable_content_region.height)
+        self._move((self.highlighted or 0) - page)
+
+    def action_page_down(self) -> None:
+        page = max(1, self.scrollable_content_region.height)
+        self._move((self.highlighted or 0) + page)
+
+    def action_first(self) -> None:
+        self._move(0)
+
+    def action_last(self) -> None:
+        self._move(len(self._projects) - 1)
+
+    def action_toggle_mark(self) -> None:
+        """Marks or unmarks the highlighted project."""
+        if self.highlighted is None:
+            return
+        path = self._projects[self.highlighted].path
+        if path in self._marked:
+            del self._marked[path]
+        else:
+            self._marked[path] = None
+        self._row_cache.clear()
+        self.refresh()
+        self.post_message(self.MarksChanged(self))
+
+    def action_mark_all(self) -> None:
+        """Marks every listed project, or unmarks them if all are marked."""
+        paths = [project.path for project in self._projects]
+        if all(path in self._marked for path in paths):
+            for path in paths:
+                self._marked.pop(path, None)
+        else:
+            self._marked.update(dict.fromkeys(paths))
+        self._row_cache.clear()
+        self.refresh()
+        self.post_message(self.MarksChanged(self))
+
+    def action_select(self) -> None:
+        """Posts a Selected message for the highlighted project."""
+        project = self.highlighted_project
+        if project is not None:
+            self.post_message(self.Selected(self, project))
+
+    def on_click(self, event: events.Click) -> None:
+        offset = event.get_content_offset(self)
+        if offset is None:
+            return
+        index = self.scroll_offset.y + offset.y
+        if 0 <= index < len(self._projects):
+            self.highlighted = index
+            self.action_select()
@@ -15,6 +15,8 @@ from textual.widgets.option_list import Option
 
 from nexus.models import Tool
 from nexus.container import get_container
+from nexus.registry import RegistryDiff
+from nexus.services.ranking import frecency_ranks
 from nexus.widgets.tool_list_item import CategoryListItem
 
 
@@ -24,6 +26,7 @@ class ToolBrowser(Widget):
     Attributes:
         search_query: The current text used to filter tool labels and descriptions.
         selected_category: The identifier of the currently selected category.
+        fuzzy: Whether the search tolerates typos instead of matching substrings.
         _filtered_tools: Cached list of tools currently displayed.
     """
 
@@ -61,8 +64,33 @@ class ToolBrowser(Widget):
 
     search_query = reactive("")
     selected_category = reactive("ALL")
+    fuzzy = reactive(False)
     _filtered_tools: list[Tool] = []
 
+    def __init__(
+        self,
+        *,
+        name: str | None = None,
+        id: str | None = None,
+        classes: str | None = None,
+    ) -> None:
+        """Initializes the browser.
+
+        Args:
+            name: The name of the widget.
+            id: The ID of the widget in the DOM.
+            classes: The CSS classes of the widget.
+        """
+        super().__init__(name=name, id=id, classes=classes)
+        # Rendered tool rows by label, with the tool each was built for.
+        self._options: dict[str, tuple[Tool, Option]] = {}
+        self._options_version = -1
+        # The category, filter text and search mode of the listed tools.
+        self._shown_filter: tuple[str, str, bool] | None = None
+        # Launch frecency rank per tool label, with the history version it
+        # was computed for.
+        self._launch_ranks: tuple[int, dict[str, int]] = (-1, {})
+
     def compose(self) -> ComposeResult:
         """Composes the dual-pane visual layout.
 
@@ -116,6 +144,11 @@ class ToolBrowser(Widget):
         """Reacts to category changes."""
         self.populate_tools(new_value, filter_text=self.search_query)
 
+    def watch_fuzzy(self) -> None:
+        """Filters the tools again when the search mode changes."""
+        if self.search_query:
+            self.populate_tools(self.selected_category, filter_text=self.search_query)
+
     def select_all_category(self) -> None:
         """Sets the active selection to the 'ALL' category."""
         category_list = self.query_one("#category-list", ListView)
@@ -130,12 +163,11 @@ class ToolBrowser(Widget):
         category_list = self.query_one("#category-list", ListView)
         category_list.clear()
 
-        tools = get_container().config_manager.get_tools()
-        categories = sorted(list(set(t.category for t in tools)))
+        registry = get_container().config_manager.get_registry()
 
         category_list.append(CategoryListItem("ALL"))
 
-        for category in categories:
+        for category in registry.categories:
             category_list.append(CategoryListItem(category))
 
     @work(exclusive=True)
@@ -152,50 +184,262 @@ class ToolBrowser(Widget):
             # Widget not yet available
             return
 
-        option_list.loading = True
+        previous = self._filtered_tools
+        filtered_tools = self._filter_tools(category, filter_text)
+        self._filtered_tools = filtered_tools
+        shown_filter = (category, filter_text, self.fuzzy)
+        filter_changed = shown_filter != self._shown_filter
+        self._shown_filter = shown_filter
 
-        # Fetch tools from container
-        tools = get_container().config_manager.get_tools()
+        # Shards holding the requested categories are parsed on demand.
+        registry = get_container().config_manager.get_registry()
+        pending = registry.pending_for(category)
+        if pending:
+            self.load_shards(pending)
 
-        if category == "ALL":
-            filtered_tools = tools
-        else:
-            filtered_tools = [t for t in tools if t.category == category]
+        try:
+            highlighted = option_list.highlighted_option
+            self._show_tools(option_list, previous, filtered_tools)
+            # The cursor stays on its tool when the same filter is shown
+            # again, for example after a reload or a shard load.
+            labels = {t.label for t in filtered_tools}
+            if (
+                not filter_changed
+                and highlighted is not None
+                and highlighted.id in labels
+            ):
+                option_list.highlighted = option_list.get_option_index(highlighted.id)
+            elif filtered_tools:
+                option_list.highlighted = 0
 
-        if filter_text:
-            filtered_tools = [
-                t
-                for t in filtered_tools
-                if filter_text.lower() in t.label.lower()
-                or filter_text.lower() in t.description.lower()
-            ]
+            self._update_empty_state(category, filter_text)
+        except Exception:
+            pass
 
-        self._filtered_tools = filtered_tools
+    def _filter_tools(self, category: str, filter_text: str) -> list[Tool]:
+        """Selects the tools to display for a category and filter text.
 
-        try:
-            empty_lbl = self.query_one("#tools-empty", Label)
-            option_list.clear_options()
+        Args:
+            category: The category identifier to display.
+            filter_text: Optional text to filter tool names and descriptions.
 
-            if filtered_tools:
-                option_list.display = True
-                empty_lbl.add_class("hidden")
+        Returns:
+            The matching tools in display order.
+        """
+        # Read from the shared registry snapshot and its search indexes
+        config_manager = get_container().config_manager
+        registry = config_manager.get_registry()
+        if self.fuzzy and filter_text:
+            return registry.fuzzy_search(category, filter_text)
+        tools = registry.search(category, filter_text)
+        if config_manager.get_tool_sort() == "frecency":
+            ranks = self._get_launch_ranks()
+            if ranks:
+                # Stable, so tools never launched keep the configured order.
+                tools.sort(key=lambda tool: ranks.get(tool.label, len(ranks)))
+        return tools
+
+    def _get_launch_ranks(self) -> dict[str, int]:
+        """Retrieves the launch frecency rank of every launched tool.
+
+        The ranks are only computed again after a launch was recorded.
+
+        Returns:
+            The rank per tool label, 0 for the most frecent tool.
+        """
+        state_manager = get_container().state_manager
+        version, ranks = self._launch_ranks
+        if version != state_manager.tool_history_version:
+            ranks = frecency_ranks(state_manager.get_tool_history())
+            self._launch_ranks = (state_manager.tool_history_version, ranks)
+        return ranks
+
+    def _show_tools(
+        self, option_list: OptionList, previous: list[Tool], current: list[Tool]
+    ) -> None:
+        """Updates the tool rows from one filtered list to the next.
 
-                for tool in filtered_tools:
-                    label = f"> [bold]{tool.label}[/] | [dim]{tool.description}[/]"
-                    option_list.add_option(Option(label, id=tool.command))
+        The rows are left alone if the list did not change, extended if it
+        only grew at the end, and otherwise replaced in a single batch.
 
-                option_list.highlighted = 0
+        Args:
+            option_list: The tool list widget.
+            previous: The tools currently shown.
+            current: The tools to show.
+        """
+        self._prune_options()
+        shown = option_list.option_count == len(previous)
+        if shown and current == previous:
+            return
+        if shown and previous and current[: len(previous)] == previous:
+            option_list.add_options(
+                self._tool_option(t) for t in current[len(previous) :]
+            )
+            return
+        option_list.set_options(self._tool_option(t) for t in current)
+
+    def _prune_options(self) -> None:
+        """Drops cached options of tools that are no longer configured."""
+        registry = get_container().config_manager.get_registry()
+        if registry.version == self._options_version:
+            return
+        self._options = {
+            label: entry
+            for label, entry in self._options.items()
+            if registry.get(label) == entry[0]
+        }
+        self._options_version = registry.version
+
+    def _tool_option(self, tool: Tool) -> Option:
+        """Retrieves the option list entry for a tool.
+
+        Options are cached per tool, so the markup of a row is only parsed
+        again after the tool itself changed.
+
+        Args:
+            tool: The tool to display.
+
+        Returns:
+            An Option identified by the tool label.
+        """
+        cached = self._options.get(tool.label)
+        if cached is not None and (cached[0] is tool or cached[0] == tool):
+            return cached[1]
+        label = f"> [bold]{tool.label}[/] | [dim]{tool.description}[/]"
+        option = Option(label, id=tool.label)
+        self._options[tool.label] = (tool, option)
+        return option
+
+    def _update_empty_state(self, category: str, filter_text: str) -> None:
+        """Toggles between the tool list and the empty state label.
+
+        Args:
+            category: The category identifier being displayed.
+            filter_text: The active filter text.
+        """
+        option_list = self.query_one("#tool-list", OptionList)
+        empty_lbl = self.query_one("#tools-empty", Label)
+
+        if self._filtered_tools:
+            option_list.display = True
+            empty_lbl.add_class("hidden")
+        else:
+            option_list.display = False
+            empty_lbl.remove_class("hidden")
+            registry = get_container().config_manager.get_registry()
+            if registry.pending_for(category):
+                empty_lbl.update("Loading tools...")
+            elif filter_text:
+                empty_lbl.update(f"No tools matching '{filter_text}'")
             else:
-                option_list.display = False
-                empty_lbl.remove_class("hidden")
-                if filter_text:
-                    empty_lbl.update(f"No tools matching '{filter_text}'")
-                else:
-                    empty_lbl.update(f"No tools in category '{category}'")
-        except Exception:
-            pass
-        finally:
-            option_list.loading = False
+                empty_lbl.update(f"No tools in category '{category}'")
+
+    async def apply_registry_diff(self, diff: RegistryDiff) -> None:
+        """Patches the category and tool lists after the registry changed.
+
+        Only the affected rows are touched so that the highlighted category,
+        the highlighted tool and the scroll position survive the reload.
+
+        Args:
+            diff: The changes between the previous and current registry.
+        """
+        if diff.categories_changed:
+            await self._patch_categories()
+        self._patch_tools()
+
+    @work(thread=True, group="shards")
+    def load_shards(self, categories: frozenset[str]) -> None:
+        """Parses the tool shards for pending categories in the background.
+
+        Args:
+            categories: The pending categories to load.
+        """
+        config_manager = get_container().config_manager
+        errors_before = len(config_manager.config_errors)
+        diff = config_manager.load_categories(categories)
+        # Index the new tools here rather than on the next keystroke.
+        config_manager.get_registry().warm()
+
+        for error in config_manager.config_errors[errors_before:]:
+            self.app.call_from_thread(
+                self.app.notify,
+                error,
+                title="Config Error",
+                severity="error",
+                timeout=5.0,
+            )
+        self.app.call_from_thread(
+            lambda: self.run_worker(self.apply_registry_diff(diff), group="shards")
+        )
+
+    async def _patch_categories(self) -> None:
+        """Adds and removes category rows to match the current registry."""
+        category_list = self.query_one("#category-list", ListView)
+        registry = get_container().config_manager.get_registry()
+        wanted = set(registry.categories)
+
+        stale = [
+            idx
+            for idx, child in enumerate(category_list.children)
+            if isinstance(child, CategoryListItem)
+            and child.category_id != "ALL"
+            and child.category_id not in wanted
+        ]
+        if stale:
+            await category_list.remove_items(stale)
+
+        present = {
+            child.category_id
+            for child in category_list.children
+            if isinstance(child, CategoryListItem)
+        }
+        # Categories are sorted and always follow the 'ALL' row.
+        for position, category in enumerate(registry.categories, start=1):
+            if category not in present:
+                await category_list.insert(position, [CategoryListItem(category)])
+
+        if self.selected_category not in wanted:
+            self.selected_category = "ALL"
+        for idx, child in enumerate(category_list.children):
+            if (
+                isinstance(child, CategoryListItem)
+                and child.category_id == self.selected_category
+            ):
+                category_list.index = idx
+                break
+
+    def _patch_tools(self) -> None:
+        """Updates the visible tool rows to match the current registry."""
+        option_list = self.query_one("#tool-list", OptionList)
+        self._prune_options()
+        previous = {t.label: t for t in self._filtered_tools}
+        current = self._filter_tools(self.selected_category, self.search_query)
+        current_labels = {t.label for t in current}
+
+        kept = [t.label for t in self._filtered_tools if t.label in current_labels]
+        if kept == [t.label for t in current[: len(kept)]]:
+            # Order is preserved: remove, update and append rows in place.
+            for label in previous.keys() - current_labels:
+                option_list.remove_option(label)
+            for tool in current[: len(kept)]:
+                if previous[tool.label] != tool:
+                    option_list.replace_option_prompt(
+                        tool.label, self._tool_option(tool).prompt
+                    )
+            option_list.add_options(self._tool_option(t) for t in current[len(kept) :])
+        else:
+            highlighted = option_list.highlighted_option
+            highlighted_id = highlighted.id if highlighted is not None else None
+            scroll_y = option_list.scroll_y
+            option_list.set_options(self._tool_option(t) for t in current)
+            if highlighted_id is not None and highlighted_id in current_labels:
+                option_list.highlighted = option_list.get_option_index(highlighted_id)
+            option_list.scroll_to(y=scroll_y, animate=False)
+
+        self._filtered_tools = current
+        if current and option_list.highlighted is None:
+            option_list.highlighted = 0
+        self._update_empty_state(self.selected_category, self.search_query)
 
     def on_list_view_highlighted(self, event: ListView.Highlighted) -> None:
         """Handles highlight events for the category list."""
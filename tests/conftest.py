@@ -7,5 +7,16 @@ is included in the Python path for correct module resolution.
 import sys
 from pathlib import Path
 
+import pytest
+
 # Incorporate the project root into the system path for module imports.
 sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+@pytest.fixture(autouse=True)
+def isolated_caches(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keeps the config snapshot and scan cache out of the user's cache dir."""
+    monkeypatch.setattr(
+        "nexus.config.CONFIG_SNAPSHOT_PATH", tmp_path / "config.snapshot.json"
+    )
+    monkeypatch.setattr("nexus.services.scan_cache.SCAN_CACHE_DIR", tmp_path / "scans")
@@ -0,0 +1,128 @@
+"""Tests for batch runs across several projects."""
+
+import sys
+from pathlib import Path
+
+import pytest
+from textual.app import App
+from textual.widgets import DataTable, Log
+
+from nexus.screens.batch import BatchScreen
+from nexus.screens.confirmation import Confirmation
+from nexus.services.batch import BatchRun
+from nexus.services.jobs import Job
+
+PYTHON = f'"{sys.executable}"'
+
+
+def _projects(tmp_path: Path, count: int) -> list[Path]:
+    projects = []
+    for i in range(count):
+        project = tmp_path / f"repo{i}"
+        project.mkdir()
+        projects.append(project)
+    return projects
+
+
+@pytest.mark.asyncio
+async def test_batch_respects_concurrency_limit(tmp_path: Path) -> None:
+    command = (
+        f'{PYTHON} -c "import os, time; time.sleep(0.2); '
+        f'print(os.path.basename(os.getcwd()))"'
+    )
+    batch = BatchRun("Check", command, _projects(tmp_path, 5), concurrency=2)
+    assert all(job.status == "queued" for job in batch.jobs)
+
+    most = 0
+
+    def on_update(job: Job) -> None:
+        nonlocal most
+        most = max(most, sum(j.status == "running" for j in batch.jobs))
+
+    jobs = await batch.run(on_update)
+
+    assert most == 2
+    assert batch.done == 5
+    assert [job.status for job in jobs] == ["succeeded"] * 5
+    assert [list(job.output) for job in jobs] == [[f"repo{i}"] for i in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_batch_timeouts_and_failures(tmp_path: Path) -> None:
+    command = (
+        f'{PYTHON} -c "import sys, time; n = int(sys.argv[1][-1]); '
+        f"[print(i) for i in range(500)]; time.sleep(n == 2 and 5); "
+        f'sys.exit(n)" {{project}}'
+    )
+    batch = BatchRun(
+        "Check", command, _projects(tmp_path, 3), timeout=1.0, max_lines=10
+    )
+    jobs = await batch.run()
+
+    assert [job.status for job in jobs] == ["succeeded", "failed", "timeout"]
+    assert [job.returncode for job in jobs] == [0, 1, None]
+    assert list(jobs[0].output) == [str(i) for i in range(490, 500)]
+    assert jobs[2].duration < 3
+
+
+@pytest.mark.asyncio
+async def test_batch_screen_shows_sortable_results(tmp_path: Path) -> None:
+    command = (
+        f'{PYTHON} -c "import sys; n = int(sys.argv[1][-1]); '
+        f"print(f'done {{n}}'); sys.exit(n % 2)\" {{project}}"
+    )
+    batch = BatchRun("Check", command, _projects(tmp_path, 4))
+    app: App[None] = App()
+    async with app.run_test(size=(120, 40)) as pilot:
+        screen = BatchScreen(batch)
+        app.push_screen(screen)
+        await pilot.pause()
+        await screen.workers.wait_for_complete()
+        await pilot.pause()
+
+        table = screen.query_one("#batch-results", DataTable)
+        assert table.row_count == 4
+        assert table.get_row_at(1)[1:3] == ["failed", "1"]
+
+        screen.sort_by("exit", reverse=True)
+        assert [table.get_row_at(i)[0] for i in range(4)][:2] == ["repo1", "repo3"]
+        assert table.get_row_at(0)[4] == "done 1"
+        assert "sorted by Exit" in str(screen.query_one("#batch-status").render())
+
+        table.move_cursor(row=3)
+        await pilot.pause()
+        log = screen.query_one("#batch-output", Log)
+        assert list(log.lines) == [f"done {table.get_row_at(3)[0][-1]}"]
+
+        # A finished batch closes without asking
+        await pilot.press("escape")
+        await pilot.pause()
+        assert app.screen is not screen
+
+
+@pytest.mark.asyncio
+async def test_batch_screen_asks_before_stopping_running_batch(
+    tmp_path: Path,
+) -> None:
+    command = f'{PYTHON} -c "import time; time.sleep(30)"'
+    batch = BatchRun("Sleep", command, _projects(tmp_path, 2))
+    app: App[None] = App()
+    async with app.run_test(size=(120, 40)) as pilot:
+        screen = BatchScreen(batch)
+        app.push_screen(screen)
+        await pilot.pause(0.2)
+
+        await pilot.press("escape")
+        await pilot.pause()
+        assert isinstance(app.screen, Confirmation)
+        await pilot.press("n")
+        await pilot.pause()
+        assert app.screen_stack[-1] is screen
+        assert all(job.running for job in batch.jobs)
+
+        await pilot.press("escape")
+        await pilot.pause()
+        await pilot.press("y")
+        await pilot.pause(0.2)
+        assert app.screen_stack[-1] is not screen
+        assert [job.status for job in batch.jobs] == ["cancelled", "cancelled"]
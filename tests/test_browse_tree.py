@@ -0,0 +1,90 @@
+"""Tests for the filesystem browser tree."""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+from textual.app import App, ComposeResult
+from textual.widgets import DirectoryTree
+
+from nexus.services import dir_listing
+from nexus.widgets.browse_tree import BrowseTree
+
+
+class TreeApp(App[None]):
+    def __init__(self, root: Path, **kwargs: Any) -> None:
+        super().__init__()
+        self.root = root
+        self.tree_kwargs = kwargs
+        self.selected: list[Path] = []
+
+    def compose(self) -> ComposeResult:
+        yield BrowseTree(self.root, **self.tree_kwargs)
+
+    def on_directory_tree_directory_selected(
+        self, event: DirectoryTree.DirectorySelected
+    ) -> None:
+        self.selected.append(event.path)
+
+    def on_directory_tree_file_selected(
+        self, event: DirectoryTree.FileSelected
+    ) -> None:
+        self.selected.append(event.path)
+
+
+@pytest.mark.asyncio
+async def test_large_directory_is_paged(tmp_path: Path) -> None:
+    dir_listing.clear_cache()
+    (tmp_path / "sub").mkdir()
+    (tmp_path / ".git").mkdir()
+    for i in range(25):
+        (tmp_path / f"f{i:02}.txt").write_text("")
+
+    app = TreeApp(tmp_path, page_size=10)
+    async with app.run_test() as pilot:
+        tree = app.query_one(BrowseTree)
+        await pilot.pause(0.3)
+
+        labels = [str(node.label) for node in tree.root.children]
+        # .git is ignored by default and directories are listed first
+        assert labels[0] == "sub"
+        assert tree.root.children[0].allow_expand
+        assert len(labels) == 11
+        assert labels[-1] == "… 16 more"
+
+        # Selecting the placeholder loads the next page, not a path
+        tree.select_node(tree.root.children[-1])
+        await pilot.pause(0.2)
+        assert len(tree.root.children) == 21
+        assert str(tree.root.children[-1].label) == "… 6 more"
+        assert app.selected == []
+
+        tree.select_node(tree.root.children[-1])
+        await pilot.pause(0.2)
+        assert len(tree.root.children) == 26
+        assert str(tree.root.children[-1].label) == "f24.txt"
+
+
+@pytest.mark.asyncio
+async def test_ignore_patterns_and_selection(tmp_path: Path) -> None:
+    dir_listing.clear_cache()
+    (tmp_path / "src").mkdir()
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "main.py").write_text("")
+    (tmp_path / "main.pyc").write_text("")
+
+    app = TreeApp(tmp_path, ignore=["node_modules", "*.pyc"])
+    async with app.run_test() as pilot:
+        tree = app.query_one(BrowseTree)
+        await pilot.pause(0.3)
+
+        assert [str(node.label) for node in tree.root.children] == ["src", "main.py"]
+
+        src, main = tree.root.children
+        tree.select_node(main)
+        await pilot.pause()
+        tree.select_node(src)
+        await pilot.pause(0.2)
+        assert app.selected == [tmp_path / "main.py", tmp_path / "src"]
+        # Selecting a directory also expands it, listing it in the background.
+        assert src.is_expanded
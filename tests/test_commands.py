@@ -5,8 +5,9 @@ from typing import Any
 from unittest.mock import patch, MagicMock
 from textual.app import App
 from textual.screen import Screen
-from nexus.commands import ToolCommandProvider
+from nexus.commands import MAX_HITS, ToolCommandProvider
 from nexus.models import Tool
+from nexus.registry import ToolRegistry
 
 
 @pytest.fixture
@@ -34,8 +35,8 @@ def mock_tools() -> list[Tool]:
 @pytest.mark.asyncio
 async def test_discover_commands(mock_tools: list[Tool]) -> None:
     with patch("nexus.container.get_container") as mock_get_container:
-        mock_get_container.return_value.config_manager.get_tools.return_value = (
-            mock_tools
+        mock_get_container.return_value.config_manager.get_registry.return_value = (
+            ToolRegistry(mock_tools)
         )
 
         provider = ToolCommandProvider(Screen())
@@ -50,8 +51,8 @@ async def test_discover_commands(mock_tools: list[Tool]) -> None:
 @pytest.mark.asyncio
 async def test_search_commands(mock_tools: list[Tool]) -> None:
     with patch("nexus.container.get_container") as mock_get_container:
-        mock_get_container.return_value.config_manager.get_tools.return_value = (
-            mock_tools
+        mock_get_container.return_value.config_manager.get_registry.return_value = (
+            ToolRegistry(mock_tools)
         )
 
         provider = ToolCommandProvider(Screen())
@@ -118,3 +119,47 @@ def test_launch_tool_without_active_selector(mock_tools: list[Tool]) -> None:
 
         # Verify launch_tool_flow was called
         mock_launch.assert_called_once_with(tool)
+
+
+@pytest.mark.asyncio
+async def test_search_yields_best_hits_from_snapshot() -> None:
+    tools = [
+        Tool(
+            label=f"Build {i}",
+            category="DEV",
+            description="Compiles the project",
+            command="make",
+            requires_project=False,
+        )
+        for i in range(MAX_HITS + 10)
+    ]
+    tools.append(
+        Tool(
+            label="Build",
+            category="DEV",
+            description="Exact match",
+            command="make",
+            requires_project=False,
+        )
+    )
+    with patch("nexus.container.get_container") as mock_get_container:
+        get_registry = mock_get_container.return_value.config_manager.get_registry
+        get_registry.return_value = ToolRegistry(tools)
+
+        provider = ToolCommandProvider(Screen())
+        await provider.startup()
+        get_registry.reset_mock()
+
+        hits = [hit async for hit in provider.search("build")]
+        assert len(hits) == MAX_HITS
+        assert str(hits[0].match_display) == "Build"
+        assert [hit.score for hit in hits] == sorted(
+            (hit.score for hit in hits), reverse=True
+        )
+
+        # Scores are cached per query and the registry is not read again
+        with patch.object(provider, "matcher", wraps=provider.matcher) as matcher:
+            again = [hit async for hit in provider.search("build")]
+        assert [h.help for h in again] == [h.help for h in hits]
+        assert matcher.call_count == 1
+        get_registry.assert_not_called()
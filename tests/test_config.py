@@ -0,0 +1,252 @@
+"""Tests for configuration loading and the compiled snapshot."""
+
+import os
+import threading
+import tomllib
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from nexus import config
+from nexus.config import ConfigManager
+from nexus.models import Tool
+
+TOOLS_TOML = """
+project_root = "~/Code"
+
+[[tool]]
+label = "Vim"
+category = "DEV"
+description = "Editor"
+command = "nvim {project}"
+requires_project = true
+"""
+
+
+@pytest.fixture
+def config_file(tmp_path: Path) -> Iterator[Path]:
+    path = tmp_path / "tools.toml"
+    path.write_text(TOOLS_TOML)
+    with (
+        patch("nexus.config.CONFIG_PATHS", [path, tmp_path / "missing.toml"]),
+        patch("nexus.config.CONFIG_SNAPSHOT_PATH", tmp_path / "snapshot.json"),
+    ):
+        yield path
+
+
+def test_snapshot_written_and_reused(config_file: Path) -> None:
+    cold = ConfigManager()
+    assert [t.label for t in cold.get_tools()] == ["Vim"]
+    assert cold.load_stats["source"] == "files"
+    assert config.CONFIG_SNAPSHOT_PATH.exists()
+
+    with patch("nexus.config.tomllib.load", side_effect=AssertionError):
+        warm = ConfigManager()
+        tools = warm.get_tools()
+
+    assert warm.load_stats["source"] == "snapshot"
+    assert tools == cold.get_tools()
+    assert warm.get_project_root() == Path("~/Code").expanduser()
+
+
+def test_snapshot_invalidated_by_source_change(config_file: Path) -> None:
+    ConfigManager().get_registry()
+
+    config_file.write_text(TOOLS_TOML.replace("Editor", "Modal editor"))
+    manager = ConfigManager()
+
+    assert manager.get_tools()[0].description == "Modal editor"
+    assert manager.load_stats["source"] == "files"
+
+
+def test_snapshot_skipped_on_config_errors(config_file: Path) -> None:
+    config_file.write_text("[[tool]\nbroken")
+    manager = ConfigManager()
+
+    assert manager.get_tools() == []
+    assert manager.config_errors
+    assert not config.CONFIG_SNAPSHOT_PATH.exists()
+
+
+def test_time_config_load(config_file: Path) -> None:
+    timings = config.time_config_load(rounds=1)
+    assert set(timings) == {"cold_ms", "warm_ms"}
+
+
+def test_reload_reparses_only_changed_files(config_file: Path, tmp_path: Path) -> None:
+    other = tmp_path / "other.toml"
+    other.write_text(TOOLS_TOML.replace("Vim", "Top").replace("DEV", "UTIL"))
+
+    with (
+        patch("nexus.config.CONFIG_PATHS", [config_file, other]),
+        patch("nexus.config.Tool", wraps=Tool) as validate,
+    ):
+        manager = ConfigManager(use_snapshot=False)
+        first = manager.get_registry()
+        assert validate.call_count == 2
+
+        other.write_text(
+            TOOLS_TOML.replace("Vim", "Top").replace("Editor", "Process viewer")
+        )
+        with patch("nexus.config.tomllib.load", wraps=tomllib.load) as parse:
+            diff = manager.reload([other])
+
+        assert parse.call_count == 1
+        assert validate.call_count == 3
+
+    registry = manager.get_registry()
+    assert registry.version > first.version
+    assert registry.get("Vim") is first.get("Vim")
+    assert [t.label for t in diff.changed] == ["Top"]
+    assert diff.categories_changed
+    assert not diff.added and not diff.removed
+
+
+def test_reload_keeps_data_on_parse_error(config_file: Path) -> None:
+    manager = ConfigManager(use_snapshot=False)
+    manager.get_registry()
+
+    config_file.write_text("[[tool]\nbroken")
+    diff = manager.reload([config_file])
+
+    assert not diff
+    assert [t.label for t in manager.get_tools()] == ["Vim"]
+    assert manager.config_errors
+
+
+def test_registry_built_under_the_reload_lock(config_file: Path) -> None:
+    manager = ConfigManager(use_snapshot=False)
+    manager.invalidate()
+    registries = []
+
+    # While another thread reloads, a lazy build has to wait for it.
+    with manager._lock:
+        reader = threading.Thread(
+            target=lambda: registries.append(manager.get_registry())
+        )
+        reader.start()
+        reader.join(0.1)
+        assert reader.is_alive()
+        diff = manager.reload([config_file])
+
+    reader.join()
+    assert registries[0] is manager.get_registry()
+    assert not diff
+
+
+SHARD_TOML = """
+category = "AI"
+
+[[tool]]
+label = "Chat"
+description = "Chat client"
+command = "chat"
+requires_project = false
+"""
+
+
+def test_shards_listed_but_loaded_lazily(config_file: Path, tmp_path: Path) -> None:
+    shard_dir = tmp_path / "tools.d"
+    shard_dir.mkdir()
+    (shard_dir / "assistants.toml").write_text(SHARD_TOML)
+    (shard_dir / "media.toml").write_text(
+        SHARD_TOML.replace('category = "AI"', "").replace("Chat", "Player")
+    )
+
+    manager = ConfigManager()
+    registry = manager.get_registry()
+
+    assert registry.categories == ("AI", "DEV", "MEDIA")
+    assert registry.pending_categories == {"AI", "MEDIA"}
+    assert registry.pending_for("AI") == {"AI"}
+    assert registry.pending_for("ALL") == {"AI", "MEDIA"}
+    assert [t.label for t in registry] == ["Vim"]
+
+    diff = manager.load_categories({"AI"})
+    registry = manager.get_registry()
+
+    assert [t.label for t in diff.added] == ["Chat"]
+    chat = registry.get("Chat")
+    assert chat is not None and chat.category == "AI"
+    assert registry.pending_categories == {"MEDIA"}
+
+    # Lazily loaded shards are not part of the compiled snapshot.
+    warm = ConfigManager()
+    assert [t.label for t in warm.get_tools()] == ["Vim"]
+    assert warm.load_stats["source"] == "snapshot"
+
+
+def test_reload_picks_up_new_shards(config_file: Path, tmp_path: Path) -> None:
+    manager = ConfigManager(use_snapshot=False)
+    assert manager.get_registry().pending_categories == frozenset()
+
+    shard_dir = tmp_path / "tools.d"
+    shard_dir.mkdir()
+    shard = shard_dir / "ai.toml"
+    shard.write_text(SHARD_TOML)
+
+    diff = manager.reload([shard])
+    assert diff.categories_changed
+    assert manager.get_registry().pending_categories == {"AI"}
+
+    manager.load_categories({"AI"})
+    shard.write_text(SHARD_TOML.replace("Chat client", "Assistant"))
+    diff = manager.reload([shard])
+    assert [t.description for t in diff.changed] == ["Assistant"]
+
+
+def test_project_roots_from_list(
+    config_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.delenv("NEXUS_PROJECT_ROOT", raising=False)
+    config_file.write_text('project_root = ["~/work", "/mnt/scratch", "~/work"]\n')
+
+    manager = ConfigManager(use_snapshot=False)
+    assert manager.get_project_roots() == [
+        Path("~/work").expanduser(),
+        Path("/mnt/scratch"),
+    ]
+    assert manager.get_project_root() == Path("~/work").expanduser()
+
+
+def test_project_roots_from_environment(
+    config_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("NEXUS_PROJECT_ROOT", os.pathsep.join(["/srv/a", "", "/srv/b"]))
+
+    manager = ConfigManager(use_snapshot=False)
+    assert manager.get_project_roots() == [Path("/srv/a"), Path("/srv/b")]
+
+
+def test_browse_ignore_extends_defaults(config_file: Path) -> None:
+    from nexus.services.dir_listing import DEFAULT_BROWSE_IGNORE
+
+    config_file.write_text('browse_ignore = ["node_modules", "*.pyc"]\n')
+
+    manager = ConfigManager(use_snapshot=False)
+    assert manager.get_browse_ignore() == DEFAULT_BROWSE_IGNORE | {
+        "node_modules",
+        "*.pyc",
+    }
+
+
+def test_batch_limits(config_file: Path) -> None:
+    from nexus.services.batch import DEFAULT_CONCURRENCY, DEFAULT_TIMEOUT
+
+    manager = ConfigManager(use_snapshot=False)
+    assert manager.get_batch_concurrency() == DEFAULT_CONCURRENCY
+    assert manager.get_batch_timeout() == DEFAULT_TIMEOUT
+
+    config_file.write_text("batch_concurrency = 8\nbatch_timeout = 30\n")
+    manager = ConfigManager(use_snapshot=False)
+    assert manager.get_batch_concurrency() == 8
+    assert manager.get_batch_timeout() == 30.0
+
+
+def test_exit_on_launch(config_file: Path) -> None:
+    assert ConfigManager(use_snapshot=False).get_exit_on_launch() is False
+
+    config_file.write_text("exit_on_launch = true\n")
+    assert ConfigManager(use_snapshot=False).get_exit_on_launch() is True
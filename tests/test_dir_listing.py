@@ -0,0 +1,53 @@
+"""Tests for the cached directory listing service."""
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from nexus.services import dir_listing
+from nexus.services.dir_listing import Entry, list_directory
+
+
+@pytest.fixture(autouse=True)
+def clear_listing_cache() -> Iterator[None]:
+    dir_listing.clear_cache()
+    yield
+    dir_listing.clear_cache()
+
+
+def test_directories_first_sorted_and_filtered(tmp_path: Path) -> None:
+    for name in ("b_dir", "A_dir", ".git", "node_modules"):
+        (tmp_path / name).mkdir()
+    for name in ("z.txt", "a.pyc", "C.md"):
+        (tmp_path / name).write_text("")
+
+    entries = list_directory(tmp_path, ignore=[".git", "*.pyc"])
+    assert entries == [
+        Entry("A_dir", True),
+        Entry("b_dir", True),
+        Entry("node_modules", True),
+        Entry("C.md", False),
+        Entry("z.txt", False),
+    ]
+
+
+def test_listing_cached_until_directory_changes(tmp_path: Path) -> None:
+    (tmp_path / "one").mkdir()
+    first = list_directory(tmp_path)
+
+    with patch("nexus.services.dir_listing.os.scandir", side_effect=AssertionError):
+        assert list_directory(tmp_path) is first
+
+    (tmp_path / "two").mkdir()
+    os.utime(tmp_path, ns=(1_000, 1_000))
+    assert [e.name for e in list_directory(tmp_path)] == ["one", "two"]
+
+    # Different ignore patterns are cached separately
+    assert [e.name for e in list_directory(tmp_path, ignore=["t*"])] == ["one"]
+
+
+def test_unreadable_directory_is_empty(tmp_path: Path) -> None:
+    assert list_directory(tmp_path / "missing") == []
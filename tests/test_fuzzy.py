@@ -0,0 +1,51 @@
+"""Tests for typo-tolerant search."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+from nexus.models import Project, Tool
+from nexus.registry import ToolRegistry
+from nexus.services.fuzzy import FuzzyIndex
+from nexus.services.project_index import ProjectIndex
+
+
+def make_tool(label: str, category: str = "DEV") -> Tool:
+    return Tool(
+        label=label,
+        category=category,
+        description=f"{label} description",
+        command=label.lower(),
+        requires_project=False,
+    )
+
+
+def test_fuzzy_index_tolerates_typos() -> None:
+    index = FuzzyIndex(["nvim", "lazydocker", "htop"], ["Nvim", "Lazydocker", "htop"])
+
+    assert index.search("nivm") == ["nvim"]
+    assert index.search("DOKCER") == ["lazydocker"]
+    assert index.search("zzzz") == []
+    assert index.search("  ") == []
+
+
+def test_fuzzy_index_caches_queries() -> None:
+    index = FuzzyIndex(["nvim", "htop"], ["nvim", "htop"])
+    first = index.search("nivm")
+
+    with patch("nexus.services.fuzzy.process.extractBests") as extract:
+        assert index.search("Nivm") is first
+        extract.assert_not_called()
+
+
+def test_registry_and_project_index_fuzzy_search() -> None:
+    registry = ToolRegistry(
+        [make_tool("Neovim"), make_tool("Lazygit"), make_tool("Htop", "UTIL")]
+    )
+    assert [t.label for t in registry.fuzzy_search("ALL", "lazgit")] == ["Lazygit"]
+    assert registry.fuzzy_search("UTIL", "lazgit") == []
+
+    projects = ProjectIndex(
+        Project(name=name, path=Path("/work") / name, is_git=False)
+        for name in ("website", "backend", "webapp")
+    )
+    assert [p.name for p in projects.fuzzy("backnd")] == ["backend"]
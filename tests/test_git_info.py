@@ -0,0 +1,164 @@
+"""Tests for the git metadata service."""
+
+import os
+import zlib
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from nexus.services.git_info import GitInfoReader, format_age
+
+SHA = "3b18e512dba79e4c8300dd08aeb37f8e728b8dad"
+
+
+@pytest.fixture
+def reader() -> Iterator[GitInfoReader]:
+    reader = GitInfoReader()
+    yield reader
+    reader.shutdown()
+
+
+def _make_repo(path: Path, head: str = "ref: refs/heads/main") -> Path:
+    git_dir = path / ".git"
+    (git_dir / "refs" / "heads").mkdir(parents=True)
+    (git_dir / "HEAD").write_text(head + "\n")
+    return git_dir
+
+
+def _write_commit(git_dir: Path, sha: str, timestamp: int) -> None:
+    body = (
+        f"tree 4b825dc642cb6eb9a060e54bf8d69288fbee4904\n"
+        f"author A U Thor <a@example.com> {timestamp} +0000\n"
+        f"committer A U Thor <a@example.com> {timestamp} +0000\n"
+        f"\nInitial commit\n"
+    ).encode()
+    obj = git_dir / "objects" / sha[:2] / sha[2:]
+    obj.parent.mkdir(parents=True)
+    obj.write_bytes(zlib.compress(b"commit %d\0" % len(body) + body))
+
+
+def test_branch_and_loose_commit(tmp_path: Path, reader: GitInfoReader) -> None:
+    git_dir = _make_repo(tmp_path)
+    (git_dir / "refs" / "heads" / "main").write_text(SHA + "\n")
+    _write_commit(git_dir, SHA, 1_700_000_000)
+
+    info = reader.get_git_info(tmp_path)
+    assert info is not None
+    assert info.branch == "main"
+    assert not info.detached
+    assert info.commit == SHA
+    assert info.last_commit == 1_700_000_000
+
+
+def test_packed_ref_and_detached_head(tmp_path: Path, reader: GitInfoReader) -> None:
+    packed = _make_repo(tmp_path / "packed")
+    (packed / "packed-refs").write_text(
+        f"# pack-refs with: peeled fully-peeled sorted\n{SHA} refs/heads/dev\n"
+    )
+    (packed / "HEAD").write_text("ref: refs/heads/dev\n")
+
+    info = reader.get_git_info(tmp_path / "packed")
+    assert info is not None
+    assert (info.branch, info.commit) == ("dev", SHA)
+
+    _make_repo(tmp_path / "detached", head=SHA)
+    info = reader.get_git_info(tmp_path / "detached")
+    assert info is not None
+    assert info.detached
+    assert info.commit == SHA
+
+
+def test_worktree_pointer(tmp_path: Path, reader: GitInfoReader) -> None:
+    main_git = _make_repo(tmp_path / "main")
+    (main_git / "refs" / "heads" / "feature").write_text(SHA + "\n")
+    wt_git = main_git / "worktrees" / "wt"
+    wt_git.mkdir(parents=True)
+    (wt_git / "HEAD").write_text("ref: refs/heads/feature\n")
+    (wt_git / "commondir").write_text("../..\n")
+
+    (tmp_path / "wt").mkdir()
+    (tmp_path / "wt" / ".git").write_text(f"gitdir: {wt_git}\n")
+
+    info = reader.get_git_info(tmp_path / "wt")
+    assert info is not None
+    assert (info.branch, info.commit) == ("feature", SHA)
+
+
+def test_index_changed_hint(tmp_path: Path, reader: GitInfoReader) -> None:
+    git_dir = _make_repo(tmp_path)
+    ref = git_dir / "refs" / "heads" / "main"
+    ref.write_text(SHA + "\n")
+    index = git_dir / "index"
+    index.write_bytes(b"DIRC")
+
+    os.utime(index, ns=(1_000, 1_000))
+    os.utime(ref, ns=(2_000, 2_000))
+    info = reader.get_git_info(tmp_path)
+    assert info is not None and not info.index_changed
+
+    os.utime(index, ns=(3_000, 3_000))
+    info = reader.get_git_info(tmp_path)
+    assert info is not None and info.index_changed
+
+
+def test_cached_until_git_files_change(tmp_path: Path, reader: GitInfoReader) -> None:
+    git_dir = _make_repo(tmp_path)
+    (git_dir / "refs" / "heads" / "main").write_text(SHA + "\n")
+
+    first = reader.get_git_info(tmp_path)
+    with patch("nexus.services.git_info._read", side_effect=AssertionError):
+        assert reader.get_git_info(tmp_path) is first
+
+    (git_dir / "HEAD").write_text(f"{SHA}\n")
+    os.utime(git_dir / "HEAD", ns=(5_000, 5_000))
+    info = reader.get_git_info(tmp_path)
+    assert info is not None and info.detached
+
+
+def test_load_git_info_skips_plain_directories(
+    tmp_path: Path, reader: GitInfoReader
+) -> None:
+    _make_repo(tmp_path / "repo")
+    (tmp_path / "plain").mkdir()
+
+    results = reader.load_git_info([tmp_path / "repo", tmp_path / "plain"])
+    assert list(results) == [tmp_path / "repo"]
+
+
+def test_cache_keeps_most_recent_projects(tmp_path: Path) -> None:
+    reader = GitInfoReader(max_entries=2)
+    for name in ("a", "b", "c"):
+        _make_repo(tmp_path / name)
+
+    reader.get_git_info(tmp_path / "a")
+    reader.get_git_info(tmp_path / "b")
+    reader.get_git_info(tmp_path / "a")
+    reader.get_git_info(tmp_path / "c")
+
+    assert list(reader._cache) == [tmp_path / "a", tmp_path / "c"]
+
+
+def test_pool_started_on_demand_and_shut_down(
+    tmp_path: Path, reader: GitInfoReader
+) -> None:
+    _make_repo(tmp_path / "repo")
+    assert reader._pool is None
+
+    reader.load_git_info([tmp_path / "repo"])
+    assert reader._pool is not None
+
+    reader.shutdown()
+    assert reader._pool is None
+    # A later load starts a new pool.
+    assert list(reader.load_git_info([tmp_path / "repo"])) == [tmp_path / "repo"]
+
+
+def test_format_age() -> None:
+    assert format_age(5) == "now"
+    assert format_age(90) == "1m"
+    assert format_age(3 * 3600) == "3h"
+    assert format_age(2 * 86_400) == "2d"
+    assert format_age(15 * 86_400) == "2w"
+    assert format_age(400 * 86_400) == "1y"
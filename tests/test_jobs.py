@@ -0,0 +1,111 @@
+"""Tests for the background jobs of tools."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+from nexus.services.jobs import Job, JobManager
+
+
+def python(code: str) -> list[str]:
+    return [sys.executable, "-c", code]
+
+
+@pytest.mark.asyncio
+async def test_job_streams_output_into_ring_buffer() -> None:
+    jobs = JobManager(max_lines=5)
+    updates: list[tuple[str, list[str]]] = []
+    jobs.subscribe(lambda job, lines: updates.append((job.status, lines)))
+
+    job = jobs.start(
+        "Count",
+        python("import sys\nfor i in range(10): print(i)\nsys.stdout.write('end')"),
+    )
+    assert job.running
+    await jobs.wait(job.id)
+
+    assert job.status == "succeeded"
+    assert job.returncode == 0
+    # Only the most recent lines are kept, including an unterminated one.
+    assert list(job.output) == ["6", "7", "8", "9", "end"]
+    streamed = [line for _, lines in updates for line in lines]
+    assert streamed == [str(i) for i in range(10)] + ["end"]
+    assert updates[0] == ("running", [])
+    assert updates[-1] == ("succeeded", [])
+
+
+@pytest.mark.asyncio
+async def test_jobs_run_concurrently(tmp_path: Path) -> None:
+    jobs = JobManager()
+    slow = jobs.start("Slow", python("import time; time.sleep(5)"))
+    fast = jobs.start("Fast", python("import os; print(os.getcwd())"), cwd=tmp_path)
+
+    await jobs.wait(fast.id)
+    assert fast.status == "succeeded"
+    assert list(fast.output) == [str(tmp_path)]
+    assert slow.running
+    assert jobs.running == [slow]
+
+    assert jobs.cancel(slow.id) is True
+    await jobs.wait(slow.id)
+    assert slow.status == "cancelled"
+    assert slow.finished is not None
+    assert jobs.cancel(slow.id) is False
+
+
+@pytest.mark.asyncio
+async def test_failed_jobs() -> None:
+    jobs = JobManager()
+    failing = jobs.start("Fail", python("import sys; print('boom'); sys.exit(3)"))
+    missing = jobs.start("Missing", ["nexus-command-that-does-not-exist"])
+
+    await jobs.wait(failing.id)
+    await jobs.wait(missing.id)
+
+    assert failing.status == "failed"
+    assert failing.returncode == 3
+    assert list(failing.output) == ["boom"]
+    assert missing.status == "failed"
+    assert missing.returncode is None
+    assert len(missing.output) == 1
+
+
+def test_job_output_splits_chunks_into_lines() -> None:
+    job = Job(1, "Test", ["test"])
+    assert job._feed("a\nb") == ["a"]
+    assert job._feed("c\r\nd\n") == ["bc", "d"]
+    assert job._flush() == []
+    assert list(job.output) == ["a", "bc", "d"]
+
+
+@pytest.mark.asyncio
+async def test_job_output_keeps_characters_split_across_reads(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("nexus.services.jobs.READ_CHUNK", 1)
+    jobs = JobManager()
+    job = jobs.start(
+        "Unicode",
+        python("import sys; sys.stdout.buffer.write('héllo €\\nend ✓'.encode())"),
+    )
+    await jobs.wait(job.id)
+
+    assert list(job.output) == ["héllo €", "end ✓"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_job_task_stays_cancelled() -> None:
+    jobs = JobManager()
+    updates: list[str] = []
+    jobs.subscribe(lambda job, lines: updates.append(job.status))
+
+    # Cancelled while the process is still being spawned.
+    job = jobs.start("Slow", python("import time; time.sleep(5)"))
+    assert jobs.cancel(job.id) is True
+    assert await jobs.wait(job.id) is job
+
+    assert job._task is not None and job._task.cancelled()
+    assert job.status == "cancelled"
+    assert job.finished is not None
+    assert updates[-1] == "cancelled"
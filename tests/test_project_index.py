@@ -0,0 +1,100 @@
+"""Tests for the in-memory project index."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+from nexus.models import Project
+from nexus.services.project_index import ProjectIndex, _Snapshot
+from nexus.services.ranking import SearchCorpus
+
+
+def _project(path: str) -> Project:
+    p = Path(path)
+    return Project(name=p.name, path=p, is_git=False)
+
+
+def test_rank_matches_name_and_path_ignoring_case() -> None:
+    index = ProjectIndex(
+        [_project("/work/Api"), _project("/work/web"), _project("/oss/lib")]
+    )
+
+    assert [p.name for p in index.rank("")] == ["Api", "web", "lib"]
+    assert [p.name for p in index.rank("API")] == ["Api"]
+    assert [p.name for p in index.rank("work/")] == ["Api", "web"]
+    assert index.rank("missing") == []
+
+
+def test_rank_boosts_by_frecency() -> None:
+    index = ProjectIndex([_project("/work/web-app"), _project("/work/web-api")])
+    frecency = {Path("/work/web-api"): 5.0, Path("/elsewhere"): 9.0}
+
+    assert [p.name for p in index.rank("web")] == ["web-app", "web-api"]
+    assert [p.name for p in index.rank("web", frecency)] == ["web-api", "web-app"]
+    assert [p.name for p in index.rank("", frecency, limit=1)] == ["web-api"]
+
+
+def test_add_skips_known_paths() -> None:
+    index = ProjectIndex([_project("/work/api")])
+    version = index.version
+
+    added = index.add([_project("/work/api"), _project("/work/web")])
+
+    assert [p.name for p in added] == ["web"]
+    assert len(index) == 2
+    assert Path("/work/web") in index
+    assert index.version == version + 1
+    assert index.add([_project("/work/web")]) == []
+    assert index.version == version + 1
+
+
+def test_streamed_batches_are_snapshotted_on_read() -> None:
+    index = ProjectIndex()
+    before = index.rank("")
+
+    with patch("nexus.services.project_index._Snapshot", wraps=_Snapshot) as snapshot:
+        for start in range(0, 1000, 64):
+            index.add(_project(f"/work/p{i}") for i in range(start, start + 64))
+        assert snapshot.call_count == 0
+
+        assert len(index.rank("p")) == 1024
+        assert len(index.rank("p1")) == len(index.rank("p1"))
+        assert snapshot.call_count == 1
+
+    # Snapshots taken earlier are not affected by later additions
+    assert before == []
+    assert len(index) == 1024
+
+
+def test_replace_drops_previous_projects() -> None:
+    index = ProjectIndex([_project("/work/api")])
+    index.replace([_project("/work/web"), _project("/work/web")])
+
+    assert [p.name for p in index] == ["web"]
+    assert Path("/work/api") not in index
+
+
+def test_refined_queries_rank_like_fresh_ones() -> None:
+    projects = [
+        _project(f"/work/{team}/{name}-{i}")
+        for i in range(30)
+        for team, name in (("web", "app"), ("ops", "deploy"), ("lib", "parser"))
+    ]
+    frecency = {projects[7].path: 4.0, projects[50].path: 2.0}
+    index = ProjectIndex(projects)
+
+    for query in ("a", "ap", "app", "app-", "app-1", "ap", "p", "pa", "par"):
+        expected = ProjectIndex(projects).rank(query, frecency, limit=50)
+        assert index.rank(query, frecency, limit=50) == expected
+
+    # Every match of "dep" is known, so "deploy-1" only ranks those
+    assert len(index.rank("dep")) == 30
+    expected = ProjectIndex(projects).rank("deploy-1")
+    with patch(
+        "nexus.services.project_index.SearchCorpus", wraps=SearchCorpus
+    ) as corpus:
+        assert index.rank("deploy-1") == expected
+    assert len(corpus.call_args.args[0]) == 30
+
+    # A changed index is searched in full again
+    index.add([_project("/work/ops/deploy-99")])
+    assert "deploy-99" in [p.name for p in index.rank("deploy-9")]
@@ -0,0 +1,130 @@
+"""Tests for the virtualized project list widget."""
+
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from textual.app import App, ComposeResult
+
+from nexus.models import Project
+from nexus.widgets.project_list import ProjectList
+
+
+def _projects(count: int) -> list[Project]:
+    return [
+        Project(name=f"p{i}", path=Path(f"/src/p{i}"), is_git=False)
+        for i in range(count)
+    ]
+
+
+class ListApp(App[None]):
+    def __init__(self) -> None:
+        super().__init__()
+        self.format_row = MagicMock(side_effect=lambda project: project.name)
+        self.selected: list[Project] = []
+
+    def compose(self) -> ComposeResult:
+        yield ProjectList(self.format_row)
+
+    def on_project_list_selected(self, event: ProjectList.Selected) -> None:
+        self.selected.append(event.project)
+
+
+@pytest.mark.asyncio
+async def test_only_visible_rows_are_rendered() -> None:
+    app = ListApp()
+    async with app.run_test(size=(40, 10)) as pilot:
+        project_list = app.query_one(ProjectList)
+
+        projects = _projects(100_000)
+        start = time.perf_counter()
+        project_list.set_projects(projects)
+        await pilot.pause()
+        assert time.perf_counter() - start < 1.0
+
+        assert project_list.virtual_size.height == 100_000
+        assert app.format_row.call_count <= 10
+        assert [p.name for p in project_list.visible_projects][:2] == ["p0", "p1"]
+
+        project_list.scroll_to(y=50_000, animate=False)
+        await pilot.pause()
+        assert project_list.visible_projects[0].name == "p50000"
+        assert project_list.render_line(0).text.startswith("p50000")
+
+
+@pytest.mark.asyncio
+async def test_keyboard_navigation_and_selection() -> None:
+    app = ListApp()
+    async with app.run_test(size=(40, 10)) as pilot:
+        project_list = app.query_one(ProjectList)
+        project_list.set_projects(_projects(50))
+        project_list.focus()
+
+        await pilot.press("down", "down", "down", "up")
+        assert project_list.highlighted == 1
+
+        await pilot.press("end")
+        assert project_list.highlighted == 49
+        assert project_list.scroll_offset.y > 0
+
+        await pilot.press("enter")
+        await pilot.pause()
+        assert [p.name for p in app.selected] == ["p49"]
+
+        # A new batch of rows resets the cursor
+        project_list.set_projects(_projects(3))
+        assert project_list.highlighted is None
+        assert project_list.scroll_offset.y == 0
+
+
+@pytest.mark.asyncio
+async def test_refresh_rows_redraws_changed_projects() -> None:
+    labels: dict[Path, str] = {}
+
+    def format_row(project: Project) -> str:
+        return labels.get(project.path, project.name)
+
+    class RefreshApp(App[Any]):
+        def compose(self) -> ComposeResult:
+            yield ProjectList(format_row)
+
+    app = RefreshApp()
+    async with app.run_test(size=(40, 10)) as pilot:
+        project_list = app.query_one(ProjectList)
+        project_list.set_projects(_projects(5))
+        await pilot.pause()
+        assert project_list.render_line(1).text.startswith("p1 ")
+
+        labels[Path("/src/p1")] = "p1 main"
+        project_list.refresh_rows({Path("/src/p1")})
+        assert project_list.render_line(1).text.startswith("p1 main")
+
+
+@pytest.mark.asyncio
+async def test_marks_survive_filtering() -> None:
+    app = ListApp()
+    async with app.run_test(size=(40, 10)) as pilot:
+        project_list = app.query_one(ProjectList)
+        projects = _projects(5)
+        project_list.set_projects(projects)
+        project_list.focus()
+        await pilot.pause()
+
+        await pilot.press("down", "space", "down", "down", "space")
+        assert project_list.marked == [Path("/src/p0"), Path("/src/p2")]
+        assert project_list.render_line(0).text.startswith("✓p0")
+        assert project_list.render_line(1).text.startswith(" p1")
+
+        project_list.set_projects(projects[2:])
+        await pilot.press("ctrl+a")
+        assert project_list.marked == [Path(f"/src/p{i}") for i in (0, 2, 3, 4)]
+
+        await pilot.press("ctrl+a")
+        assert project_list.marked == [Path("/src/p0")]
+
+        project_list.clear_marks()
+        await pilot.pause()
+        assert project_list.marked == []
+        assert project_list.render_line(0).text.startswith("p2")
@@ -1,13 +1,34 @@
 """Tests for the project picker screen."""
 
+import asyncio
+import threading
+
 import pytest
+from collections.abc import AsyncIterator
 from typing import Any
 from pathlib import Path
-from unittest.mock import patch, AsyncMock
+from unittest.mock import MagicMock, patch
 from textual.app import App
 from nexus.screens.project_picker import ProjectPicker
 from nexus.models import Tool, Project
-from textual.widgets import Input, ListView
+from nexus.services.git_info import GitInfo
+from nexus.services.project_scan import ProjectScan, ScanUpdate
+from nexus.widgets.project_list import ProjectList
+from textual.widgets import Input, Label
+
+
+def _streaming(
+    batches: list[list[Project]], gates: list[threading.Event] | None = None
+) -> MagicMock:
+    """Builds an iter_roots mock yielding batches, each after its gate."""
+
+    async def iter_roots(*args: Any, **kwargs: Any) -> AsyncIterator[list[Project]]:
+        for i, batch in enumerate(batches):
+            if gates is not None:
+                await asyncio.to_thread(gates[i].wait, 5)
+            yield batch
+
+    return MagicMock(side_effect=iter_roots)
 
 
 @pytest.fixture
@@ -38,8 +59,9 @@ async def test_project_picker_mount_and_populate(
 
     with patch("nexus.container.get_container") as mock_get_container:
         container = mock_get_container.return_value
-        # scan_projects is now an async function, so it must be mocked with AsyncMock
-        container.scanner.scan_projects = AsyncMock(return_value=mock_projects)
+        container.project_scan = ProjectScan()
+        container.scanner.load_cached_projects.return_value = None
+        container.scanner.iter_roots = _streaming([mock_projects])
         container.state_manager.get_recents.return_value = [
             str(tmp_path / "proj_recent")
         ]
@@ -49,15 +71,15 @@ async def test_project_picker_mount_and_populate(
             await app.push_screen(screen)
             await pilot.pause(0.2)
 
-            list_view = screen.query_one("#project-list", ListView)
+            project_list = screen.query_one("#project-list", ProjectList)
             # 2 from scanner + 1 recent
-            assert len(list_view.children) == 3
+            assert len(project_list.projects) == 3
 
             # Test search filtering
             search_input = screen.query_one("#project-search", Input)
             search_input.value = "proj1"
             await pilot.pause(0.2)
-            assert len(list_view.children) == 1
+            assert len(project_list.projects) == 1
 
             search_input.value = "nonexistent"
             await pilot.pause(0.2)
@@ -77,7 +99,8 @@ async def test_project_picker_selection(mock_tool: Tool, tmp_path: Path) -> None
 
     with patch("nexus.container.get_container") as mock_get_container:
         container = mock_get_container.return_value
-        container.scanner.scan_projects = AsyncMock(return_value=mock_projects)
+        container.project_scan = ProjectScan()
+        container.scanner.iter_roots = _streaming([mock_projects])
         container.state_manager.get_recents.return_value = []
 
         app = NexusApp()
@@ -91,9 +114,9 @@ async def test_project_picker_selection(mock_tool: Tool, tmp_path: Path) -> None
             await app.push_screen(screen)
             await pilot.pause(0.2)
 
-            list_view = screen.query_one("#project-list", ListView)
-            list_view.index = 0
-            list_view.focus()
+            project_list = screen.query_one("#project-list", ProjectList)
+            project_list.highlighted = 0
+            project_list.focus()
 
             # Use real app context, mock suspend instead
             with (
@@ -124,8 +147,9 @@ async def test_project_picker_browse_and_create(
 
     with patch("nexus.container.get_container") as mock_get_container:
         container = mock_get_container.return_value
+        container.project_scan = ProjectScan()
         container.config_manager.get_project_root.return_value = tmp_path
-        container.scanner.scan_projects = AsyncMock(return_value=[])
+        container.scanner.iter_roots = _streaming([])
 
         screen = ProjectPicker(mock_tool)
         async with app.run_test() as pilot:
@@ -162,3 +186,234 @@ async def test_project_picker_browse_and_create(
                 await pilot.click("#btn-create")
                 await pilot.pause(0.2)
                 assert isinstance(app.screen, MockCreate)
+
+
+@pytest.mark.asyncio
+async def test_project_picker_shows_cached_projects_first(
+    mock_tool: Tool, tmp_path: Path
+) -> None:
+    app: App[Any] = App()
+    cached = [Project(name="cached", path=tmp_path / "cached", is_git=False)]
+    fresh = cached + [Project(name="fresh", path=tmp_path / "fresh", is_git=False)]
+    scan_gate = threading.Event()
+
+    with patch("nexus.container.get_container") as mock_get_container:
+        container = mock_get_container.return_value
+        container.project_scan = ProjectScan()
+        container.config_manager.get_project_roots.return_value = [tmp_path]
+        container.scanner.load_cached_projects.return_value = cached
+        container.scanner.iter_roots = _streaming([fresh], [scan_gate])
+        container.state_manager.get_recents.return_value = []
+
+        screen = ProjectPicker(mock_tool)
+        async with app.run_test() as pilot:
+            await app.push_screen(screen)
+            await pilot.pause(0.2)
+
+            project_list = screen.query_one("#project-list", ProjectList)
+            assert len(project_list.projects) == 1
+
+            scan_gate.set()
+            await pilot.pause(0.3)
+            assert len(project_list.projects) == 2
+            assert container.scanner.iter_roots.call_args.kwargs["use_cache"]
+
+
+@pytest.mark.asyncio
+async def test_project_picker_streams_and_stops_scan(
+    mock_tool: Tool, tmp_path: Path
+) -> None:
+    app: App[Any] = App()
+    batches = [
+        [Project(name=f"p{i}", path=tmp_path / f"p{i}", is_git=False)] for i in range(3)
+    ]
+    gates = [threading.Event() for _ in batches]
+
+    with patch("nexus.container.get_container") as mock_get_container:
+        container = mock_get_container.return_value
+        container.project_scan = ProjectScan()
+        container.scanner.load_cached_projects.return_value = None
+        container.scanner.iter_roots = _streaming(batches, gates)
+        container.state_manager.get_recents.return_value = []
+
+        screen = ProjectPicker(mock_tool)
+        async with app.run_test() as pilot:
+            await app.push_screen(screen)
+            await pilot.pause(0.1)
+
+            project_list = screen.query_one("#project-list", ProjectList)
+            status = screen.query_one("#scan-status", Label)
+
+            # Results are appended while the scan is still running
+            gates[0].set()
+            await pilot.pause(0.2)
+            assert len(project_list.projects) == 1
+            assert "1 found" in str(status.render())
+
+            # Stopping keeps the partial result and ignores later batches
+            await pilot.press("ctrl+s")
+            await pilot.pause(0.1)
+            assert "Scan stopped - 1 found" in str(status.render())
+
+            gates[1].set()
+            gates[2].set()
+            await pilot.pause(0.3)
+            assert len(project_list.projects) == 1
+            assert "Scan stopped - 1 found" in str(status.render())
+
+
+@pytest.mark.asyncio
+async def test_project_picker_shows_source_roots(
+    mock_tool: Tool, tmp_path: Path
+) -> None:
+    app: App[Any] = App()
+    work, oss = tmp_path / "work", tmp_path / "oss"
+    projects = [
+        Project(name="api", path=work / "api", is_git=True, root=work),
+        Project(name="lib", path=oss / "lib", is_git=True, root=oss),
+    ]
+
+    with patch("nexus.container.get_container") as mock_get_container:
+        container = mock_get_container.return_value
+        container.project_scan = ProjectScan()
+        container.config_manager.get_project_roots.return_value = [work, oss]
+        container.scanner.load_cached_projects.return_value = None
+        container.scanner.iter_roots = _streaming([projects])
+        container.state_manager.get_recents.return_value = []
+
+        screen = ProjectPicker(mock_tool)
+        async with app.run_test(size=(200, 30)) as pilot:
+            await app.push_screen(screen)
+            await pilot.pause(0.2)
+
+            assert container.scanner.iter_roots.call_args.args[0] == [work, oss]
+            project_list = screen.query_one("#project-list", ProjectList)
+            labels = [project_list.render_line(y).text.rstrip() for y in range(2)]
+            assert len(labels) == 2
+            assert labels[0].endswith(") work")
+            assert labels[1].endswith(") oss")
+
+            # Cached rows are formatted again once the roots are hidden.
+            container.project_scan.show_roots = False
+            screen._apply_scan_update(ScanUpdate(added=[], replaced=False))
+            labels = [project_list.render_line(y).text.rstrip() for y in range(2)]
+            assert not labels[0].endswith(") work")
+            assert not labels[1].endswith(") oss")
+
+
+@pytest.mark.asyncio
+async def test_project_picker_loads_git_info_for_visible_rows(
+    mock_tool: Tool, tmp_path: Path
+) -> None:
+    app: App[Any] = App()
+    projects = [
+        Project(name=f"p{i:03}", path=tmp_path / f"p{i:03}", is_git=True)
+        for i in range(30)
+    ]
+    info = GitInfo(branch="main", commit="abc", last_commit=None, index_changed=True)
+
+    with patch("nexus.container.get_container") as mock_get_container:
+        container = mock_get_container.return_value
+        container.project_scan = ProjectScan()
+        container.scanner.load_cached_projects.return_value = None
+        container.scanner.iter_roots = _streaming([projects])
+        container.state_manager.get_recents.return_value = []
+        container.git_info.load_git_info.side_effect = lambda paths: {
+            path: info for path in paths
+        }
+
+        screen = ProjectPicker(mock_tool)
+        async with app.run_test(size=(200, 30)) as pilot:
+            await app.push_screen(screen)
+            for _ in range(20):
+                await pilot.pause(0.1)
+                if container.git_info.load_git_info.called:
+                    break
+            await pilot.pause(0.1)
+
+            requested = [
+                path
+                for call in container.git_info.load_git_info.call_args_list
+                for path in call.args[0]
+            ]
+            # Only the rows on screen are read, not the whole list
+            assert tmp_path / "p000" in requested
+            assert tmp_path / "p029" not in requested
+
+            first = screen.query_one("#project-list", ProjectList).render_line(0)
+            assert "main" in first.text
+
+
+@pytest.mark.asyncio
+async def test_project_picker_filters_without_rescanning(
+    mock_tool: Tool, tmp_path: Path
+) -> None:
+    app: App[Any] = App()
+    projects = [
+        Project(name=name, path=tmp_path / name, is_git=False)
+        for name in ("alpha", "beta", "gamma")
+    ]
+
+    with patch("nexus.container.get_container") as mock_get_container:
+        container = mock_get_container.return_value
+        container.project_scan = ProjectScan()
+        container.scanner.load_cached_projects.return_value = None
+        container.scanner.iter_roots = _streaming([projects])
+        container.state_manager.get_recents.return_value = []
+
+        screen = ProjectPicker(mock_tool)
+        async with app.run_test() as pilot:
+            await app.push_screen(screen)
+            await pilot.pause(0.2)
+
+            # Keystrokes are coalesced and filtered in memory
+            await pilot.press("a", "l")
+            await pilot.pause(0.2)
+            project_list = screen.query_one("#project-list", ProjectList)
+            assert len(project_list.projects) == 1
+
+            await pilot.press("backspace", "backspace")
+            await pilot.pause(0.2)
+            assert len(project_list.projects) == 3
+
+            assert container.scanner.iter_roots.call_count == 1
+            assert container.state_manager.get_recents.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_project_picker_attaches_to_running_scan(
+    mock_tool: Tool, tmp_path: Path
+) -> None:
+    app: App[Any] = App()
+    batches = [
+        [Project(name=f"p{i}", path=tmp_path / f"p{i}", is_git=False)] for i in range(2)
+    ]
+    gates = [threading.Event() for _ in batches]
+
+    with patch("nexus.container.get_container") as mock_get_container:
+        container = mock_get_container.return_value
+        container.project_scan = ProjectScan()
+        container.scanner.load_cached_projects.return_value = None
+        container.scanner.iter_roots = _streaming(batches, gates)
+        container.state_manager.get_recents.return_value = []
+
+        # Prewarmed at startup, before the picker is opened
+        container.project_scan.start()
+        gates[0].set()
+        for _ in range(50):
+            if container.project_scan.found:
+                break
+            await asyncio.sleep(0.02)
+
+        screen = ProjectPicker(mock_tool)
+        async with app.run_test() as pilot:
+            await app.push_screen(screen)
+            await pilot.pause(0.1)
+
+            project_list = screen.query_one("#project-list", ProjectList)
+            assert [p.name for p in project_list.projects] == ["p0"]
+
+            gates[1].set()
+            await pilot.pause(0.3)
+            assert [p.name for p in project_list.projects] == ["p0", "p1"]
+            assert container.scanner.iter_roots.call_count == 1
@@ -0,0 +1,101 @@
+"""Tests for the shared background project scan."""
+
+import asyncio
+import threading
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from nexus.models import Project
+from nexus.services.project_scan import ProjectScan, ScanUpdate
+
+
+def _streaming(batches: list[list[Project]], gates: list[threading.Event]) -> MagicMock:
+    """Builds an iter_roots mock yielding batches, each after its gate."""
+
+    async def iter_roots(*args: Any, **kwargs: Any) -> AsyncIterator[list[Project]]:
+        for gate, batch in zip(gates, batches):
+            await asyncio.to_thread(gate.wait, 5)
+            yield batch
+
+    return MagicMock(side_effect=iter_roots)
+
+
+def _wait_for(predicate: Any, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def test_scan_seeds_streams_and_finishes(tmp_path: Path) -> None:
+    (tmp_path / "recent").mkdir()
+    cached = [Project(name="cached", path=tmp_path / "cached", is_git=False)]
+    fresh = [Project(name="fresh", path=tmp_path / "fresh", is_git=False)]
+    gate = threading.Event()
+    updates: list[ScanUpdate] = []
+
+    with patch("nexus.container.get_container") as mock_get_container:
+        container = mock_get_container.return_value
+        container.config_manager.get_project_roots.return_value = [tmp_path]
+        container.scanner.load_cached_projects.return_value = cached
+        container.scanner.iter_roots = _streaming([fresh], [gate])
+        container.state_manager.get_recents.return_value = [str(tmp_path / "recent")]
+
+        scan = ProjectScan()
+        scan.subscribe(updates.append)
+        assert scan.start()
+        assert not scan.start()
+
+        # The cache and the recent projects are indexed before the walk
+        _wait_for(lambda: len(updates) == 1)
+        assert updates[0].replaced
+        assert [p.name for p in scan.index] == ["cached", "recent"]
+        # Cached projects of nested roots are credited to those roots
+        load_cached = container.scanner.load_cached_projects
+        assert load_cached.call_args.kwargs["roots"] == [tmp_path]
+
+        gate.set()
+        _wait_for(lambda: scan.status == "finished")
+        assert [p.name for p in updates[1].added] == ["fresh"]
+        assert updates[-1].replaced
+        assert [p.name for p in scan.index] == ["fresh", "recent"]
+        assert scan.found == 1
+
+        # A recent result is reused instead of scanning again
+        assert not scan.start()
+        assert container.scanner.iter_roots.call_count == 1
+
+
+def test_stop_keeps_partial_index(tmp_path: Path) -> None:
+    batches = [
+        [Project(name=f"p{i}", path=tmp_path / f"p{i}", is_git=False)] for i in range(2)
+    ]
+    gates = [threading.Event() for _ in batches]
+    updates: list[ScanUpdate] = []
+
+    with patch("nexus.container.get_container") as mock_get_container:
+        container = mock_get_container.return_value
+        container.scanner.load_cached_projects.return_value = None
+        container.scanner.iter_roots = _streaming(batches, gates)
+        container.state_manager.get_recents.return_value = []
+
+        scan = ProjectScan()
+        scan.subscribe(updates.append)
+        scan.start()
+        gates[0].set()
+        _wait_for(lambda: scan.found == 1)
+
+        scan.stop()
+        scan.unsubscribe(updates.append)
+        gates[1].set()
+        time.sleep(0.1)
+
+        assert scan.status == "stopped"
+        assert [p.name for p in scan.index] == ["p0"]
+        assert not any(update.replaced for update in updates[1:])
+
+        # A stopped scan is restarted by the next picker
+        assert scan.start()
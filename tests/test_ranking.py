@@ -0,0 +1,124 @@
+"""Tests for search result ranking."""
+
+import time
+from pathlib import Path
+
+from nexus.services.ranking import (
+    FRECENCY_HALF_LIFE,
+    SearchCorpus,
+    frecency,
+    frecency_map,
+    frecency_ranks,
+    match_key,
+    rank,
+    score,
+)
+
+
+def _rank(names: list[str], query: str, **kwargs: object) -> list[str]:
+    corpus = SearchCorpus(match_key(name, f"/home/me/{name}") for name in names)
+    return rank(names, corpus, query, **kwargs)  # type: ignore[arg-type]
+
+
+def test_match_tiers() -> None:
+    def key(name: str, path: str = "/src") -> float:
+        return score("api", match_key(name, f"{path}/{name}"))
+
+    exact = key("api")
+    prefix = key("api-server")
+    substring = key("rest-api")
+    path = key("server", "/work/api")
+    subsequence = key("a-p-i")
+    tail = key("server", "/work/ap/i")
+
+    assert exact > prefix > substring > path > subsequence > tail > 0
+    assert key("server", "/a/p/work/x") == 0
+
+
+def test_rank_orders_best_first_and_ignores_case() -> None:
+    names = ["my-nexus-fork", "Nexus", "nexus-docs", "next-ux-study", "other"]
+
+    assert _rank(names, "NEXUS") == [
+        "Nexus",
+        "nexus-docs",
+        "my-nexus-fork",
+        "next-ux-study",
+    ]
+
+
+def test_subsequence_matches_trailing_path_segments() -> None:
+    corpus = SearchCorpus(
+        [match_key("app", "/home/me/work/acme/app"), match_key("x", "/home/y")]
+    )
+
+    assert rank(["app", "x"], corpus, "acmapp") == ["app"]
+    # Leading segments are not searched by subsequence.
+    assert rank(["app", "x"], corpus, "hmacmapp") == []
+
+
+def test_frecency_boost_and_decay() -> None:
+    now = time.time()
+    assert frecency(4, now, now) == 4
+    assert frecency(4, now - FRECENCY_HALF_LIFE, now) == 2
+
+    history = {"/a": (1, now), "/b": (10, now)}
+    assert frecency_map(history, now) == {Path("/a"): 1.0, Path("/b"): 10.0}
+
+    names = ["web-app", "web-api"]
+    assert _rank(names, "web") == ["web-app", "web-api"]
+    assert _rank(names, "web", boosts={1: 3.0}) == ["web-api", "web-app"]
+    # A boost never turns a non-match into a result.
+    assert _rank(names, "zzz", boosts={1: 3.0}) == []
+
+
+def test_frecency_ranks_order_keys() -> None:
+    now = 1_000_000.0
+    history = {
+        "Old favourite": (40, now - 8 * FRECENCY_HALF_LIFE),
+        "Daily": (10, now - 60),
+        "Once": (1, now - 60),
+        "Once later": (1, now - 30),
+    }
+
+    assert frecency_ranks(history, now) == {
+        "Daily": 0,
+        "Once later": 1,
+        "Once": 2,
+        "Old favourite": 3,
+    }
+
+
+def test_limit_keeps_best_results_in_order() -> None:
+    names = [f"proj{i:05}" for i in range(1000)]
+
+    assert _rank(names, "proj", limit=3) == names[:3]
+    assert _rank(names, "", boosts={500: 1.0}, limit=2) == [names[500], names[0]]
+
+
+def test_corpus_scan_agrees_with_score() -> None:
+    keys = [
+        match_key(name, f"/src/{group}/{name}")
+        for group in ("api", "web", "tools")
+        for name in ("api", "rest-api", "a-p-i", "apiapi", "web", "xyz")
+    ]
+    corpus = SearchCorpus(keys)
+
+    for query in ("api", "a", "pi", "web", "sapi", "tls", "zzz"):
+        expected = {i: score(query, key) for i, key in enumerate(keys)}
+        assert corpus.match(query) == {i: v for i, v in expected.items() if v}
+
+
+def test_rank_large_corpus_is_fast() -> None:
+    names = [f"project-{i}" for i in range(50_000)]
+    corpus = SearchCorpus(
+        match_key(name, f"/home/me/src/group{i % 50}/{name}")
+        for i, name in enumerate(names)
+    )
+
+    start = time.perf_counter()
+    for query in ("pj49", "project-4", "group7", "nexus"):
+        rank(names, corpus, query, limit=200)
+    elapsed = time.perf_counter() - start
+
+    # Generous bound for slow CI machines.
+    assert elapsed < 1.0
@@ -0,0 +1,32 @@
+"""Tests for the query refinement cache."""
+
+from nexus.services.refine import RefinementCache
+
+
+def test_stack_follows_typing_and_backspacing() -> None:
+    cache: RefinementCache[list[int]] = RefinementCache()
+    assert cache.lookup("d") is None
+
+    cache.push("d", [1, 2, 3])
+    cache.push("do", [1, 2])
+    cache.push("doc", [2])
+
+    # Typing on refines the longest cached query
+    assert cache.lookup("dock") == ("doc", [2])
+    # Backspacing pops back to the shorter queries
+    assert cache.lookup("do") == ("do", [1, 2])
+    assert cache.lookup("doc") == ("do", [1, 2])
+    # An unrelated query starts over
+    assert cache.lookup("x") is None
+    assert cache.lookup("d") is None
+
+
+def test_version_change_and_depth() -> None:
+    cache: RefinementCache[str] = RefinementCache(depth=2)
+    cache.push("a", "1", version=1)
+    assert cache.lookup("ab", version=2) is None
+
+    for query in ("a", "ab", "abc"):
+        cache.push(query, query, version=2)
+    assert cache.lookup("ab", version=2) == ("ab", "ab")
+    assert cache.lookup("a", version=2) is None
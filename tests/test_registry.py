@@ -0,0 +1,72 @@
+"""Tests for the tool registry."""
+
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+from nexus.config import ConfigManager
+from nexus.models import Tool
+from nexus.registry import ToolRegistry
+
+
+def make_tool(label: str, category: str) -> Tool:
+    return Tool(
+        label=label,
+        category=category,
+        description=f"{label} description",
+        command=label.lower(),
+        requires_project=False,
+    )
+
+
+def test_registry_indexes() -> None:
+    tools = [
+        make_tool("Vim", "DEV"),
+        make_tool("Top", "UTIL"),
+        make_tool("Git", "DEV"),
+    ]
+    registry = ToolRegistry(tools, version=3)
+
+    assert registry.version == 3
+    assert len(registry) == 3
+    assert registry.categories == ("DEV", "UTIL")
+    assert registry.by_category("ALL") == tuple(tools)
+    assert [t.label for t in registry.by_category("DEV")] == ["Vim", "Git"]
+    assert registry.by_category("MISSING") == ()
+    assert registry.get("Top") is tools[1]
+    assert registry.get("Nope") is None
+    assert "Git" in registry
+
+
+def test_registry_tools_are_immutable() -> None:
+    tool = make_tool("Vim", "DEV")
+    with pytest.raises(ValidationError):
+        tool.label = "Emacs"
+
+
+def test_config_manager_reuses_registry() -> None:
+    manager = ConfigManager()
+    data = {
+        "tool": [
+            {
+                "label": "Vim",
+                "category": "DEV",
+                "description": "Editor",
+                "command": "nvim",
+                "requires_project": True,
+            },
+            {"label": "Broken", "category": "DEV"},
+        ]
+    }
+
+    with patch.object(manager, "_load_config_data", return_value=data):
+        first = manager.get_registry()
+        assert manager.get_registry() is first
+        assert [t.label for t in manager.get_tools()] == ["Vim"]
+        assert len(manager.config_errors) == 1
+
+        manager.invalidate()
+        second = manager.get_registry()
+        assert second is not first
+        assert second.version > first.version
@@ -1,9 +1,22 @@
 """Tests for the filesystem scanner service."""
 
+import asyncio
+import os
+import threading
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+
 import pytest
 from pathlib import Path
 from typing import Any
-from nexus.services.scanner import scan_projects
+from nexus.models import Project
+from nexus.services.scanner import (
+    _Walker,
+    iter_projects,
+    iter_roots,
+    load_cached_projects,
+    scan_projects,
+)
 
 
 @pytest.mark.asyncio
@@ -58,10 +71,250 @@ async def test_scan_projects_permission_error(
     root_dir = tmp_path / "root"
     root_dir.mkdir()
 
-    def mock_iterdir(*args: Any, **kwargs: Any) -> Any:
+    def mock_scandir(*args: Any, **kwargs: Any) -> Any:
         raise PermissionError("Access denied")
 
-    monkeypatch.setattr(Path, "iterdir", mock_iterdir)
+    monkeypatch.setattr("nexus.services.scanner.os.scandir", mock_scandir)
 
     projects = await scan_projects(root_dir)
     assert projects == []
+
+
+@pytest.mark.asyncio
+async def test_scan_projects_nested(tmp_path: Path) -> None:
+    # work/ is a plain container holding repositories two levels down
+    (tmp_path / "work" / "team" / "api" / ".git").mkdir(parents=True)
+    (tmp_path / "work" / "team" / "api" / "src").mkdir()
+    (tmp_path / "work" / "team" / "web").mkdir()
+    (tmp_path / "work" / "team" / "web" / "package.json").touch()
+    (tmp_path / "work" / "scratch").mkdir()
+
+    # Markers stop descent even when deeper directories exist
+    (tmp_path / "tool" / "pkg" / "nested").mkdir(parents=True)
+    (tmp_path / "tool" / "pyproject.toml").touch()
+
+    # Heavy directories are skipped entirely
+    (tmp_path / "node_modules" / "left-pad").mkdir(parents=True)
+
+    projects = await scan_projects(tmp_path, max_depth=3)
+
+    assert [(p.name, p.is_git) for p in projects] == [
+        ("api", True),
+        ("scratch", False),
+        ("tool", False),
+        ("web", False),
+    ]
+    assert projects[0].path == tmp_path / "work" / "team" / "api"
+
+
+@pytest.mark.asyncio
+async def test_scan_projects_depth_limit(tmp_path: Path) -> None:
+    (tmp_path / "a" / "b" / "c" / "d").mkdir(parents=True)
+    (tmp_path / "a" / "b" / "c" / ".git").mkdir()
+
+    shallow = await scan_projects(tmp_path, max_depth=2)
+    assert [p.path for p in shallow] == [tmp_path / "a" / "b"]
+
+    deep = await scan_projects(tmp_path, max_depth=4)
+    assert [(p.path, p.is_git) for p in deep] == [(tmp_path / "a" / "b" / "c", True)]
+
+
+@pytest.mark.asyncio
+async def test_scan_projects_custom_prune(tmp_path: Path) -> None:
+    (tmp_path / "keep").mkdir()
+    (tmp_path / "archive").mkdir()
+
+    projects = await scan_projects(tmp_path, prune={"archive"})
+    assert [p.name for p in projects] == ["keep"]
+
+
+@pytest.mark.asyncio
+async def test_scan_projects_reuses_cached_listings(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("nexus.services.scan_cache.SCAN_CACHE_DIR", tmp_path / "cache")
+    root = tmp_path / "root"
+    (root / "work" / "api" / ".git").mkdir(parents=True)
+    (root / "work" / "web").mkdir()
+
+    first = await scan_projects(root, max_depth=3, use_cache=True)
+    assert [p.name for p in first] == ["api", "web"]
+
+    listed: list[str] = []
+    real_scandir = os.scandir
+
+    def counting_scandir(path: str) -> Any:
+        listed.append(path)
+        return real_scandir(path)
+
+    monkeypatch.setattr("nexus.services.scanner.os.scandir", counting_scandir)
+
+    # Nothing changed, so every listing comes from the cache
+    second = await scan_projects(root, max_depth=3, use_cache=True)
+    assert second == first
+    assert listed == []
+
+    # Only the directory whose mtime changed is listed again
+    (root / "work" / "cli").mkdir()
+    third = await scan_projects(root, max_depth=3, use_cache=True)
+    assert [p.name for p in third] == ["api", "cli", "web"]
+    assert str(root / "work") in listed
+    assert str(root) not in listed
+
+
+@pytest.mark.asyncio
+async def test_load_cached_projects(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("nexus.services.scan_cache.SCAN_CACHE_DIR", tmp_path / "cache")
+    root = tmp_path / "root"
+    (root / "proj").mkdir(parents=True)
+
+    assert load_cached_projects(root) is None
+
+    projects = await scan_projects(root, use_cache=True)
+    assert load_cached_projects(root) == projects
+    # Results are keyed by the scan settings
+    assert load_cached_projects(root, max_depth=2) is None
+
+
+@pytest.mark.asyncio
+async def test_iter_projects_streams_batches(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("nexus.services.scanner.LEAF_CHUNK", 2)
+    for i in range(5):
+        (tmp_path / f"p{i}").mkdir()
+
+    batches = [batch async for batch in iter_projects(tmp_path)]
+    assert len(batches) >= 1
+    assert sorted(p.name for batch in batches for p in batch) == [
+        f"p{i}" for i in range(5)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_iter_projects_early_close_skips_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("nexus.services.scan_cache.SCAN_CACHE_DIR", tmp_path / "cache")
+    root = tmp_path / "root"
+    for i in range(3):
+        (root / f"p{i}").mkdir(parents=True)
+
+    async with aclosing(iter_projects(root, use_cache=True)) as batches:
+        async for _batch in batches:
+            break
+
+    # A partial walk must not be persisted as the last result
+    assert load_cached_projects(root) is None
+
+
+@pytest.mark.asyncio
+async def test_iter_roots_merges_and_dedupes(tmp_path: Path) -> None:
+    work, oss = tmp_path / "work", tmp_path / "oss"
+    (work / "api").mkdir(parents=True)
+    (oss / "lib").mkdir(parents=True)
+
+    # work/api and oss/lib are also reachable from the enclosing root
+    found = [
+        p
+        async for batch in iter_roots([work, oss, tmp_path], max_depth=2)
+        for p in batch
+    ]
+    assert sorted((p.name, p.root) for p in found) == [
+        ("api", work),
+        ("lib", oss),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_nested_root_owns_its_own_project(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("nexus.services.scan_cache.SCAN_CACHE_DIR", tmp_path / "cache")
+    code = tmp_path / "code"
+    work = code / "work"
+    (work / "api").mkdir(parents=True)
+    (work / "pyproject.toml").touch()
+    (code / "tool").mkdir()
+    roots = [code, work]
+    expected = [("api", work), ("tool", code), ("work", work)]
+
+    # The enclosing root finds work as a project and stops there.
+    found = [
+        p
+        async for batch in iter_roots(roots, max_depth=2, use_cache=True)
+        for p in batch
+    ]
+    assert sorted((p.name, p.root) for p in found) == expected
+
+    # The cached results are attributed the same way.
+    cached = [
+        p
+        for root in roots
+        for p in load_cached_projects(root, max_depth=2, roots=roots) or []
+    ]
+    assert sorted((p.name, p.root) for p in cached) == expected
+    code_cache = load_cached_projects(code, max_depth=2)
+    assert code_cache is not None
+    assert sorted(p.name for p in code_cache) == ["tool", "work"]
+    assert {p.root for p in code_cache} == {code}
+
+
+@pytest.mark.asyncio
+async def test_iter_roots_times_out_slow_root(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    fast, slow = tmp_path / "fast", tmp_path / "slow"
+    real_iter_projects = iter_projects
+
+    async def stalling_iter_projects(
+        root: Path, *args: Any, **kwargs: Any
+    ) -> AsyncIterator[list[Project]]:
+        if root == slow:
+            yield [Project(name="early", path=slow / "early", is_git=False)]
+            await asyncio.sleep(10)
+        async for batch in real_iter_projects(root, *args, **kwargs):
+            yield batch
+
+    monkeypatch.setattr("nexus.services.scanner.iter_projects", stalling_iter_projects)
+    (fast / "proj").mkdir(parents=True)
+
+    found = [
+        p.name async for batch in iter_roots([slow, fast], timeout=0.2) for p in batch
+    ]
+    assert sorted(found) == ["early", "proj"]
+
+
+def test_cancelled_walk_stops_without_waiting_for_blocked_listing(
+    tmp_path: Path,
+) -> None:
+    for name in ("hung", "a", "b", "c"):
+        (tmp_path / name / "sub").mkdir(parents=True)
+
+    walker = _Walker(max_depth=3, prune=frozenset(), workers=1)
+    release = threading.Event()
+    listed: list[str] = []
+    real_list = walker._list
+
+    def list_dir(path: str) -> Any:
+        listed.append(os.path.basename(path))
+        if path.endswith("hung"):
+            release.wait(5)
+        return real_list(path)
+
+    walker._list = list_dir  # type: ignore[method-assign]
+    walking = threading.Thread(target=walker.walk, args=(str(tmp_path),))
+    walking.start()
+    while "hung" not in listed:
+        walking.join(0.01)
+
+    walker.cancel()
+    walking.join(1)
+    try:
+        assert not walking.is_alive()
+    finally:
+        release.set()
+    # With the only worker stuck, no other directory was listed.
+    assert listed[-1] == "hung"
@@ -3,8 +3,9 @@
 This module provides unit tests for the executor and configuration services.
 """
 
-from unittest.mock import patch
 from pathlib import Path
+from unittest.mock import patch
+
 from nexus import config
 from nexus.services import executor
 
@@ -47,6 +48,7 @@ def test_terminal_detection_ordering() -> None:
 
     Asserts that the first available terminal in the priority list is returned.
     """
+    config.get_preferred_terminal.cache_clear()
     with patch("shutil.which") as mock_which:
 
         def side_effect(arg: str) -> str | None:
@@ -59,6 +61,11 @@ def test_terminal_detection_ordering() -> None:
         term = config.get_preferred_terminal()
         assert term == "/usr/bin/gnome-terminal"
 
+        # The lookup is cached
+        assert config.get_preferred_terminal() == term
+        assert mock_which.call_count == 3
+    config.get_preferred_terminal.cache_clear()
+
 
 def test_launch_tool_with_flags_and_placeholders() -> None:
     """Verifies that launch_tool correctly replaces {flags} and {project}."""
@@ -93,3 +100,159 @@ def test_launch_tool_shlex_value_error() -> None:
 def test_launch_tool_file_not_found() -> None:
     with patch("subprocess.run", side_effect=FileNotFoundError):
         assert executor.launch_tool("doesnotexist") is False
+
+
+def test_config_watcher_reports_changes(tmp_path: Path) -> None:
+    """Verifies that both watcher backends report modified files."""
+    import threading
+
+    from nexus.services import watcher
+
+    target = tmp_path / "tools.toml"
+    target.write_text("a = 1")
+    (tmp_path / "unrelated.toml").write_text("")
+
+    for use_inotify in (True, False):
+        changes: list[set[Path]] = []
+        seen = threading.Event()
+
+        def on_change(
+            paths: set[Path],
+            changes: list[set[Path]] = changes,
+            seen: threading.Event = seen,
+        ) -> None:
+            changes.append(paths)
+            seen.set()
+
+        with patch.object(
+            watcher,
+            "_load_inotify",
+            wraps=watcher._load_inotify if use_inotify else lambda: None,
+        ):
+            config_watcher = watcher.ConfigWatcher(
+                [target], on_change, interval=0.05, settle=0.01
+            )
+        if not use_inotify:
+            assert config_watcher.backend_name == "polling"
+        config_watcher.start()
+        try:
+            (tmp_path / "unrelated.toml").write_text("b = 2")
+            target.write_text(f"a = {len(changes) + 100}")
+            assert seen.wait(5)
+        finally:
+            config_watcher.stop()
+
+        assert changes[0] == {target}
+
+
+def test_config_watcher_reports_new_files_in_directories(tmp_path: Path) -> None:
+    """Verifies that files created inside watched directories are reported."""
+    import threading
+
+    from nexus.services.watcher import ConfigWatcher
+
+    shard_dir = tmp_path / "tools.d"
+    shard_dir.mkdir()
+    changes: list[set[Path]] = []
+    seen = threading.Event()
+
+    def on_change(paths: set[Path]) -> None:
+        changes.append(paths)
+        seen.set()
+
+    config_watcher = ConfigWatcher(
+        [], on_change, directories=[shard_dir], interval=0.05, settle=0.01
+    )
+    config_watcher.start()
+    try:
+        (shard_dir / "notes.txt").write_text("ignored")
+        (shard_dir / "ai.toml").write_text('category = "AI"')
+        assert seen.wait(5)
+    finally:
+        config_watcher.stop()
+
+    assert changes[0] == {shard_dir / "ai.toml"}
+
+
+def test_exec_tool_replaces_process(tmp_path: Path) -> None:
+    launch = executor.Launch(["nvim", "."], tmp_path)
+    with (
+        patch("os.chdir") as mock_chdir,
+        patch("os.execvpe") as mock_exec,
+        patch("os.name", "posix"),
+    ):
+        executor.exec_tool(launch)
+
+    mock_chdir.assert_called_once_with(tmp_path)
+    file, argv, env = mock_exec.call_args[0]
+    assert (file, argv) == ("nvim", ["nvim", "."])
+    assert env["PWD"] == str(tmp_path)
+
+
+def test_exec_tool_reports_missing_command() -> None:
+    import pytest
+
+    launch = executor.Launch(["doesnotexist"], None)
+    with (
+        patch("os.execvpe", side_effect=FileNotFoundError),
+        patch("os.name", "posix"),
+        pytest.raises(SystemExit) as exit_info,
+    ):
+        executor.exec_tool(launch)
+    assert exit_info.value.code == 127
+
+
+def test_main_script_execs_the_chosen_tool(tmp_path: Path) -> None:
+    import runpy
+
+    launch = executor.Launch(["nvim", "."], tmp_path)
+    script = Path(__file__).parent.parent / "main.py"
+    with (
+        patch("nexus.app.NexusApp.run", return_value=launch),
+        patch("nexus.logger.configure_logging"),
+        patch("nexus.services.executor.exec_tool") as mock_exec,
+    ):
+        runpy.run_path(str(script), run_name="__main__")
+
+    mock_exec.assert_called_once_with(launch)
+
+
+def test_launch_in_terminal_detached(tmp_path: Path) -> None:
+    import subprocess
+
+    with (
+        patch("nexus.config.get_preferred_terminal", return_value="/usr/bin/kitty"),
+        patch("subprocess.Popen") as mock_popen,
+    ):
+        assert executor.launch_in_terminal("nvim {project}", tmp_path) is True
+
+    args, kwargs = mock_popen.call_args
+    assert args[0] == ["/usr/bin/kitty", "nvim", str(tmp_path)]
+    assert kwargs["cwd"] == tmp_path
+    assert kwargs["start_new_session"] is True
+    assert kwargs["stdin"] == subprocess.DEVNULL
+    mock_popen.return_value.wait.assert_not_called()
+
+
+def test_launch_in_terminal_without_terminal() -> None:
+    with (
+        patch("nexus.config.get_preferred_terminal", return_value=None),
+        patch("subprocess.Popen") as mock_popen,
+    ):
+        assert executor.launch_in_terminal("htop") is False
+    mock_popen.assert_not_called()
+
+
+def test_terminal_command_arguments() -> None:
+    assert executor.terminal_command("/usr/bin/gnome-terminal", ["htop"]) == [
+        "/usr/bin/gnome-terminal",
+        "--",
+        "htop",
+    ]
+    assert executor.terminal_command("/opt/bin/alacritty", ["htop", "-d", "5"]) == [
+        "/opt/bin/alacritty",
+        "-e",
+        "htop",
+        "-d",
+        "5",
+    ]
@@ -1,8 +1,9 @@
 """Tests for the StateManager module."""
 
 import json
-from unittest.mock import patch
 from pathlib import Path
+from unittest.mock import patch
+
 from nexus.state import StateManager
 
 
@@ -50,22 +51,65 @@ def test_state_manager_add_recent(tmp_path: Path) -> None:
         assert manager.get_recents()[0] == "/path/x/14"
 
 
+def test_state_manager_history(tmp_path: Path) -> None:
+    test_state_file = tmp_path / "state.json"
+
+    with patch("nexus.state.STATE_FILE", test_state_file):
+        manager = StateManager()
+
+        with patch("nexus.state.time.time", return_value=100.0):
+            manager.add_recent("/path/1")
+            manager.add_recent("/path/2")
+        with patch("nexus.state.time.time", return_value=200.0):
+            manager.add_recent("/path/1")
+
+        assert manager.get_history() == {
+            "/path/2": (1, 100.0),
+            "/path/1": (2, 200.0),
+        }
+        # Persisted and reloaded as JSON lists.
+        assert StateManager().get_history() == manager.get_history()
+
+        with patch("nexus.state.MAX_HISTORY", 2):
+            manager.add_recent("/path/3")
+        assert list(manager.get_history()) == ["/path/1", "/path/3"]
+
+
+def test_state_manager_tool_history(tmp_path: Path) -> None:
+    test_state_file = tmp_path / "state.json"
+
+    with patch("nexus.state.STATE_FILE", test_state_file):
+        manager = StateManager()
+        version = manager.tool_history_version
+
+        with patch("nexus.state.time.time", return_value=100.0):
+            manager.add_tool_launch("Vim")
+            manager.add_tool_launch("Vim")
+        assert manager.get_tool_history() == {"Vim": (2, 100.0)}
+        assert manager.tool_history_version == version + 2
+        # Kept apart from the project history
+        assert manager.get_history() == {}
+        assert StateManager().get_tool_history() == manager.get_tool_history()
+
+
 def test_state_manager_save_failure(tmp_path: Path) -> None:
     test_state_file = tmp_path / "state.json"
 
     with patch("nexus.state.STATE_FILE", test_state_file):
         manager = StateManager()
 
-        with patch("pathlib.Path.mkdir", side_effect=PermissionError("denied")):
-            with patch("nexus.state.log.error") as mock_log_error:
-                manager.add_recent("/path/test")
+        with (
+            patch("pathlib.Path.mkdir", side_effect=PermissionError("denied")),
+            patch("nexus.state.log.error") as mock_log_error,
+        ):
+            manager.add_recent("/path/test")
 
-                # The state will be updated in memory
-                assert manager.get_recents() == ["/path/test"]
+            # The state will be updated in memory
+            assert manager.get_recents() == ["/path/test"]
 
-                # But we should see a log error
-                mock_log_error.assert_called_once()
-                assert mock_log_error.call_args[0][0] == "save_state_failed"
+            # But we should see a log error
+            mock_log_error.assert_called_once()
+            assert mock_log_error.call_args[0][0] == "save_state_failed"
 
 
 def test_state_manager_load_failure(tmp_path: Path) -> None:
@@ -75,9 +119,11 @@ def test_state_manager_load_failure(tmp_path: Path) -> None:
     with open(test_state_file, "w") as f:
         f.write("{invalid: json}")
 
-    with patch("nexus.state.STATE_FILE", test_state_file):
-        with patch("nexus.state.log.error") as mock_log_error:
-            manager = StateManager()
-            assert manager.get_recents() == []
-            mock_log_error.assert_called_once()
-            assert mock_log_error.call_args[0][0] == "load_state_failed"
+    with (
+        patch("nexus.state.STATE_FILE", test_state_file),
+        patch("nexus.state.log.error") as mock_log_error,
+    ):
+        manager = StateManager()
+        assert manager.get_recents() == []
+        mock_log_error.assert_called_once()
+        assert mock_log_error.call_args[0][0] == "load_state_failed"
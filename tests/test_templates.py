@@ -0,0 +1,105 @@
+"""Tests for compiled command templates."""
+
+import shlex
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+from nexus.models import Tool
+from nexus.services.templates import compile_template
+
+
+def test_paths_with_spaces_stay_one_argument(tmp_path: Path) -> None:
+    project = tmp_path / "my project"
+    project.mkdir()
+
+    template = compile_template("code --goto {project} --name={project_name}")
+    assert template.render(project) == [
+        "code",
+        "--goto",
+        str(project),
+        "--name=my project",
+    ]
+
+
+def test_substituted_values_are_not_substituted_again() -> None:
+    template = compile_template("grep {flags} {project}")
+    assert template.render(Path("/src/app"), "-e {project}") == [
+        "grep",
+        "-e",
+        "{project}",
+        "/src/app",
+    ]
+
+    embedded = compile_template("run --args={flags}")
+    assert embedded.render(None, "-a '{dir}' -b") == ["run", "--args=-a '{dir}' -b"]
+
+
+def test_file_dir_and_git_root(tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    (repo / ".git").mkdir(parents=True)
+    source = repo / "src" / "main.py"
+    source.parent.mkdir()
+    source.write_text("")
+
+    template = compile_template("edit {file} --cwd {dir} --root {git_root}")
+    assert template.render(source) == [
+        "edit",
+        str(source),
+        "--cwd",
+        str(source.parent),
+        "--root",
+        str(repo),
+    ]
+    # A directory has no {file} and an argument without a value is left out.
+    assert template.render(tmp_path) == ["edit", "--cwd", str(tmp_path), "--root"]
+
+
+def test_environment_variables() -> None:
+    template = compile_template("ssh {env:NEXUS_HOST} --user={env:NEXUS_USER}")
+    env = {"NEXUS_HOST": "build-01"}
+    assert template.render(env=env) == ["ssh", "build-01", "--user="]
+
+
+def test_unknown_braces_are_kept() -> None:
+    template = compile_template("awk '{print $1}' {project}")
+    assert template.render(Path("/data")) == ["awk", "{print $1}", "/data"]
+
+
+def test_tool_template_is_compiled_once() -> None:
+    tool = Tool(
+        label="Editor",
+        category="DEV",
+        description="Editor",
+        command="nvim {project} {flags}",
+        requires_project=True,
+    )
+    assert tool.template is tool.template
+    with patch("shlex.split") as mock_split:
+        tool.template.render(Path("/src"), "-R")
+        tool.template.render(Path("/src"))
+    # Only the flags are split at launch; the command is never parsed again.
+    assert mock_split.call_count == 1
+
+
+def test_values_in_shell_scripts_are_quoted(tmp_path: Path) -> None:
+    project = tmp_path / "a b; rm -rf ~"
+    project.mkdir()
+
+    template = compile_template(
+        "sh -c 'cd {project} && ls {flags}' --name={project_name}"
+    )
+    argv = template.render(project, "-la")
+    assert argv == [
+        "sh",
+        "-c",
+        f"cd {shlex.quote(str(project))} && ls -la",
+        "--name=a b; rm -rf ~",
+    ]
+    # The shell sees the path as one word and runs nothing from it.
+    script = compile_template("sh -c 'cd {project} && pwd'").render(project)
+    result = subprocess.run(script, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == str(project)
+
+    assert compile_template("/bin/bash --norc -ec 'echo {dir}'").scripts == {3}
+    assert compile_template("python -c 'print({project})'").scripts == frozenset()
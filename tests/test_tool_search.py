@@ -0,0 +1,92 @@
+"""Tests for the tool search index."""
+
+import time
+from unittest.mock import patch
+
+from nexus.models import Tool
+from nexus.registry import ToolRegistry
+from nexus.services.tool_search import ToolSearchIndex
+
+
+def make_tool(label: str, description: str, category: str = "DEV") -> Tool:
+    return Tool(
+        label=label,
+        category=category,
+        description=description,
+        command=label.lower(),
+        requires_project=False,
+    )
+
+
+TOOLS = [
+    make_tool("Lazydocker", "Docker TUI", "UTIL"),
+    make_tool("Neovim", "Hyperextensible editor"),
+    make_tool("Docs", "Open the manual"),
+    make_tool("Top", "Process viewer", "UTIL"),
+]
+
+
+def test_search_matches_label_or_description_in_order() -> None:
+    index = ToolSearchIndex(TOOLS)
+
+    assert [t.label for t in index.search("DOC")] == ["Lazydocker", "Docs"]
+    assert [t.label for t in index.search("docker")] == ["Lazydocker"]
+    assert [t.label for t in index.search("o")] == [
+        "Lazydocker",
+        "Neovim",
+        "Docs",
+        "Top",
+    ]
+    assert [t.label for t in index.search("process view")] == ["Top"]
+    assert index.search("") == TOOLS
+    assert index.search("xyz") == []
+    # All trigrams present, but not as one substring
+    assert index.search("docs tui") == []
+    # Never matches across the label and description
+    assert index.search("topprocess") == []
+
+
+def test_registry_search_filters_category() -> None:
+    registry = ToolRegistry(TOOLS)
+
+    assert registry.search_index is registry.search_index
+    assert [t.label for t in registry.search("UTIL", "o")] == ["Lazydocker", "Top"]
+    assert [t.label for t in registry.search("DEV", "")] == ["Neovim", "Docs"]
+    assert registry.search("MISSING", "doc") == []
+
+
+def test_registry_warm_builds_index_and_templates() -> None:
+    tools = [make_tool(f"Warm {i}", "prewarmed") for i in range(3)]
+    registry = ToolRegistry(tools)
+
+    with patch("nexus.registry.ToolSearchIndex", wraps=ToolSearchIndex) as build:
+        registry.warm()
+        registry.search("ALL", "warm")
+    assert build.call_count == 1
+    assert all("template" in vars(tool) for tool in tools)
+
+
+def test_search_large_catalog_is_fast() -> None:
+    tools = [
+        make_tool(f"tool-{i}", f"runs task {i} for project {i % 97}")
+        for i in range(20_000)
+    ]
+    index = ToolSearchIndex(tools)
+
+    start = time.perf_counter()
+    for query in ("tool-1234", "task 19999", "project 96", "nothing"):
+        index.search(query)
+    elapsed = time.perf_counter() - start
+
+    assert [t.label for t in index.search("tool-19999")] == ["tool-19999"]
+    assert elapsed < 0.5
+
+
+def test_search_refines_previous_query() -> None:
+    index = ToolSearchIndex(TOOLS)
+    assert [t.label for t in index.search("d")] == ["Lazydocker", "Neovim", "Docs"]
+
+    with patch.object(index, "_candidates", side_effect=AssertionError):
+        assert [t.label for t in index.search("do")] == ["Lazydocker", "Docs"]
+        assert [t.label for t in index.search("dock")] == ["Lazydocker"]
+        assert [t.label for t in index.search("Do")] == ["Lazydocker", "Docs"]
@@ -3,9 +3,13 @@
 This module provides asynchronous tests for the Textual user interface.
 """
 
+import threading
+from pathlib import Path
+from unittest.mock import PropertyMock, patch
+
 import pytest
-from unittest.mock import patch
 from textual.widgets import ListView
+
 from nexus.app import NexusApp
 from nexus.screens.help import HelpScreen
 from nexus.screens.tool_selector import ToolSelector
@@ -35,6 +39,16 @@ async def test_app_startup_and_help() -> None:
         assert isinstance(app.screen, ToolSelector)
 
 
+@pytest.mark.asyncio
+async def test_app_prewarms_project_scan() -> None:
+    """Verifies that the project scan starts once the first frame is drawn."""
+    app = NexusApp()
+    with patch("nexus.services.project_scan.ProjectScan.start") as mock_start:
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            mock_start.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_navigation() -> None:
     """Verifies keyboard navigation within the tool selector.
@@ -107,8 +121,8 @@ async def test_flag_picker_flow() -> None:
     Asserts that the FlagPicker modal appears for supported tools and
     that input is correctly passed to the executor.
     """
-    from nexus.screens.flag_picker import FlagPicker
     from nexus.models import Tool
+    from nexus.screens.flag_picker import FlagPicker
 
     app = NexusApp()
     tool = Tool(
@@ -125,6 +139,7 @@ async def test_flag_picker_flow() -> None:
         with (
             patch.object(app, "suspend"),
             patch("nexus.services.executor.launch_tool") as mock_launch,
+            patch("nexus.state.StateManager.add_tool_launch") as mock_record,
         ):
             # Manually trigger flow for a tool with flags
             screen = app.screen
@@ -141,8 +156,9 @@ async def test_flag_picker_flow() -> None:
 
             # Verify executor was called with flags
             mock_launch.assert_called_once_with(
-                "echo {flags}", project_path=None, flags="-v --dry-run"
+                tool.template, project_path=None, flags="-v --dry-run"
             )
+            mock_record.assert_called_once_with("Test Tool")
 
             # The screen should have popped back to ToolSelector
             assert isinstance(app.screen, ToolSelector)
@@ -155,9 +171,10 @@ async def test_theme_picker_flow() -> None:
     Asserts that the ThemePicker modal appears and that selecting a theme
     updates the application's theme reactive property.
     """
-    from nexus.screens.theme_picker import ThemePicker
     from textual.widgets import OptionList
 
+    from nexus.screens.theme_picker import ThemePicker
+
     app = NexusApp()
     async with app.run_test() as pilot:
         # Open theme picker
@@ -187,3 +204,427 @@ async def test_theme_picker_flow() -> None:
         # Verify theme was updated in App
         assert app.theme == "tokyo-night-storm"
         assert isinstance(app.screen, ToolSelector)
+
+
+@pytest.mark.asyncio
+async def test_config_reload_patches_tool_list() -> None:
+    """Verifies that a configuration reload patches the visible tool list.
+
+    Asserts that changed tools are updated in place and that the
+    highlighted tool survives the reload.
+    """
+    from textual.widgets import OptionList
+
+    from nexus.container import get_container
+    from nexus.models import Tool
+    from nexus.registry import RegistryDiff, ToolRegistry
+
+    def make_tool(label: str, description: str) -> Tool:
+        return Tool(
+            label=label,
+            category="UTIL",
+            description=description,
+            command=label.lower(),
+            requires_project=False,
+        )
+
+    tools = [make_tool(f"Tool {i}", "original") for i in range(5)]
+    app = NexusApp()
+    config_manager = get_container().config_manager
+
+    with patch.object(
+        config_manager, "get_registry", return_value=ToolRegistry(tools, version=1)
+    ) as get_registry:
+        async with app.run_test() as pilot:
+            await pilot.pause(0.2)
+            tool_list = app.screen.query_one("#tool-list", OptionList)
+            assert tool_list.option_count == 5
+            tool_list.highlighted = 3
+
+            updated = [*tools[:2], make_tool("Tool 2", "updated"), *tools[3:]]
+            updated.append(make_tool("Tool 5", "new"))
+            new_registry = ToolRegistry(updated, version=2)
+            get_registry.return_value = new_registry
+
+            diff = RegistryDiff.between(ToolRegistry(tools), new_registry)
+            threads: list[threading.Thread] = []
+
+            def reload(paths: object) -> RegistryDiff:
+                threads.append(threading.current_thread())
+                return diff
+
+            with patch.object(config_manager, "reload", side_effect=reload):
+                await app.reload_config().wait()
+            await pilot.pause()
+
+            # The files are parsed off the event loop.
+            assert threads and threads[0] is not threading.main_thread()
+
+            assert tool_list.option_count == 6
+            assert tool_list.highlighted == 3
+            assert "updated" in str(tool_list.get_option("Tool 2").prompt)
+
+
+@pytest.mark.asyncio
+async def test_tool_list_reuses_rendered_options() -> None:
+    """Verifies that filtering reuses the cached option of every tool.
+
+    Asserts that an unchanged result leaves the rows alone and that a
+    narrowed result is shown with the options built for the first query.
+    """
+    from textual.widgets import OptionList
+
+    from nexus.container import get_container
+    from nexus.models import Tool
+    from nexus.registry import ToolRegistry
+    from nexus.widgets.tool_browser import ToolBrowser
+
+    tools = [
+        Tool(
+            label=f"Tool {i}",
+            category="UTIL",
+            description="docker" if i % 2 else "other",
+            command="true",
+            requires_project=False,
+        )
+        for i in range(6)
+    ]
+    app = NexusApp()
+    config_manager = get_container().config_manager
+
+    with patch.object(
+        config_manager, "get_registry", return_value=ToolRegistry(tools, version=1)
+    ):
+        async with app.run_test() as pilot:
+            await pilot.pause(0.2)
+            browser = app.screen.query_one(ToolBrowser)
+            tool_list = app.screen.query_one("#tool-list", OptionList)
+            first = {o.id: o for o in tool_list.options}
+            assert len(first) == 6
+
+            browser.search_query = "doc"
+            await pilot.pause()
+            assert [o.id for o in tool_list.options] == ["Tool 1", "Tool 3", "Tool 5"]
+            assert all(o is first[o.id] for o in tool_list.options)
+
+            with patch.object(tool_list, "set_options") as set_options:
+                browser.search_query = "dock"
+                await pilot.pause()
+                set_options.assert_not_called()
+
+            browser.search_query = ""
+            await pilot.pause()
+            assert all(o is first[o.id] for o in tool_list.options)
+            assert tool_list.highlighted == 0
+
+            # Listing the same filter again keeps the cursor on its tool.
+            tool_list.highlighted = 4
+            await browser.populate_tools("ALL").wait()
+            assert tool_list.highlighted == 4
+
+            browser.search_query = "doc"
+            await pilot.pause()
+            assert tool_list.highlighted == 0
+
+
+@pytest.mark.asyncio
+async def test_all_category_loads_pending_shards(tmp_path: Path) -> None:
+    """Verifies that the ALL category lists shard tools without a search."""
+    from textual.widgets import OptionList
+
+    from nexus.config import ConfigManager
+    from nexus.container import Container
+
+    path = tmp_path / "tools.toml"
+    path.write_text(
+        '[[tool]]\nlabel = "Vim"\ncategory = "DEV"\ndescription = "Editor"\n'
+        'command = "vim"\nrequires_project = false\n'
+    )
+    (tmp_path / "tools.d").mkdir()
+    (tmp_path / "tools.d" / "ai.toml").write_text(
+        '[[tool]]\nlabel = "Chat"\ncategory = "AI"\ndescription = "Chat client"\n'
+        'command = "chat"\nrequires_project = false\n'
+    )
+    app = NexusApp()
+    with patch("nexus.config.CONFIG_PATHS", [path]):
+        manager = ConfigManager(use_snapshot=False)
+        assert manager.get_registry().pending_categories == {"AI"}
+        with patch.object(
+            Container,
+            "config_manager",
+            new_callable=PropertyMock,
+            return_value=manager,
+        ):
+            async with app.run_test() as pilot:
+                tool_list = app.screen.query_one("#tool-list", OptionList)
+                for _ in range(20):
+                    await pilot.pause(0.05)
+                    if len(tool_list.options) == 2:
+                        break
+                assert sorted(str(o.id) for o in tool_list.options) == ["Chat", "Vim"]
+                assert not manager.get_registry().pending_categories
+
+
+@pytest.mark.asyncio
+async def test_fuzzy_search_toggle() -> None:
+    """Verifies that the fuzzy search key switches the tool search mode.
+
+    Asserts that a misspelled query only matches once fuzzy search is on,
+    also while the search box has focus.
+    """
+    from textual.widgets import OptionList
+
+    from nexus.container import get_container
+    from nexus.models import Tool
+    from nexus.registry import ToolRegistry
+    from nexus.widgets.tool_browser import ToolBrowser
+
+    tools = [
+        Tool(
+            label=label,
+            category="DEV",
+            description="editor",
+            command="true",
+            requires_project=False,
+        )
+        for label in ("Neovim", "Helix")
+    ]
+    app = NexusApp()
+    config_manager = get_container().config_manager
+
+    with patch.object(
+        config_manager, "get_registry", return_value=ToolRegistry(tools, version=1)
+    ):
+        async with app.run_test() as pilot:
+            await pilot.pause(0.2)
+            tool_list = app.screen.query_one("#tool-list", OptionList)
+
+            await pilot.press(*"neovmi")
+            await pilot.pause()
+            assert tool_list.option_count == 0
+
+            await pilot.press("ctrl+f")
+            await pilot.pause()
+            assert app.screen.query_one(ToolBrowser).fuzzy
+            assert [o.id for o in tool_list.options] == ["Neovim"]
+
+
+@pytest.mark.asyncio
+async def test_fuzzy_search_key_is_configurable() -> None:
+    """Verifies that the fuzzy search key follows the keybinding settings.
+
+    Asserts that the configured key toggles fuzzy search and that screens
+    without a search box ignore it.
+    """
+    from nexus.container import get_container
+    from nexus.widgets.tool_browser import ToolBrowser
+
+    app = NexusApp()
+    config_manager = get_container().config_manager
+    bindings = {**config_manager.get_keybindings(), "fuzzy_search": "ctrl+g"}
+
+    with patch.object(config_manager, "get_keybindings", return_value=bindings):
+        async with app.run_test() as pilot:
+            await pilot.pause(0.2)
+            browser = app.screen.query_one(ToolBrowser)
+
+            await pilot.press("ctrl+f")
+            await pilot.pause()
+            assert not browser.fuzzy
+
+            await pilot.press("ctrl+g")
+            await pilot.pause()
+            assert browser.fuzzy
+
+            await pilot.press("f1")
+            await pilot.pause()
+            assert isinstance(app.screen, HelpScreen)
+            await pilot.press("ctrl+g")
+            await pilot.pause()
+            assert isinstance(app.screen, HelpScreen)
+            assert browser.fuzzy
+
+
+@pytest.mark.asyncio
+async def test_tools_sorted_by_launch_frecency() -> None:
+    """Verifies that the frecency sort lists frequently launched tools first.
+
+    Asserts that the quick launch order follows the launch history and that
+    tools never launched keep their configured order.
+    """
+    from nexus.container import get_container
+    from nexus.models import Tool
+    from nexus.registry import ToolRegistry
+    from nexus.widgets.tool_browser import ToolBrowser
+
+    tools = [
+        Tool(
+            label=f"Tool {i}",
+            category="UTIL",
+            description="tool",
+            command="true",
+            requires_project=False,
+        )
+        for i in range(4)
+    ]
+    container = get_container()
+    history = {"Tool 2": (50, 1e12), "Tool 3": (5, 1e12)}
+
+    with (
+        patch.object(
+            container.config_manager,
+            "get_registry",
+            return_value=ToolRegistry(tools, version=1),
+        ),
+        patch.object(
+            container.config_manager, "get_tool_sort", return_value="frecency"
+        ),
+        patch.object(container.state_manager, "get_tool_history", return_value=history),
+    ):
+        app = NexusApp()
+        async with app.run_test() as pilot:
+            await pilot.pause(0.2)
+            browser = app.screen.query_one(ToolBrowser)
+            labels = [browser.get_tool_at_index(i) for i in range(4)]
+            assert [t.label for t in labels if t] == [
+                "Tool 2",
+                "Tool 3",
+                "Tool 0",
+                "Tool 1",
+            ]
+
+
+@pytest.mark.asyncio
+async def test_background_tool_runs_as_job() -> None:
+    """Verifies that background tools stream into the jobs panel.
+
+    Asserts that the TUI is not suspended and that the job output is shown
+    in the jobs panel.
+    """
+    import sys
+
+    from textual.widgets import Log
+
+    from nexus.container import get_container
+    from nexus.models import Tool
+    from nexus.screens.jobs import JobsScreen
+
+    tool = Tool(
+        label="Build",
+        category="DEV",
+        description="Builds in the background",
+        command=f'"{sys.executable}" -c "print(\'built\')"',
+        requires_project=False,
+        mode="background",
+    )
+    app = NexusApp()
+    jobs = get_container().jobs
+
+    with (
+        patch("nexus.state.StateManager.add_tool_launch") as mock_add_launch,
+        patch.object(app, "suspend") as mock_suspend,
+    ):
+        async with app.run_test() as pilot:
+            assert isinstance(app.screen, ToolSelector)
+            app.screen.execute_tool_command(tool)
+            job = jobs.jobs[-1]
+            await jobs.wait(job.id)
+            await pilot.pause()
+
+            mock_suspend.assert_not_called()
+            mock_add_launch.assert_called_once_with("Build")
+            assert job.status == "succeeded"
+
+            await pilot.press("f2")
+            await pilot.pause()
+            assert isinstance(app.screen, JobsScreen)
+            log = app.screen.query_one("#job-output", Log)
+            assert list(log.lines) == ["built"]
+
+
+@pytest.mark.asyncio
+async def test_exit_on_launch_returns_tool_to_exec() -> None:
+    """Verifies that exit_on_launch tools end the app instead of suspending it.
+
+    Asserts that the app returns the rendered command and its working
+    directory, and that a tool can opt out of the global setting.
+    """
+    from pathlib import Path
+
+    from nexus.container import get_container
+    from nexus.models import Tool
+    from nexus.services.executor import Launch
+
+    tool = Tool(
+        label="Editor",
+        category="DEV",
+        description="Editor",
+        command="nvim {project}",
+        requires_project=True,
+        exit_on_launch=True,
+    )
+    project = Path(__file__).parent
+    app = NexusApp()
+    config_manager = get_container().config_manager
+
+    with (
+        patch("nexus.state.StateManager.add_tool_launch") as mock_add_launch,
+        patch.object(app, "suspend") as mock_suspend,
+    ):
+        async with app.run_test() as pilot:
+            assert isinstance(app.screen, ToolSelector)
+            app.screen.execute_tool_command(tool, project_path=project)
+            await pilot.pause()
+
+        mock_suspend.assert_not_called()
+        mock_add_launch.assert_called_once_with("Editor")
+        assert app.return_value == Launch(["nvim", str(project)], project)
+
+    # A tool can opt out of the global setting.
+    app = NexusApp()
+    opted_out = tool.model_copy(update={"exit_on_launch": False})
+    with (
+        patch.object(config_manager, "get_exit_on_launch", return_value=True),
+        patch("nexus.services.executor.launch_tool", return_value=True),
+        patch("nexus.state.StateManager.add_tool_launch"),
+        patch.object(app, "suspend") as mock_suspend,
+    ):
+        async with app.run_test() as pilot:
+            assert isinstance(app.screen, ToolSelector)
+            app.screen.execute_tool_command(opted_out, project_path=project)
+            await pilot.pause()
+            mock_suspend.assert_called_once()
+        assert app.return_value is None
+
+
+@pytest.mark.asyncio
+async def test_new_terminal_launch_keeps_app_running() -> None:
+    """Verifies that new_terminal tools do not suspend or exit the app."""
+    from nexus.models import Tool
+
+    tool = Tool(
+        label="Monitor",
+        category="UTIL",
+        description="System monitor",
+        command="htop",
+        requires_project=False,
+        launch_in="new_terminal",
+    )
+    app = NexusApp()
+    with (
+        patch(
+            "nexus.services.executor.launch_in_terminal", return_value=True
+        ) as mock_launch,
+        patch("nexus.state.StateManager.add_tool_launch") as mock_add_launch,
+        patch.object(app, "suspend") as mock_suspend,
+    ):
+        async with app.run_test() as pilot:
+            assert isinstance(app.screen, ToolSelector)
+            app.screen.execute_tool_command(tool)
+            app.screen.execute_tool_command(tool)
+            await pilot.pause()
+
+            assert mock_launch.call_count == 2
+            assert mock_add_launch.call_count == 2
+            mock_suspend.assert_not_called()
+            assert isinstance(app.screen, ToolSelector)